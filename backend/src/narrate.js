@@ -4,8 +4,11 @@
  * 1. Read the actual Manim scene .py file
  * 2. Ask Groq to write 6 narration segments as flowing professor speech
  * 3. Convert each segment to audio via ElevenLabs (voice auq43ws1oslv0tO4BDa7)
- * 4. Concatenate segments into one audio track
- * 5. Measure audio vs video duration — slow video, pad audio, or merge directly
+ * 4. Sync per section when the render left a <Class>.timeline.json manifest:
+ *    sections too short for their segment get their waits stretched
+ *    (manim/retime.py --fit), and each segment is padded to its section
+ * 5. Otherwise concatenate segments and merge off the total durations —
+ *    slow video, pad audio, or merge directly
  * 6. Output synced narrated MP4
  *
  * gTTS fallback is DISABLED. No other voice fallback. ElevenLabs only.
@@ -284,6 +287,96 @@ async function mergeAudioVideo(videoPath, audioPath, outputPath) {
   if (stderr) console.warn("[narrate] merge stderr:", stderr.trim().slice(0, 200));
 }
 
+// ── Per-section sync from the render's timeline manifest ──────────────────
+// The manifest (manim/manifest.py) lists each sN_* section's start/end.
+async function readSections(videoPath) {
+  try {
+    const sidecar = videoPath.replace(/\.mp4$/, ".timeline.json");
+    const data    = JSON.parse(await readFile(sidecar, "utf8"));
+    const sections = data.sections.filter(s => /^s\d+_/.test(s.name));
+    return sections.length ? { sections, duration: data.duration } : null;
+  } catch {
+    return null;
+  }
+}
+
+// Section i runs until section i+1 starts (the last one to the end of the video)
+function sectionSpans({ sections, duration }) {
+  return sections.map((s, i) => (i + 1 < sections.length ? sections[i + 1].start : duration) - s.start);
+}
+
+async function mergeBySection(videoPath, segmentPaths, outputPath) {
+  let manifest = await readSections(videoPath);
+  if (!manifest || manifest.sections.length !== segmentPaths.length) return false;
+
+  const audioDurs = [];
+  for (const p of segmentPaths) audioDurs.push(await getMediaDuration(p));
+  if (audioDurs.some(d => !d)) return false;
+
+  // Stretch the waits of sections the narration overruns
+  const spans = sectionSpans(manifest);
+  const fit = manifest.sections
+    .map((s, i) => (audioDurs[i] > spans[i] ? `${s.name}=${(audioDurs[i] + 0.5).toFixed(2)}` : null))
+    .filter(Boolean);
+  if (fit.length) {
+    const paced = path.join(NARR_DIR, `${path.basename(videoPath, ".mp4")}_paced.mp4`);
+    console.log(`[narrate] stretching ${fit.length} section(s): ${fit.join(", ")}`);
+    try {
+      await execAsync(
+        `python retime.py --movie "${videoPath}" --fit ${fit.join(",")} -o "${paced}" --ffmpeg "${FFMPEG_PATH}"`,
+        { cwd: MANIM_DIR, timeout: 300_000 }
+      );
+    } catch (err) {
+      console.warn("[narrate] retime failed:", err.message.slice(0, 200));
+      return false;
+    }
+    videoPath = paced;
+    manifest  = await readSections(paced);
+    if (!manifest) return false;
+  }
+
+  const lead   = Math.round(manifest.sections[0].start * 1000);
+  const padded = sectionSpans(manifest).map(d => d.toFixed(3));
+  console.log(`[narrate] per-section sync: ${manifest.sections.map((s, i) =>
+    `${s.name} ${audioDurs[i].toFixed(1)}/${Number(padded[i]).toFixed(1)}s`).join("  ")}`);
+
+  const pyScript = [
+    "import subprocess, sys, os",
+    `ffmpeg   = r'${FFMPEG_PATH.replace(/\\/g, "\\\\")}'`,
+    `video    = r'${videoPath.replace(/\\/g, "\\\\")}'`,
+    `segments = [${segmentPaths.map(p => `r'${p.replace(/\\/g, "\\\\")}'`).join(", ")}]`,
+    `spans    = [${padded.join(", ")}]`,
+    `lead_ms  = ${lead}`,
+    `output   = r'${outputPath.replace(/\\/g, "\\\\")}'`,
+    "# Pad each segment to its section, then join them into one track",
+    "parts = [f'[{i + 1}:a]apad=whole_dur={d}[a{i}]' for i, d in enumerate(spans)]",
+    "chain = ''.join(f'[a{i}]' for i in range(len(spans)))",
+    "graph = ';'.join(parts) + f';{chain}concat=n={len(spans)}:v=0:a=1[cat]'",
+    "graph += f';[cat]adelay={lead_ms}:all=1[aout]' if lead_ms else ';[cat]anull[aout]'",
+    "cmd = [ffmpeg, '-y', '-i', video]",
+    "for s in segments: cmd += ['-i', s]",
+    "cmd += ['-filter_complex', graph, '-map', '0:v', '-map', '[aout]',",
+    "        '-c:v', 'copy', '-c:a', 'aac', '-shortest', output]",
+    "result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)",
+    "print('merge rc:', result.returncode)",
+    "if result.returncode != 0:",
+    "    print('stderr:', result.stderr[-600:])",
+    "    sys.exit(1)",
+    "print('Merge OK, size:', os.path.getsize(output))",
+  ].join("\n");
+
+  const tmpPy = path.join(NARR_DIR, "_merge_sections_tmp.py");
+  await writeFile(tmpPy, pyScript, "utf8");
+  try {
+    const { stdout } = await execAsync(`python "${tmpPy}"`, { timeout: 600_000 });
+    if (stdout) console.log("[narrate] merge:", stdout.trim());
+    return true;
+  } catch (err) {
+    console.warn("[narrate] per-section merge failed:", err.message.slice(0, 200));
+    return false;
+  }
+}
+
 // ── Clean up temporary segment files ─────────────────────────────────────
 async function cleanSegments(paths) {
   for (const p of paths) {
@@ -297,15 +390,16 @@ async function cleanSegments(paths) {
 
 // ── Main export ───────────────────────────────────────────────────────────
 /**
- * narrateVideo(videoAbsPath, topic, groq)
+ * narrateVideo(videoAbsPath, topic, groq, name)
  * Generates professor-style 6-segment narration, syncs audio to video.
+ * Writes <name>_narrated.mp4 (name defaults to the video's base name).
  * Returns the absolute path to the narrated MP4.
  * ElevenLabs only — no gTTS, no other fallback.
  */
-export async function narrateVideo(videoAbsPath, topic, groq) {
+export async function narrateVideo(videoAbsPath, topic, groq, name = null) {
   await mkdir(NARR_DIR, { recursive: true });
 
-  const baseName      = path.basename(videoAbsPath, ".mp4");
+  const baseName      = name ?? path.basename(videoAbsPath, ".mp4");
   const narrPath      = path.join(NARR_DIR, `${baseName}_narrated.mp4`);
   const combinedAudio = path.join(NARR_DIR, `${baseName}_audio.mp3`);
 
@@ -358,7 +452,15 @@ export async function narrateVideo(videoAbsPath, topic, groq) {
     throw new Error("All narration segments were empty");
   }
 
-  // 4. Concatenate segments
+  // 4. Per-section sync when the render has a timeline manifest
+  console.log("[narrate] syncing and merging...");
+  if (await mergeBySection(videoAbsPath, segmentPaths, narrPath)) {
+    console.log(`[narrate] done → ${narrPath}`);
+    await cleanSegments(segmentPaths);
+    return narrPath;
+  }
+
+  // 5. Fallback: concatenate segments, sync-aware merge off total durations
   console.log(`[narrate] concatenating ${segmentPaths.length} segments...`);
   if (segmentPaths.length === 1) {
     const buf = await readFile(segmentPaths[0]);
@@ -367,8 +469,6 @@ export async function narrateVideo(videoAbsPath, topic, groq) {
     await concatAudioSegments(segmentPaths, combinedAudio);
   }
 
-  // 5. Sync-aware merge
-  console.log("[narrate] syncing and merging...");
   await mergeAudioVideo(videoAbsPath, combinedAudio, narrPath);
   console.log(`[narrate] done → ${narrPath}`);
 
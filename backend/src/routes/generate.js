@@ -14,6 +14,7 @@
 
 import { Router }         from "express";
 import { exec }           from "child_process";
+import net                from "net";
 import { writeFile, readFile, access } from "fs/promises";
 import path               from "path";
 import { fileURLToPath }  from "url";
@@ -28,6 +29,12 @@ const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const MANIM_DIR = path.resolve(__dirname, "../../../manim");
 const NARR_DIR  = path.join(MANIM_DIR, "output", "narrated");
 
+// Warm render daemon (manim/render_daemon.py); cold CLI render if it isn't up
+const RENDER_DAEMON_PORT = Number(process.env.RENDER_DAEMON_PORT || 8765);
+
+// Generated scenes shorter than this (dry-run seconds) are rejected before rendering
+const MIN_GENERATED_SECONDS = 120;
+
 export const generateRoute = Router();
 
 // ── Groq client ────────────────────────────────────────────────────────────
@@ -266,31 +273,118 @@ function autoFixCode(code) {
   return fixed;
 }
 
-// ── Render helper ──────────────────────────────────────────────────────────
+// ── Render daemon client ───────────────────────────────────────────────────
+// One JSON line out, one JSON line back. Rejects with code ECONNREFUSED when
+// no daemon is listening, so callers can fall back to a cold render.
+function daemonRequest(job, timeoutMs) {
+  return new Promise((resolve, reject) => {
+    const sock = net.connect({ host: "127.0.0.1", port: RENDER_DAEMON_PORT });
+    let buf = "";
+    sock.setEncoding("utf8");
+    sock.setTimeout(timeoutMs, () => {
+      sock.destroy();
+      reject(new Error(`render daemon timed out after ${timeoutMs} ms`));
+    });
+    sock.on("connect", () => sock.write(JSON.stringify(job) + "\n"));
+    sock.on("data", chunk => {
+      buf += chunk;
+      const nl = buf.indexOf("\n");
+      if (nl === -1) return;
+      sock.end();
+      try { resolve(JSON.parse(buf.slice(0, nl))); } catch (e) { reject(e); }
+    });
+    sock.on("error", reject);
+  });
+}
+
+// ── Render helpers ─────────────────────────────────────────────────────────
+// Both go through manim/render_cache.py: a scene whose source, helper
+// modules (la_utils), manim version, quality and encoding are unchanged is
+// never re-rendered, and an edited one is never served stale.  Each returns
+// { path, key }: path relative under /videos/, key the render's cache key.
+
+// Cache only — never renders; null when the scene needs a render.  Videos
+// rendered before the cache existed are not served until imported under
+// their key (`python render_cache.py seed -qm --freeze-waits`).
+async function cachedScene(sceneFile, className) {
+  try {
+    const reply = await daemonRequest(
+      { op: "lookup", file: sceneFile, cls: className, quality: "m", fps: 30, freeze_waits: true }, 30_000,
+    );
+    if (!reply.ok) throw new Error(reply.error);
+    return reply.path ? { path: reply.path, key: reply.key } : null;
+  } catch (err) {
+    if (err.code !== "ECONNREFUSED") throw err;
+  }
+  try {
+    const { stdout } = await execAsync(
+      `python render_cache.py lookup "${sceneFile}" ${className} -qm --fps 30 --freeze-waits`,
+      { cwd: MANIM_DIR, timeout: 30_000 },
+    );
+    const [videoPath, key] = stdout.trim().split(/\s+/);
+    return { path: videoPath, key };
+  } catch (err) {
+    if (err.code === 1) return null;  // miss
+    throw err;
+  }
+}
+
 async function renderScene(sceneFile, className) {
-  const cmd = [
-    "python -m manim render",
-    `"${path.join(MANIM_DIR, "scenes", sceneFile)}"`,
-    className,
-    "--format mp4 -qm --fps 30",
-    `--media_dir "${path.join(MANIM_DIR, "output")}"`,
-  ].join(" ");
-
-  await execAsync(cmd, { timeout: 150_000 });
-
-  // Manim output: output/videos/<scene_name_no_ext>/<quality>/<ClassName>.mp4
-  const base = sceneFile.replace(/\.py$/, "");
-  return `/${base}/720p30/${className}.mp4`;  // relative under /videos/
+  // 1. Warm daemon — cache lookup, then render on a miss (static waits encoded
+  //    as one held frame, see manim/freeze_frames.py)
+  try {
+    const reply = await daemonRequest(
+      { file: sceneFile, cls: className, quality: "m", fps: 30, freeze_waits: true }, 150_000,
+    );
+    if (!reply.ok) throw new Error(reply.error);
+    console.log(`[render daemon] ${className} cached=${reply.cached} ${JSON.stringify(reply.timings)}`);
+    return { path: reply.path, key: reply.key };
+  } catch (err) {
+    if (err.code !== "ECONNREFUSED") throw err;
+  }
+
+  // 2. Cold render in a fresh interpreter — same cache, and it also writes
+  //    the <Class>.timeline.json section manifest next to the MP4
+  const { stdout } = await execAsync(
+    `python render_cache.py render "${sceneFile}" ${className} -qm --fps 30 --freeze-waits`,
+    { cwd: MANIM_DIR, timeout: 150_000 },
+  );
+  const [videoPath, key] = stdout.trim().split("\n").pop().split(/\s+/);
+  return { path: videoPath, key };
 }
 
-// ── Check for existing rendered video (720p30 first, then 480p15) ──────────
-async function getExistingVideoPath(file, cls) {
-  const base = file.replace(/\.py$/, "");
-  for (const quality of ["720p30", "480p15"]) {
-    const abs = path.join(MANIM_DIR, "output", "videos", base, quality, `${cls}.mp4`);
-    try { await access(abs); return `/${base}/${quality}/${cls}.mp4`; } catch { /* try next */ }
+// Narrated videos are named after the render they were made from, so an
+// edited scene is narrated again instead of serving the old voiceover
+function narrationName(cls, key) {
+  return `${cls}_${key.slice(0, 16)}`;
+}
+
+// ── Section chapters from the render's timeline manifest ───────────────────
+async function getChapters(videoPath) {
+  try {
+    const manifest = JSON.parse(await readFile(absVideoPath(videoPath).replace(/\.mp4$/, ".timeline.json"), "utf8"));
+    return manifest.sections
+      .filter(s => /^s\d+_/.test(s.name))
+      .map(({ name, start, end }) => ({ name, start, end }));
+  } catch {
+    return null;  // rendered before manifests existed
   }
-  return null; // not on disk — needs render
+}
+
+// ── Dry-run timeline (manim/timeline.py) — duration without rendering ──────
+async function sceneTimeline(sceneFile, className) {
+  try {
+    const reply = await daemonRequest({ op: "timeline", file: sceneFile, cls: className, fps: 30 }, 60_000);
+    if (!reply.ok) throw new Error(reply.error);
+    return reply.timeline;
+  } catch (err) {
+    if (err.code !== "ECONNREFUSED") throw err;
+  }
+  const { stdout } = await execAsync(
+    `python timeline.py "${sceneFile}" ${className} --fps 30`,
+    { cwd: MANIM_DIR, timeout: 60_000, maxBuffer: 16 * 1024 * 1024 },
+  );
+  return JSON.parse(stdout);
 }
 
 // ── Absolute video path (for narration) ────────────────────────────────────
@@ -365,23 +459,22 @@ generateRoute.post("/", async (req, res) => {
   if (KNOWN.has(topic)) {
     const { file, cls } = KNOWN.get(topic);
     try {
-      // Check disk cache and fetch explanation in parallel — zero re-render if cached
-      const [existingPath, explanation] = await Promise.all([
-        getExistingVideoPath(file, cls),
+      // Render cache lookup and explanation in parallel — zero re-render if cached
+      const [video, explanation] = await Promise.all([
+        cachedScene(file, cls).then(hit => hit ?? renderScene(file, cls)),
         getExplanation(raw, angle),
       ]);
-
-      // Use cached video; only render if somehow missing from disk
-      const videoPath = existingPath ?? await renderScene(file, cls);
+      const videoPath = video.path;
       const silentUrl = `/videos${videoPath}`;
 
       // Return narrated URL if already cached; otherwise start narration in background
+      const narrName = narrationName(cls, video.key);
       let narratedUrl = null;
       try {
-        await access(path.join(NARR_DIR, `${cls}_narrated.mp4`));
-        narratedUrl = `/narrated/${cls}_narrated.mp4`;
+        await access(path.join(NARR_DIR, `${narrName}_narrated.mp4`));
+        narratedUrl = `/narrated/${narrName}_narrated.mp4`;
       } catch {
-        narrateVideo(absVideoPath(videoPath), raw, groq)
+        narrateVideo(absVideoPath(videoPath), raw, groq, narrName)
           .then(p => console.log("[narrated]", path.basename(p)))
           .catch(e => console.warn("[narration skipped]", e.message));
       }
@@ -393,6 +486,7 @@ generateRoute.post("/", async (req, res) => {
         topic:          raw,
         displayTitle,
         angle:          angle || null,
+        chapters:       await getChapters(videoPath),
       });
     } catch (err) {
       console.error("[known-topic render]", err.message);
@@ -440,13 +534,35 @@ generateRoute.post("/", async (req, res) => {
   const genPath    = path.join(MANIM_DIR, "scenes", genFile);
   await writeFile(genPath, code, "utf8");
 
+  // Dry run — catches crashing and too-short scenes before paying for a render
+  let timeline;
+  try {
+    timeline = await sceneTimeline(genFile, "GeneratedScene");
+  } catch (err) {
+    console.warn("[dry run fail]", err.message);
+    return res.status(422).json({
+      error: `Could not generate a video for "${raw}"`,
+      detail: `generated scene failed its dry run: ${err.message}`,
+      hint: `Try one of these pre-built topics: derivatives, integrals, eigenvalues, gradient descent, neural networks, limits, chain rule, determinants, linear transformations`,
+    });
+  }
+  console.log(`[dry run] ${genFile} ${timeline.duration}s, ${timeline.frames} frames (${timeline.cpu_ms} ms CPU)`);
+  if (timeline.duration < MIN_GENERATED_SECONDS) {
+    return res.status(422).json({
+      error: `Could not generate a video for "${raw}"`,
+      detail: `generated scene is only ${Math.round(timeline.duration)}s long (minimum ${MIN_GENERATED_SECONDS}s)`,
+      hint: `Try again, or pick a pre-built topic: derivatives, integrals, eigenvalues, gradient descent, neural networks, limits, chain rule, determinants, linear transformations`,
+    });
+  }
+
   // Render
   try {
-    const videoPath = await renderScene(genFile, "GeneratedScene");
+    const video     = await renderScene(genFile, "GeneratedScene");
+    const videoPath = video.path;
     const silentUrl = `/videos${videoPath}`;
 
     // Start narration in background — don't block the response
-    narrateVideo(absVideoPath(videoPath), raw, groq)
+    narrateVideo(absVideoPath(videoPath), raw, groq, narrationName("GeneratedScene", video.key))
       .then(p => console.log("[narrated]", path.basename(p)))
       .catch(e => console.warn("[narration skipped]", e.message));
 
@@ -457,6 +573,7 @@ generateRoute.post("/", async (req, res) => {
       topic:            raw,
       displayTitle,
       angle:            angle || null,
+      chapters:         await getChapters(videoPath),
     });
   } catch (err) {
     console.error("[groq render fail]", err.message);
@@ -0,0 +1,164 @@
+"""
+Batch pre-render every scene in manim/scenes into the render cache.
+
+Discovers each Scene subclass by AST (scene_runner.scene_classes, no manim
+import), drops the ones render_cache already holds, dry-runs the rest
+(timeline.py) to learn their length and renders them longest-first across
+N worker processes, each with manim imported once.  Longest-first keeps
+the slowest scenes from starting last and leaving the other workers idle.
+
+Every estimate and result is appended to output/cache/batch.jsonl.  An
+interrupted batch is simply run again: finished scenes are cache hits,
+estimates are read back from the journal, and failed scenes are retried
+(unless --skip-failed).
+
+Run: python batch.py                      (every scene, -qm --fps 30, one worker per CPU)
+     python batch.py --jobs 4 'la_*' 'ml_*'
+     python batch.py --dry-run            (list what would render, longest first)
+"""
+import argparse
+import fnmatch
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from render_cache import CACHE_DIR, cache_key, cached_render, lookup
+from scene_runner import QUALITY, SCENES_DIR, render_scene, scene_classes
+
+JOURNAL = os.path.join(CACHE_DIR, "batch.jsonl")
+
+
+# ── Discovery ────────────────────────────────────────────────────────────────
+def discover(patterns=()):
+    """[(file, cls)] for every scene module matching *patterns* (all by default)."""
+    jobs = []
+    for name in sorted(os.listdir(SCENES_DIR)):
+        if not name.endswith(".py") or name.startswith("_") or name.endswith("_utils.py"):
+            continue  # generators and shared helpers (la_utils.SixSectionScene is only a base)
+        if patterns and not any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(name[:-3], p) for p in patterns):
+            continue
+        jobs += [(name, cls) for cls in scene_classes(name)]
+    return jobs
+
+
+# ── Journal ──────────────────────────────────────────────────────────────────
+def read_journal():
+    """{key: last record} from earlier batches (missing or torn lines ignored)."""
+    records = {}
+    try:
+        with open(JOURNAL, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records[rec["key"]] = {**records.get(rec["key"], {}), **rec}
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def append_journal(rec):
+    os.makedirs(os.path.dirname(JOURNAL), exist_ok=True)
+    with open(JOURNAL, "a", encoding="utf-8") as f:
+        f.write(json.dumps(rec) + "\n")
+        f.flush()
+
+
+# ── Workers ──────────────────────────────────────────────────────────────────
+def estimate(scene_file, cls_name, fps):
+    """Dry-run length in seconds, or None if the scene does not construct."""
+    from timeline import timeline
+    try:
+        return timeline(scene_file, cls_name, fps)["duration"]
+    except Exception:
+        return None
+
+
+def render_job(scene_file, cls_name, quality, fps, freeze_waits):
+    """Render one scene through the cache. Returns (cached, seconds, error)."""
+    t0 = time.perf_counter()
+    try:
+        out = cached_render(scene_file, cls_name, quality, fps,
+                            lambda: render_scene(scene_file, cls_name, quality, fps, freeze_waits=freeze_waits),
+                            freeze_waits=freeze_waits)
+        return out["cached"], round(time.perf_counter() - t0, 1), None
+    except Exception as e:
+        return False, round(time.perf_counter() - t0, 1), f"{type(e).__name__}: {e}"
+
+
+# ── Batch ────────────────────────────────────────────────────────────────────
+def plan(patterns, quality, fps, jobs, skip_failed=False, freeze_waits=True):
+    """Scenes still to render as [{"file", "cls", "key", "estimate"}], longest first."""
+    journal = read_journal()
+    todo = []
+    for scene_file, cls_name in discover(patterns):
+        key = cache_key(scene_file, cls_name, quality, fps, freeze_waits)
+        if lookup(key) or (skip_failed and journal.get(key, {}).get("status") == "failed"):
+            continue
+        todo.append({"file": scene_file, "cls": cls_name, "key": key,
+                     "estimate": journal.get(key, {}).get("estimate")})
+
+    unknown = [t for t in todo if t["estimate"] is None]
+    if unknown:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(estimate, t["file"], t["cls"], fps): t for t in unknown}
+            for fut in as_completed(futures):
+                t = futures[fut]
+                t["estimate"] = fut.result()
+                if t["estimate"] is not None:
+                    append_journal({"key": t["key"], "file": t["file"], "cls": t["cls"], "estimate": t["estimate"]})
+    # Scenes that failed the dry run go last; they will most likely fail again
+    return sorted(todo, key=lambda t: -(t["estimate"] or 0.0))
+
+
+def run_batch(todo, quality, fps, jobs, freeze_waits=True):
+    """Render *todo* across *jobs* processes; yields one journal record per scene."""
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(render_job, t["file"], t["cls"], quality, fps, freeze_waits): t for t in todo}
+        for fut in as_completed(futures):
+            t = futures[fut]
+            cached, seconds, error = fut.result()
+            rec = {"key": t["key"], "file": t["file"], "cls": t["cls"], "quality": quality, "fps": fps,
+                   "status": "failed" if error else "done", "cached": cached, "seconds": seconds,
+                   "error": error, "at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            append_journal(rec)
+            yield rec
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Pre-render every scene into the render cache.")
+    ap.add_argument("patterns", nargs="*", help="scene file globs, e.g. 'la_*' (default: all)")
+    for letter in QUALITY:
+        ap.add_argument(f"-q{letter}", dest="quality", action="store_const", const=letter)
+    ap.add_argument("--fps", type=int, default=30)
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    ap.add_argument("--skip-failed", action="store_true", help="do not retry scenes that failed before")
+    ap.add_argument("--no-freeze-waits", dest="freeze_waits", action="store_false",
+                    help="encode static waits frame by frame")
+    ap.add_argument("--dry-run", action="store_true", help="print the plan and exit")
+    ap.set_defaults(quality="m")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    todo = plan(args.patterns, args.quality, args.fps, args.jobs, args.skip_failed, args.freeze_waits)
+    total = sum(t["estimate"] or 0.0 for t in todo)
+    print(f"{len(todo)} scenes to render ({total / 60:.1f} min of video), {args.jobs} workers")
+    if args.dry_run:
+        for t in todo:
+            est = f"{t['estimate']:6.1f}s" if t["estimate"] is not None else "     ?"
+            print(f"  {est}  {t['file']} {t['cls']}")
+        return
+
+    failed = 0
+    for i, rec in enumerate(run_batch(todo, args.quality, args.fps, args.jobs, args.freeze_waits), 1):
+        failed += rec["status"] == "failed"
+        state = rec["error"] if rec["error"] else ("cached" if rec["cached"] else f"{rec['seconds']:.1f}s")
+        print(f"  [{i}/{len(todo)}] {rec['file']} {rec['cls']}: {state}")
+    print(f"→ {len(todo) - failed} rendered, {failed} failed in {(time.perf_counter() - t0) / 60:.1f} min"
+          f"  (journal: {JOURNAL})")
+
+
+if __name__ == "__main__":
+    main()
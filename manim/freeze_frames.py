@@ -0,0 +1,116 @@
+"""
+Freeze-frame fast path for static self.wait() segments.
+
+Stock manim renders a static wait (no updaters) by rasterising the frame
+once and then piping that same frame to ffmpeg int(duration * fps) times,
+where libx264 encodes every copy.  A 4.5 s wait at 30 fps is 135 frames of
+pipe traffic and encoding for one picture.
+
+FreezeFrameRenderer instead hands the frame to HoldFrameWriter.hold_frame,
+which encodes it exactly once as a one-frame partial movie whose frame
+lasts the whole wait (input rate fps/n).  manim's concat step already joins
+partials with `-c copy`, so the finished movie has the same duration and
+frame timing; the pause just costs one encoded frame.  Render time scales
+with the animated content, not with the pauses.
+
+Only mp4 output from the Cairo renderer takes the fast path; anything else
+(gif, webm, transparent .mov) falls back to manim's normal writer.
+
+HoldFrameWriter hooks manim 0.18's ffmpeg-pipe SceneFileWriter
+(open_movie_pipe, config.ffmpeg_executable).  From 0.19 the writer is
+PyAV: SUPPORTED is False there (or on any writer it does not recognise)
+and scene_runner.make_scene() keeps stock freeze_current_frame, so the
+render still works, just without the held-frame shortcut.
+
+Used by scene_runner.render_scene(..., freeze_waits=True) and friends.
+"""
+import subprocess
+from fractions import Fraction
+
+from manim import __version__, config
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from manifest import manifest_renderer_class, mp4_timescale
+
+try:
+    from manim.utils.file_ops import write_to_movie
+except ImportError:
+    write_to_movie = None
+
+SUPPORTED = (write_to_movie is not None and hasattr(SceneFileWriter, "open_movie_pipe")
+             and hasattr(config, "ffmpeg_executable"))
+
+
+class HoldFrameWriter(SceneFileWriter):
+    """SceneFileWriter that opens ffmpeg lazily, so a play() that turns out
+    to be a frozen wait never starts the per-frame pipe at all."""
+
+    def __init__(self, *args, **kwargs):
+        self._pending_pipe, self._pipe_open, self._held = (False, None), False, False
+        super().__init__(*args, **kwargs)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self._pending_pipe = (write_to_movie() and allow_write, file_path)
+        self._pipe_open = self._held = False
+
+    def write_frame(self, frame_or_renderer):
+        wanted, file_path = self._pending_pipe
+        if wanted and not self._pipe_open:
+            self.open_movie_pipe(file_path=file_path)
+            self._pipe_open = True
+        super().write_frame(frame_or_renderer)
+
+    def end_animation(self, allow_write=False):
+        wanted, file_path = self._pending_pipe
+        if wanted and not (self._pipe_open or self._held):
+            # Nothing was written: still leave the (empty) partial stock manim would
+            self.open_movie_pipe(file_path=file_path)
+            self._pipe_open = True
+        if self._pipe_open:
+            self.close_movie_pipe()
+            self._pipe_open = False
+
+    def can_hold(self):
+        wanted, _ = self._pending_pipe
+        return wanted and config.format == "mp4" and not config.transparent
+
+    def hold_frame(self, frame, num_frames):
+        """Encode *frame* once as a partial lasting *num_frames* frames."""
+        _, file_path = self._pending_pipe
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        fps = config.frame_rate
+        rate = Fraction(fps).limit_denominator(1001) / num_frames
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", "%dx%d" % (config.pixel_width, config.pixel_height),
+            "-pix_fmt", "rgba",
+            "-r", f"{rate.numerator}/{rate.denominator}",  # one input frame spanning the whole wait
+            "-i", "-",
+            "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+            "-vcodec", "libx264", "-pix_fmt", "yuv420p",
+            "-video_track_timescale", str(mp4_timescale(fps)),
+            str(file_path),
+        ]
+        subprocess.run(command, input=frame.tobytes(), check=True)
+        self._held = True
+
+
+class FreezeFrameRenderer(manifest_renderer_class()):
+    """ManifestRenderer whose static waits are encoded as a single held frame."""
+
+    def __init__(self, **kwargs):
+        super().__init__(file_writer_class=HoldFrameWriter, **kwargs)
+
+    def freeze_current_frame(self, duration):
+        dt = 1 / self.camera.frame_rate
+        num_frames = int(duration / dt)  # same count manim would write
+        if self.skip_animations or num_frames < 2 or not self.file_writer.can_hold():
+            return super().freeze_current_frame(duration)
+        self.time += num_frames * dt
+        self.file_writer.hold_frame(self.get_frame(), num_frames)
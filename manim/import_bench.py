@@ -0,0 +1,73 @@
+"""
+Import-time benchmark for the scene helpers and the paths that load them.
+
+Every case runs in a fresh interpreter (manim/ and manim/scenes on
+sys.path, as the render tools set them up) and is timed from inside it, so
+interpreter startup is left out.  Best of --runs, plus whether manim ended
+up imported:
+
+  manim          `import manim` on its own, for reference
+  la_utils       palette and array-only geometry
+  la_utils+mob   first use of a manim-backed helper (loads manim_utils)
+  scene          one scene module, which imports manim itself
+  validation     scene_runner.check_scene(), the pre-flight a generated
+                 scene passes before its dry run (timeline.py)
+
+Run: python import_bench.py
+     python import_bench.py --runs 10 --scene limit.py
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from scene_runner import BASE, SCENES_DIR, scene_classes
+
+CASES = {
+    "manim":        "import manim",
+    "la_utils":     "import la_utils",
+    "la_utils+mob": "import la_utils; la_utils.text_box",
+    "scene":        "import scene_runner; scene_runner.load_scene_class({file!r}, {cls!r})",
+    "validation":   "import scene_runner; scene_runner.check_scene({file!r}, {cls!r})",
+}
+
+PROBE = """\
+import sys, time, json
+sys.path[:0] = [{scenes!r}, {base!r}]
+t0 = time.perf_counter()
+{stmt}
+print(json.dumps([time.perf_counter() - t0, "manim" in sys.modules]))
+"""
+
+
+def time_case(stmt, runs=5):
+    """(best seconds, manim imported?) for *stmt* in *runs* fresh interpreters."""
+    best, loaded = None, False
+    code = PROBE.format(scenes=SCENES_DIR, base=BASE, stmt=stmt)
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=SCENES_DIR,
+                             capture_output=True, text=True, check=True)
+        seconds, loaded = json.loads(out.stdout.strip().splitlines()[-1])
+        best = seconds if best is None else min(best, seconds)
+    return best, loaded
+
+
+def bench(scene_file="derivative.py", runs=5):
+    """{case: (best seconds, manim imported?)} for every case in CASES."""
+    cls_name = scene_classes(scene_file)[0]
+    return {name: time_case(stmt.format(file=scene_file, cls=cls_name), runs)
+            for name, stmt in CASES.items()}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Import time of la_utils, a scene module and the validation path.")
+    ap.add_argument("--scene", default="derivative.py", help="scene file for the scene/validation cases")
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    for name, (seconds, loaded) in bench(args.scene, args.runs).items():
+        print(f"  {name:<13} {seconds * 1000:8.1f} ms   manim {'imported' if loaded else 'not imported'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Render-time timeline manifest: <Class>.timeline.json next to every MP4.
+
+ManifestRenderer is a CairoRenderer that records each play()/wait() as it
+renders — start, run_time, section (s1_hook …), animation types, frame
+count, whether it was a static wait, and the partial movie file manim wrote
+for it.  Helpers such as la_utils.sec_label() add named marks through
+renderer.marks.  write_manifest() saves all of it beside the finished
+movie, so later tools (retime.py, narration sync, chapters) can work on
+the existing render instead of rendering again.
+
+Sections carry start/end seconds.  Marks are stored as a range of event
+indices ("first"/"last") and their start/end are re-derived from the
+events, so they stay correct when sections are stitched or waits retimed.
+
+Importing this module does not import manim; the renderer class is built on
+first use.  timeline.py's dry run produces the same event shape.
+"""
+import functools
+import json
+import math
+import os
+
+from section_render import discover_sections
+
+
+# ── Events ───────────────────────────────────────────────────────────────────
+def sidecar_path(movie):
+    """derivative/720p30/DerivativeScene.mp4 → …/DerivativeScene.timeline.json"""
+    return os.path.splitext(str(movie))[0] + ".timeline.json"
+
+
+def mp4_timescale(fps):
+    """The track timescale ffmpeg's mp4 muxer picks for a *fps* stream
+    (doubled until >= 10000), so hold partials concat cleanly with the rest."""
+    ts = int(round(fps))
+    while ts < 10000:
+        ts *= 2
+    return ts
+
+
+def play_event(index, section, start, run_time, scene, fps):
+    """One manifest entry for the play() whose animations *scene* holds."""
+    types = [type(a).__name__ for a in scene.animations]
+    static = scene.is_current_animation_frozen_frame()
+    return {
+        "i": index,
+        "section": section,
+        "start": round(start, 4),
+        "run_time": round(run_time, 4),
+        "kind": "wait" if all(t == "Wait" for t in types) else "play",
+        "static": static,
+        "types": types,
+        # manim writes int(d*fps) frames for a frozen wait, one per tick otherwise
+        "frames": int(run_time * fps + 1e-6) if static else math.ceil(run_time * fps - 1e-6),
+    }
+
+
+def track_sections(scene, renderer):
+    """Wrap each sN_* method on *scene* so events know which section they belong to."""
+    for name in discover_sections(type(scene)):
+        method = getattr(scene, name)
+
+        def wrapped(*args, _name=name, _method=method, **kwargs):
+            renderer.section = _name
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                renderer.section = None
+
+        setattr(scene, name, wrapped)
+
+
+def summarize_sections(events):
+    """[{"name", "start", "end", "duration", "plays", "frames"}] in play order."""
+    sections = []
+    for e in events:
+        name = e["section"] or "construct"
+        if not sections or sections[-1]["name"] != name:
+            sections.append({"name": name, "start": e["start"], "end": e["start"], "duration": 0.0,
+                             "plays": 0, "frames": 0})
+        s = sections[-1]
+        s["end"] = round(e["start"] + e["run_time"], 4)
+        s["duration"] = round(s["end"] - s["start"], 4)
+        s["plays"] += 1
+        s["frames"] += e["frames"]
+    return sections
+
+
+def resolve_marks(events, marks):
+    """Marks with start/end taken from the events they span."""
+    by_index = {e["i"]: e for e in events}
+    out = []
+    for m in marks:
+        first, last = by_index.get(m["first"]), by_index.get(m["last"])
+        if first is None or last is None:
+            continue
+        out.append(dict(m, start=first["start"], end=round(last["start"] + last["run_time"], 4)))
+    return out
+
+
+# ── Recording renderer ───────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=None)
+def manifest_renderer_class():
+    """CairoRenderer subclass that records every play() (manim import deferred)."""
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    class ManifestRenderer(CairoRenderer):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.section = None
+            self.events = []
+            self.marks = []
+
+        def play(self, scene, *args, **kwargs):
+            start = self.time
+            super().play(scene, *args, **kwargs)
+            event = play_event(self.num_plays - 1, self.section, start, self.time - start,
+                               scene, self.camera.frame_rate)
+            partials = self.file_writer.partial_movie_files
+            event["partial"] = partials[-1] if partials else None
+            self.events.append(event)
+
+    return ManifestRenderer
+
+
+# ── Sidecar file ─────────────────────────────────────────────────────────────
+def build_manifest(scene_file, cls_name, events, fps, width, height, base_dir, marks=()):
+    """Manifest dict; partial paths are stored relative to *base_dir*."""
+    events = [dict(e, partial=os.path.relpath(e["partial"], base_dir) if e.get("partial") else None)
+              for e in events]
+    end = events[-1]["start"] + events[-1]["run_time"] if events else 0.0
+    return {
+        "file": os.path.basename(scene_file),
+        "cls": cls_name,
+        "fps": fps,
+        "width": width,
+        "height": height,
+        "duration": round(end, 3),
+        "frames": sum(e["frames"] for e in events),
+        "sections": summarize_sections(events),
+        "marks": resolve_marks(events, marks),
+        "events": events,
+    }
+
+
+def write_manifest(scene, movie, scene_file, cls_name):
+    """Write <movie>.timeline.json for a scene that was just rendered."""
+    from manim import config
+
+    r = scene.renderer
+    data = build_manifest(scene_file, cls_name, r.events, config.frame_rate, config.pixel_width,
+                          config.pixel_height, os.path.dirname(str(movie)), r.marks)
+    save_manifest(data, movie)
+    return data
+
+
+def save_manifest(data, movie):
+    path = sidecar_path(movie)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def load_manifest(movie):
+    """Read the sidecar of *movie*, with partial paths made absolute."""
+    with open(sidecar_path(movie), encoding="utf-8") as f:
+        data = json.load(f)
+    base = os.path.dirname(os.path.abspath(str(movie)))
+    for e in data["events"]:
+        if e.get("partial"):
+            e["partial"] = os.path.normpath(os.path.join(base, e["partial"]))
+    return data
@@ -0,0 +1,326 @@
+"""
+Content-addressed render cache.
+
+A render is keyed on what actually determines its file: the scene class,
+the scene module's source, the source of every local helper module it
+imports (la_utils, …), the render tools that shape the movie and its
+manifest (text_cache.py, freeze_frames.py, manifest.py; section_render.py
+for section renders), the manim version, the quality/fps and how it was
+encoded (held-frame waits, whole scene or concatenated sections).  Artifacts
+are stored by that key, so
+
+  * a stale video is never served after a scene or la_utils.py changes
+    (the key changes, the old object simply stops being referenced);
+  * two generated_<slug>.py files with identical source share one render;
+  * a lookup is one hash of a few small files plus one stat().
+
+Layout under output/cache/:
+  objects/<k[:2]>/<key>.mp4            the video
+  objects/<k[:2]>/<key>.timeline.json  its section/timeline manifest (manifest.py)
+  objects/<k[:2]>/<key>.json           metadata (first file/class, quality, size, …)
+  refs/<module>/<Class>.<q><fps>       last key rendered for that scene/quality
+
+Computing a key does not import manim.
+
+lookup_scene() never renders and never serves anything but a stored
+object.  Videos rendered before this cache existed are only used if
+imported explicitly with `seed`, which stores each one under its current
+key and refuses any that is older than a source it is keyed on; otherwise
+`python batch.py` fills the store.
+
+Published videos are hardlinks into the store, so anything that renders
+into output/videos must unlink the old file first (cached_render does)
+or ffmpeg would truncate the object.
+
+Run: python render_cache.py key    derivative.py DerivativeScene -qm
+     python render_cache.py lookup derivative.py DerivativeScene -qm   (prints "url key"; exit 1 on a miss)
+     python render_cache.py render derivative.py DerivativeScene -qm   (cached or rendered here; prints "url key")
+     python render_cache.py seed -qm --freeze-waits   (one-off: import pre-cache videos still newer than their sources)
+     python render_cache.py stats
+     python render_cache.py gc          (delete objects no ref points to)
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shutil
+import time
+from importlib.metadata import version
+
+from manifest import sidecar_path
+from scene_runner import OUTPUT_DIR, QUALITY, SCENES_DIR, VIDEOS_DIR, scene_path, video_url_path
+
+CACHE_DIR   = os.path.join(OUTPUT_DIR, "cache")
+OBJECTS_DIR = os.path.join(CACHE_DIR, "objects")
+REFS_DIR    = os.path.join(CACHE_DIR, "refs")
+
+# Pixel height per quality letter (manim's QUALITIES); dir name is <height>p<fps>
+HEIGHT = {"l": 480, "m": 720, "h": 1080, "p": 1440, "k": 2160}
+
+
+# ── Keys ─────────────────────────────────────────────────────────────────────
+def local_imports(path):
+    """Absolute paths of manim/scenes modules imported by *path*, recursively."""
+    found, stack = [], [path]
+    while stack:
+        tree = ast.parse(open(stack.pop(), encoding="utf-8").read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [a.name for a in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                dep = os.path.join(SCENES_DIR, name.split(".")[0] + ".py")
+                if os.path.exists(dep) and dep not in found and dep != path:
+                    found.append(dep)
+                    stack.append(dep)
+    return sorted(found)
+
+
+# Render tools that shape every movie and its manifest, beside this file
+TOOL_SOURCES = ("text_cache.py", "freeze_frames.py", "manifest.py")
+
+
+def key_sources(scene_file, mode="scene"):
+    """Every file cache_key() hashes: the scene, its helpers, the render tools."""
+    path = scene_path(scene_file)
+    tools = TOOL_SOURCES + (("section_render.py",) if mode == "sections" else ())
+    here = os.path.dirname(os.path.abspath(__file__))
+    return [path] + local_imports(path) + [os.path.join(here, t) for t in tools]
+
+
+def cache_key(scene_file, cls_name, quality="m", fps=30, freeze_waits=False, mode="scene"):
+    """sha256 over class, scene/helper/tool sources (key_sources), manim
+    version, quality and encoding (*freeze_waits*, *mode* "scene" or "sections")."""
+    path, *deps = key_sources(scene_file, mode)
+    h = hashlib.sha256()
+    h.update(f"cls={cls_name}\nmanim={version('manim')}\nq={quality}\nfps={fps}\n"
+             f"freeze={int(bool(freeze_waits))}\nmode={mode}\n".encode())
+    h.update(open(path, "rb").read())
+    for dep in deps:
+        h.update(f"\n--- {os.path.basename(dep)}\n".encode())
+        h.update(open(dep, "rb").read())
+    return h.hexdigest()
+
+
+def resolution_dir(quality, fps):
+    return f"{HEIGHT[quality]}p{fps}"
+
+
+def published_path(scene_file, cls_name, quality, fps):
+    """output/videos/<module>/<res>/<Class>.mp4 — where manim itself writes."""
+    module = os.path.splitext(os.path.basename(scene_file))[0]
+    return os.path.join(VIDEOS_DIR, module, resolution_dir(quality, fps), f"{cls_name}.mp4")
+
+
+# ── Store ────────────────────────────────────────────────────────────────────
+def _object_path(key, ext):
+    return os.path.join(OBJECTS_DIR, key[:2], key + ext)
+
+
+def _ref_path(scene_file, cls_name, quality, fps):
+    module = os.path.splitext(os.path.basename(scene_file))[0]
+    return os.path.join(REFS_DIR, module, f"{cls_name}.{quality}{fps}")
+
+
+def _write_atomic(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _place(src, dest, link):
+    """Atomically put *src* at *dest*, hardlinked when *link* and possible."""
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        return  # already published; rename() onto the same inode is a no-op
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    try:
+        if not link:
+            raise OSError
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+def lookup(key):
+    """Path of the cached video for *key*, or None."""
+    path = _object_path(key, ".mp4")
+    return path if os.path.exists(path) else None
+
+
+def store(key, movie, scene_file, cls_name, quality, fps, seconds=None):
+    """Copy a freshly rendered *movie* into the store under *key*."""
+    obj = _object_path(key, ".mp4")
+    _place(movie, obj, link=False)
+    if os.path.exists(sidecar_path(movie)):
+        _place(sidecar_path(movie), sidecar_path(obj), link=False)
+    meta = {
+        "file": os.path.basename(scene_file), "cls": cls_name,
+        "quality": quality, "fps": fps, "bytes": os.path.getsize(obj),
+        "render_seconds": seconds, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    _write_atomic(_object_path(key, ".json"), json.dumps(meta, indent=2))
+    return obj
+
+
+def publish(key, scene_file, cls_name, quality, fps):
+    """Expose object *key* at output/videos/<module>/<res>/<Class>.mp4 and
+    record it as the current ref.  Returns the /videos-relative url path."""
+    dest, obj = published_path(scene_file, cls_name, quality, fps), _object_path(key, ".mp4")
+    _place(obj, dest, link=True)
+    if os.path.exists(sidecar_path(obj)):
+        _place(sidecar_path(obj), sidecar_path(dest), link=False)
+    elif os.path.exists(sidecar_path(dest)):
+        os.remove(sidecar_path(dest))  # belongs to an older render
+    _write_atomic(_ref_path(scene_file, cls_name, quality, fps), key)
+    return video_url_path(dest)
+
+
+def unpublish(scene_file, cls_name, quality, fps):
+    """Remove the published file (breaking its hardlink) and its manifest
+    before a re-render."""
+    dest = published_path(scene_file, cls_name, quality, fps)
+    for path in (dest, sidecar_path(dest)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def lookup_scene(scene_file, cls_name, quality, fps, freeze_waits=False, mode="scene"):
+    """(url path, key) of the cached render, published; None when the scene
+    needs a render."""
+    key = cache_key(scene_file, cls_name, quality, fps, freeze_waits, mode)
+    if lookup(key):
+        return publish(key, scene_file, cls_name, quality, fps), key
+    return None
+
+
+def cached_render(scene_file, cls_name, quality, fps, render, force=False, freeze_waits=False, mode="scene"):
+    """Serve from the cache or call *render()* (→ dict with "movie") and store it.
+
+    *freeze_waits* and *mode* describe how *render* encodes, for the key.
+    Returns *render*'s dict shape plus "cached" and "key".
+    """
+    key = cache_key(scene_file, cls_name, quality, fps, freeze_waits, mode)
+    if lookup(key) and not force:
+        return {"path": publish(key, scene_file, cls_name, quality, fps),
+                "cached": True, "key": key, "timings": {}}
+    unpublish(scene_file, cls_name, quality, fps)
+    t0 = time.perf_counter()
+    out = render()
+    store(key, out["movie"], scene_file, cls_name, quality, fps, round(time.perf_counter() - t0, 3))
+    out.update(path=publish(key, scene_file, cls_name, quality, fps), cached=False, key=key)
+    return out
+
+
+# ── Maintenance ──────────────────────────────────────────────────────────────
+def seed(scenes, quality, fps, freeze_waits=False):
+    """Import videos rendered before the cache existed (output/videos/<module>/
+    <res>/<Class>.mp4) under their current key.  A video older than any file
+    its key covers may not match the source any more and is left out.
+    Yields (file, cls, "seeded" | "cached" | "stale" | "missing")."""
+    for scene_file, cls_name in scenes:
+        movie = published_path(scene_file, cls_name, quality, fps)
+        key = cache_key(scene_file, cls_name, quality, fps, freeze_waits)
+        if lookup(key):
+            yield scene_file, cls_name, "cached"
+        elif not os.path.exists(movie):
+            yield scene_file, cls_name, "missing"
+        elif os.path.getmtime(movie) < max(os.path.getmtime(p) for p in key_sources(scene_file)):
+            yield scene_file, cls_name, "stale"
+        else:
+            store(key, movie, scene_file, cls_name, quality, fps)
+            publish(key, scene_file, cls_name, quality, fps)
+            yield scene_file, cls_name, "seeded"
+
+
+def _iter_files(root):
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            yield os.path.join(dirpath, name)
+
+
+def live_keys():
+    return {open(p, encoding="utf-8").read().strip() for p in _iter_files(REFS_DIR)}
+
+
+def gc():
+    """Delete objects that no ref points to. Returns (files removed, bytes freed)."""
+    live, removed, freed = live_keys(), 0, 0
+    for path in list(_iter_files(OBJECTS_DIR)):
+        key = os.path.basename(path).split(".")[0]
+        if key not in live:
+            freed += os.path.getsize(path)
+            os.remove(path)
+            removed += 1
+    return removed, freed
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Content-addressed Manim render cache.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for cmd, help_ in [("key", "print the cache key (and hit/miss) for a scene"),
+                       ("lookup", "serve a scene from the cache; exit 1 on a miss"),
+                       ("render", "serve a scene from the cache, rendering it here on a miss")]:
+        p = sub.add_parser(cmd, help=help_)
+        p.add_argument("file", help="scene file, relative to manim/scenes")
+        p.add_argument("cls", help="Scene class name")
+        for letter in QUALITY:
+            p.add_argument(f"-q{letter}", dest="quality", action="store_const", const=letter)
+        p.add_argument("--fps", type=int, default=30)
+        p.add_argument("--freeze-waits", action="store_true", help="encode static waits as one held frame")
+        p.set_defaults(quality="m")
+        if cmd == "render":
+            p.add_argument("--force", action="store_true", help="render even on a hit")
+    p = sub.add_parser("seed", help="import pre-cache videos that are newer than their sources")
+    p.add_argument("patterns", nargs="*", help="scene file globs, e.g. 'la_*' (default: all)")
+    for letter in QUALITY:
+        p.add_argument(f"-q{letter}", dest="quality", action="store_const", const=letter)
+    p.add_argument("--fps", type=int, default=30)
+    p.add_argument("--freeze-waits", action="store_true", help="store under the held-frame key (what generate.js asks for)")
+    p.set_defaults(quality="m")
+    sub.add_parser("stats", help="object count and size")
+    sub.add_parser("gc", help="delete unreferenced objects")
+    args = ap.parse_args()
+
+    if args.cmd == "key":
+        key = cache_key(args.file, args.cls, args.quality, args.fps, args.freeze_waits)
+        print(key, "hit" if lookup(key) else "miss")
+    elif args.cmd == "lookup":
+        found = lookup_scene(args.file, args.cls, args.quality, args.fps, args.freeze_waits)
+        if found is None:
+            raise SystemExit(1)
+        print(*found)
+    elif args.cmd == "render":
+        from scene_runner import render_scene
+        render = lambda: render_scene(args.file, args.cls, args.quality, args.fps,
+                                      freeze_waits=args.freeze_waits)
+        out = cached_render(args.file, args.cls, args.quality, args.fps, render, args.force, args.freeze_waits)
+        print(out["path"], out["key"])
+    elif args.cmd == "seed":
+        from batch import discover
+        counts = {}
+        for scene_file, cls_name, state in seed(discover(args.patterns), args.quality, args.fps, args.freeze_waits):
+            counts[state] = counts.get(state, 0) + 1
+            if state != "cached":
+                print(f"  {state:<8} {scene_file} {cls_name}")
+        print(", ".join(f"{n} {state}" for state, n in sorted(counts.items())))
+    elif args.cmd == "stats":
+        videos = [p for p in _iter_files(OBJECTS_DIR) if p.endswith(".mp4")]
+        size = sum(os.path.getsize(p) for p in videos)
+        print(f"{len(videos)} objects, {size / 1e6:.1f} MB, {len(live_keys())} live refs")
+    else:
+        removed, freed = gc()
+        print(f"removed {removed} files, freed {freed / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
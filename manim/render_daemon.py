@@ -0,0 +1,219 @@
+"""
+Warm Manim render daemon.
+
+Keeps N worker processes alive with manim (and Cairo/Pango) already imported,
+so a render request only pays for the scene itself instead of a fresh
+`python -m manim render` interpreter.
+
+Run:  python render_daemon.py --workers 3              (TCP on 127.0.0.1:8765)
+      python render_daemon.py --workers 2 --stdio      (JSON lines on stdin/stdout)
+
+Protocol — one JSON object per line in, one JSON object per line out:
+  → {"file": "derivative.py", "cls": "DerivativeScene", "quality": "m"}
+  ← {"ok": true, "path": "/derivative/720p30/DerivativeScene.mp4", "cached": false, "key": "3f9c…",
+     "worker": 4242, "timings": {"queued": 0.0, "load": 0.1, "render": 38.2, "total": 38.3}}
+  Every render goes through render_cache.py: a scene whose source, helper
+  modules, manim version and quality match an earlier render is served from
+  the store without rendering ("cached": true in the reply); "force": true
+  re-renders anyway.
+  Add "mode": "sections" to render through section_render.py's per-section
+  cache; the reply then also lists each section and whether it was cached.
+  "jobs": N additionally renders up to N uncached sections in parallel.
+  "freeze_waits": true encodes every static wait as one held frame
+  (freeze_frames.py) instead of re-encoding the same frame for its duration.
+  → {"op": "lookup", "file": "derivative.py", "cls": "DerivativeScene", "freeze_waits": true}
+  ← {"ok": true, "path": "/derivative/720p30/DerivativeScene.mp4", "key": "3f9c…"}
+     (cache only, answered without a worker: "path" null on a miss)
+  → {"op": "timeline", "file": "generated_x.py", "cls": "GeneratedScene"}
+  ← {"ok": true, "timeline": {"duration": 187.4, "frames": 5622, "sections": [...], ...}}
+     (dry run through timeline.py: nothing is rendered)
+  → {"op": "ping"}
+  ← {"ok": true, "workers": 3}
+An optional "id" field is echoed back so stdio clients can match replies.
+"""
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import render_cache
+import scene_runner
+import section_render
+import timeline
+
+DEFAULT_PORT = int(os.environ.get("RENDER_DAEMON_PORT", 8765))
+
+
+# ── Worker side ──────────────────────────────────────────────────────────────
+def _warm_worker():
+    """Pool initializer: pay the manim import + first Pango layout up front."""
+    import manim  # noqa: F401
+    from manim import Text
+    Text("warm", font_size=24)
+
+
+def _worker_ready():
+    # Long enough that one fast-starting worker can't drain every warm-up task.
+    time.sleep(0.5)
+    return os.getpid()
+
+
+def _run_job(job, submitted):
+    started = time.time()
+    try:
+        file, cls = job["file"], job["cls"]
+        quality, fps = job.get("quality", "m"), int(job.get("fps", 30))
+        if job.get("op") == "timeline":
+            reply = {"ok": True, "timeline": timeline.timeline(file, cls, fps), "timings": {}}
+        else:
+            freeze, mode = bool(job.get("freeze_waits")), job.get("mode", "scene")
+            if mode == "sections":
+                render = lambda: section_render.render_sections(file, cls, quality, fps,
+                                                                jobs=int(job.get("jobs", 1)),
+                                                                freeze_waits=freeze)
+            else:
+                render = lambda: scene_runner.render_scene(file, cls, quality, fps, freeze_waits=freeze)
+            out = render_cache.cached_render(file, cls, quality, fps, render, force=bool(job.get("force")),
+                                             freeze_waits=freeze, mode=mode)
+            reply = {"ok": True, "path": out["path"], "cached": out["cached"], "key": out["key"],
+                     "timings": out["timings"]}
+            if "sections" in out:
+                reply["sections"] = out["sections"]
+    except Exception as exc:
+        reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}",
+                 "trace": traceback.format_exc(limit=5), "timings": {}}
+    reply["worker"] = os.getpid()
+    reply["timings"]["queued"] = round(started - submitted, 3)
+    reply["timings"]["total"] = round(time.time() - submitted, 3)
+    return reply
+
+
+def _lookup(job):
+    """Cache-only answer to a render job: no worker, no manim."""
+    try:
+        found = render_cache.lookup_scene(job["file"], job["cls"], job.get("quality", "m"),
+                                          int(job.get("fps", 30)), bool(job.get("freeze_waits")),
+                                          job.get("mode", "scene"))
+    except Exception as exc:
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    path, key = found or (None, None)
+    return {"ok": True, "path": path, "key": key}
+
+
+# ── Dispatcher ───────────────────────────────────────────────────────────────
+class RenderPool:
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+        # Submitting one no-op per slot makes the pool start every worker now,
+        # not lazily on the first real job.
+        pids = {f.result() for f in [self.executor.submit(_worker_ready) for _ in range(workers)]}
+        log(f"{len(pids)}/{workers} worker(s) warm")
+
+    def handle(self, job):
+        if job.get("op") == "ping":
+            reply = {"ok": True, "workers": self.workers}
+        elif "file" not in job or "cls" not in job:
+            reply = {"ok": False, "error": "job needs 'file' and 'cls'"}
+        elif job.get("op") == "lookup":
+            reply = _lookup(job)
+        else:
+            reply = self.executor.submit(_run_job, job, time.time()).result()
+            if reply["ok"] and "timeline" in reply:
+                log(f"{job['cls']} timeline: {reply['timeline']['duration']}s")
+            elif reply["ok"]:
+                log(f"{job['cls']} → {reply['path']}  {reply['timings']}")
+            else:
+                log(f"{job['cls']} FAILED: {reply['error']}")
+        if "id" in job:
+            reply["id"] = job["id"]
+        return reply
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def log(msg):
+    print(f"[render-daemon] {msg}", file=sys.stderr, flush=True)
+
+
+def parse_line(line):
+    try:
+        return json.loads(line), None
+    except json.JSONDecodeError as exc:
+        return None, {"ok": False, "error": f"bad JSON: {exc}"}
+
+
+# ── Transports ───────────────────────────────────────────────────────────────
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            job, err = parse_line(raw)
+            reply = err or self.server.pool.handle(job)
+            self.wfile.write((json.dumps(reply) + "\n").encode())
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def serve_tcp(pool, port):
+    with _Server(("127.0.0.1", port), _Handler) as server:
+        server.pool = pool
+        log(f"listening on 127.0.0.1:{port}")
+        server.serve_forever()
+
+
+def serve_stdio(pool):
+    lock = threading.Lock()
+
+    def write(reply):
+        with lock:
+            sys.stdout.write(json.dumps(reply) + "\n")
+            sys.stdout.flush()
+
+    threads = []
+    for raw in sys.stdin:
+        if not raw.strip():
+            continue
+        job, err = parse_line(raw)
+        if err:
+            write(err)
+            continue
+        t = threading.Thread(target=lambda j=job: write(pool.handle(j)), daemon=True)
+        t.start()
+        threads.append(t)
+    for t in threads:
+        t.join()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--stdio", action="store_true", help="serve JSON lines on stdin/stdout")
+    args = ap.parse_args()
+
+    pool = RenderPool(args.workers)
+    try:
+        if args.stdio:
+            serve_stdio(pool)
+        else:
+            serve_tcp(pool, args.port)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
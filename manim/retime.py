@@ -0,0 +1,192 @@
+"""
+Retime a rendered scene's waits without rendering it again.
+
+Every render leaves <Class>.timeline.json next to the MP4 (manifest.py):
+each play()/wait() with its partial movie file and whether it was a static
+wait.  A static wait is one picture held for N frames, so changing its
+length never needs Cairo: this tool takes the first frame of that partial,
+encodes it once as a held frame of the new length, and re-joins all
+partials with the concat demuxer (-c copy).  Animated partials are reused
+byte for byte.  A whole scene retimes in seconds.
+
+Rules (pick one):
+  --scale K          every static wait × K
+  --patch            _patch_waits.py's rule (+0.3 … +1.5 s per wait)
+  --target SECONDS   scale all static waits so the movie lasts SECONDS
+  --fit s1_hook=40,s4_example=95
+                     per-section lengths, e.g. to match narration segments
+
+Run: python retime.py derivative.py DerivativeScene -qm --patch
+     python retime.py derivative.py DerivativeScene -qm --fit s1_hook=40,s2_geometry=95
+     python retime.py --movie output/videos/la_12_span/720p30/SpanScene.mp4 --target 150 -o span.mp4
+
+Writes <Class>.retimed.mp4 (and its manifest) next to the source unless -o is given.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+from manifest import build_manifest, load_manifest, mp4_timescale, save_manifest
+from render_cache import published_path
+from scene_runner import QUALITY, SCENES_DIR
+from section_render import concat_movies
+
+
+# ── Rules: event → new length in seconds (static waits only) ────────────────
+def scale_rule(k):
+    return lambda e: e["run_time"] * k
+
+
+def patch_rule():
+    sys.path.insert(0, SCENES_DIR)
+    from _patch_waits import stretch_wait
+    return lambda e: stretch_wait(e["run_time"])
+
+
+def _fit_factor(events, target):
+    """Factor for the static waits in *events* so they total *target* seconds."""
+    held = sum(e["run_time"] for e in events if e["static"])
+    fixed = sum(e["run_time"] for e in events if not e["static"])
+    if held <= 0:
+        return 1.0
+    return max(0.0, (target - fixed) / held)
+
+
+def target_rule(manifest, target):
+    return scale_rule(_fit_factor(manifest["events"], target))
+
+
+def fit_rule(manifest, section_targets):
+    factors = {}
+    for name, target in section_targets.items():
+        events = [e for e in manifest["events"] if e["section"] == name]
+        if not events:
+            raise LookupError(f"no section {name} in {manifest['cls']}")
+        factors[name] = _fit_factor(events, target)
+    return lambda e: e["run_time"] * factors.get(e["section"], 1.0)
+
+
+# ── Retiming ─────────────────────────────────────────────────────────────────
+def hold_partial(src, dest, num_frames, manifest, ffmpeg="ffmpeg"):
+    """Encode the first frame of *src* as a *num_frames*-long held frame."""
+    w, h, fps = manifest["width"], manifest["height"], manifest["fps"]
+    rate = Fraction(fps).limit_denominator(1001) / num_frames
+    frame = subprocess.run(
+        [ffmpeg, "-v", "error", "-i", src, "-frames:v", "1", "-f", "rawvideo", "-pix_fmt", "yuv420p", "-"],
+        check=True, capture_output=True,
+    ).stdout
+    subprocess.run(
+        [ffmpeg, "-y", "-v", "error",
+         "-f", "rawvideo", "-s", f"{w}x{h}", "-pix_fmt", "yuv420p",
+         "-r", f"{rate.numerator}/{rate.denominator}",  # one input frame spanning the whole wait
+         "-i", "-", "-an",
+         "-vcodec", "libx264", "-pix_fmt", "yuv420p",
+         "-video_track_timescale", str(mp4_timescale(fps)),
+         dest],
+        input=frame, check=True,
+    )
+
+
+def retime(movie, rule, out=None, ffmpeg="ffmpeg", workers=None):
+    """Rebuild *movie* with each static wait's length given by *rule(event)*.
+
+    Returns {"movie", "before", "after", "rebuilt", "seconds"}.
+    """
+    t0 = time.perf_counter()
+    manifest = load_manifest(movie)
+    fps = manifest["fps"]
+    missing = [e["i"] for e in manifest["events"] if not (e.get("partial") and os.path.exists(e["partial"]))]
+    if missing:
+        raise FileNotFoundError(f"partial movie files gone for plays {missing[:5]}…; render the scene once more")
+
+    out = out or os.path.splitext(movie)[0] + ".retimed.mp4"
+    hold_dir = os.path.join(os.path.dirname(os.path.abspath(out)), "retimed_partials", manifest["cls"])
+    os.makedirs(hold_dir, exist_ok=True)
+
+    events, jobs = [], []
+    for e in manifest["events"]:
+        e = dict(e)
+        if e["static"]:
+            n = max(0, int(round(rule(e) * fps)))
+            if n != e["frames"]:
+                stem = os.path.splitext(os.path.basename(e["partial"]))[0]
+                dest = os.path.join(hold_dir, f"{stem}.{n}.mp4")
+                if n and not os.path.exists(dest):
+                    jobs.append((e["partial"], dest, n))
+                e.update(frames=n, run_time=round(n / fps, 4), partial=dest if n else None)
+        events.append(e)
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for fut in [pool.submit(hold_partial, src, dest, n, manifest, ffmpeg) for src, dest, n in jobs]:
+            fut.result()
+
+    t = 0.0
+    for e in events:
+        e["start"] = round(t, 4)
+        t += e["run_time"]
+    if os.path.exists(out):
+        os.remove(out)  # may be a render_cache hardlink; never write through it
+    concat_movies([e["partial"] for e in events if e["partial"]], out, ffmpeg)
+    data = build_manifest(manifest["file"], manifest["cls"], events, fps, manifest["width"],
+                          manifest["height"], os.path.dirname(os.path.abspath(out)), manifest.get("marks", []))
+    save_manifest(data, out)
+    return {
+        "movie": out,
+        "before": manifest["duration"],
+        "after": data["duration"],
+        "rebuilt": len(jobs),
+        "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def parse_fit(spec):
+    """'s1_hook=40,s4_example=95' → {"s1_hook": 40.0, "s4_example": 95.0}"""
+    pairs = (item.split("=", 1) for item in spec.split(",") if item.strip())
+    return {name.strip(): float(value) for name, value in pairs}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Stretch or shrink the waits of a rendered scene.")
+    ap.add_argument("file", nargs="?", help="scene file, relative to manim/scenes")
+    ap.add_argument("cls", nargs="?", help="Scene class name")
+    ap.add_argument("--movie", help="rendered MP4 (instead of file + cls)")
+    for letter in QUALITY:
+        ap.add_argument(f"-q{letter}", dest="quality", action="store_const", const=letter)
+    ap.add_argument("--fps", type=int, default=30)
+    rule = ap.add_mutually_exclusive_group(required=True)
+    rule.add_argument("--scale", type=float)
+    rule.add_argument("--patch", action="store_true")
+    rule.add_argument("--target", type=float)
+    rule.add_argument("--fit", type=parse_fit)
+    ap.add_argument("-o", "--out")
+    ap.add_argument("--ffmpeg", default="ffmpeg")
+    ap.set_defaults(quality="m")
+    args = ap.parse_args()
+
+    if args.movie:
+        movie = args.movie
+    elif args.file and args.cls:
+        movie = published_path(args.file, args.cls, args.quality, args.fps)
+    else:
+        ap.error("give either FILE CLS or --movie")
+
+    if args.scale is not None:
+        fn = scale_rule(args.scale)
+    elif args.patch:
+        fn = patch_rule()
+    elif args.target is not None:
+        fn = target_rule(load_manifest(movie), args.target)
+    else:
+        fn = fit_rule(load_manifest(movie), args.fit)
+
+    r = retime(movie, fn, args.out, args.ffmpeg)
+    print(f"{r['before']:.1f}s → {r['after']:.1f}s  ({r['rebuilt']} holds re-encoded, {r['seconds']:.1f}s)")
+    print(f"→ {r['movie']}")
+
+
+if __name__ == "__main__":
+    main()
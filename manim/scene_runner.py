@@ -0,0 +1,154 @@
+"""
+Shared scene loading + rendering for the Python render tools.
+
+Everything here runs inside an already-started interpreter, so `import manim`
+(and Cairo/Pango setup) is paid once per process instead of once per render.
+Used by render_daemon.py, section_render.py and timeline.py.
+"""
+import ast
+import importlib.util
+import os
+import sys
+import time
+
+BASE       = os.path.dirname(os.path.abspath(__file__))
+SCENES_DIR = os.path.join(BASE, "scenes")
+OUTPUT_DIR = os.path.join(BASE, "output")
+VIDEOS_DIR = os.path.join(OUTPUT_DIR, "videos")
+
+# Same letters as the manim CLI (-ql / -qm / -qh / -qp / -qk)
+QUALITY = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+# ── Scene loading ────────────────────────────────────────────────────────────
+def scene_path(scene_file):
+    """Absolute path for a scene file given relative to manim/scenes."""
+    if os.path.isabs(scene_file):
+        return scene_file
+    return os.path.join(SCENES_DIR, scene_file)
+
+
+def scene_classes(scene_file):
+    """Names of the Scene subclasses defined in *scene_file*, found by AST
+    (no import, so no manim needed)."""
+    with open(scene_path(scene_file), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    return [node.name for node in tree.body
+            if isinstance(node, ast.ClassDef)
+            and any(getattr(b, "id", getattr(b, "attr", "")).endswith("Scene") for b in node.bases)]
+
+
+def check_scene(scene_file, cls_name):
+    """Cheap pre-flight for a dry run or render, by AST (no manim import):
+    SyntaxError if *scene_file* does not parse, LookupError if it defines
+    no class *cls_name*."""
+    with open(scene_path(scene_file), encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=os.path.basename(scene_path(scene_file)))
+    if not any(isinstance(node, ast.ClassDef) and node.name == cls_name for node in tree.body):
+        raise LookupError(f"{os.path.basename(scene_path(scene_file))} has no class {cls_name}")
+
+
+def purge_scene_modules():
+    """Forget every module imported from manim/scenes (la_utils, scenes, …).
+
+    manim itself stays imported; only the cheap local modules are re-read, so
+    an edit to la_utils.py is picked up by the next render in a warm process.
+    """
+    for name, mod in list(sys.modules.items()):
+        f = getattr(mod, "__file__", None)
+        if f and os.path.dirname(os.path.abspath(f)) == SCENES_DIR:
+            del sys.modules[name]
+
+
+def load_scene_class(scene_file, cls_name):
+    """Import *scene_file* fresh and return its *cls_name* Scene subclass."""
+    path = scene_path(scene_file)
+    if SCENES_DIR not in sys.path:
+        sys.path.insert(0, SCENES_DIR)
+    purge_scene_modules()
+    mod_name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(mod_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[mod_name] = module
+    spec.loader.exec_module(module)
+    try:
+        return getattr(module, cls_name)
+    except AttributeError:
+        raise LookupError(f"{os.path.basename(path)} has no class {cls_name}")
+
+
+def video_url_path(movie_file_path):
+    """/derivative/720p30/DerivativeScene.mp4 — the form served under /videos."""
+    rel = os.path.relpath(str(movie_file_path), VIDEOS_DIR)
+    return "/" + rel.replace(os.sep, "/")
+
+
+# ── Rendering ────────────────────────────────────────────────────────────────
+def render_config(scene_file, media_dir=OUTPUT_DIR):
+    """Config overrides shared by every render (quality/fps are set separately)."""
+    return {
+        "input_file": scene_path(scene_file),
+        "media_dir": media_dir,
+        "format": "mp4",
+        "write_to_movie": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        # Keep every partial movie file: retime.py rebuilds movies from them
+        "max_files_cached": 10000,
+    }
+
+
+def make_scene(scene_cls, freeze_waits=False):
+    """Instantiate *scene_cls* with a renderer that records the timeline
+    manifest (manifest.py); with *freeze_waits*, static waits are encoded
+    as one held frame (freeze_frames.py) instead of frame by frame, where
+    the installed manim's writer supports it.
+    Text() goes through the shared glyph cache (text_cache.py)."""
+    import text_cache
+    from manifest import manifest_renderer_class, track_sections
+
+    text_cache.install()
+    renderer_cls = manifest_renderer_class()
+    if freeze_waits:
+        import freeze_frames
+        if freeze_frames.SUPPORTED:     # manim 0.18's ffmpeg-pipe writer only
+            renderer_cls = freeze_frames.FreezeFrameRenderer
+    scene = scene_cls(renderer=renderer_cls())
+    track_sections(scene, scene.renderer)
+    return scene
+
+
+def render_scene(scene_file, cls_name, quality="m", fps=30, media_dir=OUTPUT_DIR, freeze_waits=False):
+    """Render one scene in this process.
+
+    Returns {"movie": <abs path>, "path": <url path>, "timings": {...}}.
+    Timings are wall-clock seconds for loading the module and for the
+    construct + encode pass.  <Class>.timeline.json is written next to the
+    movie (manifest.py).
+    """
+    from manim import config, tempconfig
+    from manifest import write_manifest
+
+    t0 = time.perf_counter()
+    with tempconfig(render_config(scene_file, media_dir)):
+        # quality first: it resets frame_rate (same order as -qm --fps 30)
+        config.quality = QUALITY[quality]
+        config.frame_rate = fps
+        scene_cls = load_scene_class(scene_file, cls_name)
+        t1 = time.perf_counter()
+        scene = make_scene(scene_cls, freeze_waits)
+        scene.render()
+        movie = str(scene.renderer.file_writer.movie_file_path)
+        write_manifest(scene, movie, scene_file, cls_name)
+    t2 = time.perf_counter()
+    return {
+        "movie": movie,
+        "path": video_url_path(movie),
+        "timings": {"load": round(t1 - t0, 3), "render": round(t2 - t1, 3)},
+    }
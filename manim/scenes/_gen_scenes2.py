@@ -7,34 +7,16 @@ BASE = os.path.dirname(os.path.abspath(__file__))
 
 HEADER = '''"""Feynman – {title} (Gold Standard) – 6-section, 3-5 min, Text/Cairo only."""
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, vec
+from la_utils import text_box, sec_label, SixSectionScene, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, make_axes, plot_curve, tracked_dot, vec
 import numpy as np
 AX_COLOR = "#888888"
 '''
 
 def TPLATE(cls):
     return f'''
-class {cls}(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.3)
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
+class {cls}(SixSectionScene):
     def _axes(self, xr=(-0.3,4.5,1), yr=(-0.3,4.5,1)):
-        return Axes(x_range=[*xr], y_range=[*yr], x_length=7.2, y_length=5.0,
-            axis_config={{"color": AX_COLOR,"stroke_width":2,"include_tip":True,"include_ticks":True}}
-        ).shift(LEFT*1.5+DOWN*0.5)
+        return make_axes(xr, yr, 7.2, 5.0).shift(LEFT*1.5+DOWN*0.5)
 '''
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -59,7 +41,7 @@ LIMIT = HEADER.format(title="Limits") + TPLATE("LimitScene") + '''
         sec_label(self, "Approaching a Point")
         ax = self._axes(xr=(-0.3,5,1), yr=(-0.3,2.5,0.5))
         f = lambda x: np.sin(x)/x if abs(x) > 0.001 else 1.0
-        left  = ax.plot(f, x_range=[0.05, 4.8], color=BLUE, stroke_width=3.5)
+        left  = plot_curve(ax, f, x_range=[0.05, 4.8], color=BLUE, stroke_width=3.5)
         self.play(Create(ax), run_time=2.0); self.wait(0.3)
         self.play(Create(left), run_time=2.0); self.wait(0.5)
         r1 = Text("f(x) = sin(x)/x", font_size=24, color=BLUE)
@@ -72,7 +54,7 @@ LIMIT = HEADER.format(title="Limits") + TPLATE("LimitScene") + '''
         self._rp(r2, y=1.5); b2 = self._box(r2, border=RED)
         self.play(FadeIn(b2), Write(r2), run_time=1.5); self.wait(1.5)
         x_t = ValueTracker(3.0)
-        dot_r = always_redraw(lambda: Dot(ax.c2p(x_t.get_value(), f(x_t.get_value())), color=YELL, radius=0.12))
+        dot_r = tracked_dot(ax, x_t, f, radius=0.12)
         self.play(Create(dot_r)); self.wait(0.3)
         self.play(x_t.animate.set_value(0.15), run_time=3.0, rate_func=smooth); self.wait(0.5)
         r3 = Text("As x -> 0, f(x) -> 1", font_size=22, color=GREEN)
@@ -131,7 +113,7 @@ LIMIT = HEADER.format(title="Limits") + TPLATE("LimitScene") + '''
         sec_label(self, "Summary")
         ax = self._axes(xr=(-0.3,5,1), yr=(-0.3,2.5,0.5))
         f = lambda x: np.sin(x)/x if abs(x) > 0.001 else 1.0
-        curve = ax.plot(f, x_range=[0.05, 4.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(ax, f, x_range=[0.05, 4.8], color=BLUE, stroke_width=3.5)
         hole = Circle(radius=0.1, color=RED, fill_color=BG, fill_opacity=1, stroke_width=2).move_to(ax.c2p(0,1))
         self.play(Create(ax), Create(curve), Create(hole), run_time=2.0); self.wait(0.5)
         sm = Text("Limits\\n\\n  lim(x->c) f(x) = L\\n\\n  Direction of approach matters\\n  Function value at c does not\\n\\n  Powers calculus:\\n  Derivatives, integrals, continuity\\n\\n  Epsilon-delta: the rigorous definition\\n  The language of infinitesimals", font_size=20, color=WHITE)
@@ -1440,14 +1422,14 @@ INDUCTION = HEADER.format(title="Electromagnetic Induction") + TPLATE("Induction
         sec_label(self, "Magnetic Flux and Induction")
         ax = self._axes(xr=(-0.3,6,1), yr=(-0.3,4,1))
         t = ValueTracker(0)
-        B_curve = ax.plot(lambda x: 2*np.sin(x), x_range=[0,5.5], color=BLUE, stroke_width=3)
+        B_curve = plot_curve(ax, lambda x: 2*np.sin(x), x_range=[0,5.5], color=BLUE, stroke_width=3)
         self.play(Create(ax), run_time=1.5)
         self.play(Create(B_curve), run_time=2.0); self.wait(0.5)
         r1 = Text("B(t) = B0 sin(t)  (alternating B field)", font_size=22, color=BLUE)
         self._rp(r1, y=2.5); b1 = self._box(r1, border=BLUE)
         self.play(FadeIn(b1), Write(r1), run_time=1.5); self.wait(1.5)
         self.play(FadeOut(b1), FadeOut(r1), run_time=0.3)
-        emf_curve = ax.plot(lambda x: -2*np.cos(x), x_range=[0,5.5], color=YELL, stroke_width=3)
+        emf_curve = plot_curve(ax, lambda x: -2*np.cos(x), x_range=[0,5.5], color=YELL, stroke_width=3)
         self.play(Create(emf_curve), run_time=2.0); self.wait(0.5)
         r2 = Text("EMF = -dB/dt = -B0 cos(t)\\n90 degree phase shift!", font_size=22, color=YELL)
         self._rp(r2, y=2.5); b2 = self._box(r2, border=YELL)
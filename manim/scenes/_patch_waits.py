@@ -1,54 +1,46 @@
 """
 Patch scenes that are under 2 minutes by increasing wait times.
 Increases each self.wait(X) by a fixed delta based on current value.
+
+Which scenes are short is measured, not hand-listed: every scene is dry-run
+through ../timeline.py (no render, a second or so each) and patched pass by
+pass until it reaches --target seconds.
+
+Run: python _patch_waits.py                      (all scenes, target 120 s)
+     python _patch_waits.py --target 150 la_12_span.py
+     python _patch_waits.py --report             (durations only, no edits)
 """
-import re, os, subprocess, glob
+import re, os, sys, glob, argparse
 
 BASE = os.path.dirname(os.path.abspath(__file__))
 
-# Files that need patching (under 2 min)
-SHORT = [
-    'algo_02_quicksort.py',
-    'econ_05_game_theory.py',
-    'la_04_dot_product.py',
-    'la_05_cross_product.py',
-    'la_09_shear.py',
-    'la_10_projection.py',
-    'la_12_span.py',
-    'la_13_lin_indep.py',
-    'la_14_basis.py',
-    'la_15_change_of_basis.py',
-    'la_17_svd.py',
-    'la_18_null_space.py',
-    'la_19_column_space.py',
-    'la_20_row_reduction.py',
-    'la_22_det_zero.py',
-    'la_23_eigen_why.py',
-    'phys_03_induction.py',
-    'phys_04_maxwell.py',
-]
+MAX_PASSES = 6
 
-def patch(text):
+def stretch_wait(val):
     """
-    Increase all self.wait(X) by:
+    New length for a self.wait(val):
       X <= 0.5  -> +0.3
       0.5 < X <= 1.5 -> +0.8
       1.5 < X <= 2.5 -> +1.0
       2.5 < X <= 3.5 -> +1.0
       X > 3.5 -> +1.5
+    Also used by ../retime.py to apply the same rule to a rendered movie.
     """
+    if val <= 0.5:
+        return val + 0.3
+    elif val <= 1.5:
+        return val + 0.8
+    elif val <= 2.5:
+        return val + 1.0
+    elif val <= 3.5:
+        return val + 1.0
+    else:
+        return val + 1.5
+
+def patch(text):
+    """Increase all self.wait(X) in *text* by stretch_wait's rule."""
     def replace_wait(m):
-        val = float(m.group(1))
-        if val <= 0.5:
-            new_val = val + 0.3
-        elif val <= 1.5:
-            new_val = val + 0.8
-        elif val <= 2.5:
-            new_val = val + 1.0
-        elif val <= 3.5:
-            new_val = val + 1.0
-        else:
-            new_val = val + 1.5
+        new_val = stretch_wait(float(m.group(1)))
         # Format nicely
         if new_val == int(new_val):
             return f'self.wait({int(new_val)}.0)'
@@ -56,20 +48,68 @@ def patch(text):
             return f'self.wait({new_val:.1f})'
     return re.sub(r'self\.wait\((\d+(?:\.\d+)?)\)', replace_wait, text)
 
-for fname in SHORT:
+def wait_total(text):
+    return sum(float(m) for m in re.findall(r'self\.wait\((\d+(?:\.\d+)?)\)', text))
+
+def scene_duration(fname):
+    """Dry-run duration in seconds of the scene in *fname* (first Scene class)."""
+    from scene_runner import scene_classes
+    from timeline import timeline
+    classes = scene_classes(fname)
+    if not classes:
+        return None
+    return timeline(fname, classes[0])['duration']
+
+def patch_to_target(fname, target):
+    """Patch *fname* until its dry-run duration reaches *target*. Returns (before, after)."""
     path = os.path.join(BASE, fname)
-    if not os.path.exists(path):
-        print(f'SKIP (not found): {fname}')
-        continue
-    with open(path, 'r', encoding='utf-8') as f:
-        original = f.read()
-    patched = patch(original)
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(patched)
-    # count wait additions
-    orig_waits = [float(m) for m in re.findall(r'self\.wait\((\d+(?:\.\d+)?)\)', original)]
-    new_waits  = [float(m) for m in re.findall(r'self\.wait\((\d+(?:\.\d+)?)\)', patched)]
-    added = sum(new_waits) - sum(orig_waits)
-    print(f'{fname}: +{added:.1f}s wait time added ({len(orig_waits)} wait calls)')
+    before = after = scene_duration(fname)
+    passes = 0
+    while after is not None and after < target and passes < MAX_PASSES:
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        patched = patch(original)
+        if patched == original:
+            break  # no literal self.wait(X) left to stretch
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(patched)
+        passes += 1
+        print(f'  {fname} pass {passes}: +{wait_total(patched) - wait_total(original):.1f}s wait time')
+        after = scene_duration(fname)
+    return before, after
+
+def main():
+    ap = argparse.ArgumentParser(description='Stretch self.wait() calls in short scenes.')
+    ap.add_argument('files', nargs='*', help='scene files (default: every scene in this folder)')
+    ap.add_argument('--target', type=float, default=120.0, help='minimum duration in seconds')
+    ap.add_argument('--report', action='store_true', help='only print dry-run durations')
+    args = ap.parse_args()
+
+    # timeline.py and scene_runner.py live one level up in manim/
+    sys.path.insert(0, os.path.dirname(BASE))
+    files = args.files or sorted(
+        os.path.basename(p) for p in glob.glob(os.path.join(BASE, '*.py'))
+        if not os.path.basename(p).startswith('_') and not os.path.basename(p).endswith('_utils.py')
+    )
+    for fname in files:
+        if not os.path.exists(os.path.join(BASE, fname)):
+            print(f'SKIP (not found): {fname}')
+            continue
+        if args.report:
+            d = scene_duration(fname)
+            flag = '' if d is None or d >= args.target else '  < target'
+            print(f'{fname}: {d if d is None else round(d, 1)}s{flag}')
+            continue
+        before, after = patch_to_target(fname, args.target)
+        if before is None:
+            print(f'SKIP (no Scene class): {fname}')
+        elif before >= args.target:
+            print(f'{fname}: {before:.1f}s, ok')
+        else:
+            print(f'{fname}: {before:.1f}s -> {after:.1f}s')
+
+    if not args.report:
+        print('\nPatch complete.')
 
-print('\nPatch complete.')
+if __name__ == '__main__':
+    main()
@@ -3,39 +3,17 @@ Feynman – Quicksort (Gold Standard)
 6-section narrative, 3-5 minutes. Text/Cairo only, no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
+from sort_utils import SortBars, quicksort_trace, play_sort
 
 AX_COLOR = "#888888"
 
-class QuicksortScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.6)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
+class QuicksortScene(SixSectionScene):
+    GAP = 0.6
 
     def _mk_axes(self, xr=(-0.5, 4.5, 1), yr=(-0.5, 4.5, 1)):
-        return Axes(
-            x_range=[*xr], y_range=[*yr],
-            x_length=7.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2,
-                         "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        return make_axes(xr, yr).shift(LEFT * 1.5 + DOWN * 0.5)
 
     def s1_hook(self):
         t1 = Text("Quicksort", font_size=52, color=WHITE)
@@ -151,6 +129,14 @@ class QuicksortScene(Scene):
             self.play(FadeIn(b), Write(mob), run_time=1.5); self.wait(2.0)
             y -= 0.9
         self.wait(3.0)
+        self._fade_all()
+
+        sec_label(self, "At Scale: 64 Numbers")
+        values = np.random.default_rng(2).permutation(64) + 1
+        bars = SortBars(values, width=11.0, height=4.0, bottom=-3.2)
+        key = Text("yellow: compared   red: pivot   green: final position", font_size=20, color=WHITE).move_to(UP * 2.3)
+        self.play(FadeIn(bars), FadeIn(key), run_time=1.0)
+        play_sort(self, bars, quicksort_trace(values)); self.wait(2.0)
 
     def s5_insight(self):
         sec_label(self, "The Deeper Insight")
@@ -1,6 +1,7 @@
 """algo_03_merge_sort.py — Merge Sort"""
 from manim import *
 from la_utils import *
+from sort_utils import SortBars, merge_sort_trace, play_sort
 
 
 class MergeSortScene(Scene):
@@ -13,6 +14,10 @@ class MergeSortScene(Scene):
             "Always O(n log n).",
             font_size=28, color=WHITE,
         )
-        txt.move_to(ORIGIN)
+        txt.move_to(UP * 2.0)
         bl = text_box(txt, border=BLUE)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt)); self.wait(1)
+        values = np.random.default_rng(3).permutation(64) + 1
+        bars = SortBars(values, width=11.0, height=3.2, bottom=-3.4)
+        self.play(FadeIn(bars))
+        play_sort(self, bars, merge_sort_trace(values)); self.wait(2)
@@ -10,9 +10,9 @@ class BigOScene(Scene):
         sec_label(self, "Big O Notation")
         axes = Axes(x_range=[0, 4, 1], y_range=[0, 5, 1], x_length=6, y_length=4,
                     axis_config={"color": "#555", "include_numbers": False}).shift(DOWN * 0.5)
-        ln = axes.plot(lambda x: x, x_range=[0.1, 4], color=BLUE)
-        nlogn = axes.plot(lambda x: x * max(0.01, np.log(max(0.01, x))), x_range=[0.2, 4], color=YELL)
-        n2 = axes.plot(lambda x: x**2 * 0.25, x_range=[0.1, 4], color=RED)
+        ln = plot_curve(axes, lambda x: x, x_range=[0.1, 4], color=BLUE)
+        nlogn = plot_curve(axes, lambda x: x * max(0.01, np.log(max(0.01, x))), x_range=[0.2, 4], color=YELL)
+        n2 = plot_curve(axes, lambda x: x**2 * 0.25, x_range=[0.1, 4], color=RED)
         self.play(Create(axes), Create(ln)); self.wait(0.3)
         self.play(Create(nlogn)); self.wait(0.3)
         self.play(Create(n2)); self.wait(0.3)
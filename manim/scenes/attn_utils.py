@@ -0,0 +1,142 @@
+"""Scaled dot-product attention computed for real and drawn as a heatmap.
+
+attention() embeds a token sequence, projects it to queries and keys for
+every head in one einsum and takes softmax(QKᵀ / √d) — the (heads, T, T)
+weights a transformer layer would produce (with fixed random projections;
+nothing is trained).  AttentionMap shows one head's T × T matrix as a
+single PixelGrid image; switching heads and spotlighting a query row
+rewrite that one pixel array, so 32+ tokens cost the same per frame as 4.
+
+Usage:
+    tokens = "the animal did not cross the street because it was tired".split()
+    amap = AttentionMap(tokens, attention(tokens, heads=4))
+    self.play(FadeIn(amap))
+    self.play(SweepQueries(amap), run_time=5)
+    self.play(SwitchHead(amap, 1))
+"""
+import hashlib
+
+from manim import *
+import numpy as np
+
+from la_utils import YELL, WHITE
+from cnn_utils import PixelGrid
+
+
+# ── Attention ────────────────────────────────────────────────────────────────
+def _token_vector(token, d):
+    """A fixed pseudo-embedding per token string (the same in every run)."""
+    seed = int.from_bytes(hashlib.sha256(token.lower().encode()).digest()[:8], "little")
+    return np.random.default_rng(seed).standard_normal(d)
+
+
+def positional(t, d):
+    """Sinusoidal position encodings, shape (t, d)."""
+    pos, i = np.arange(t)[:, None], np.arange(d // 2)[None]
+    angle = pos / 10000 ** (2 * i / d)
+    return np.concatenate([np.sin(angle), np.cos(angle)], axis=1)
+
+
+def embed(tokens, d_model=64):
+    """(T, d_model): token vectors plus positions."""
+    return np.stack([_token_vector(tok, d_model) for tok in tokens]) + positional(len(tokens), d_model)
+
+
+def softmax(x, axis=-1):
+    e = np.exp(x - x.max(axis=axis, keepdims=True))
+    return e / e.sum(axis=axis, keepdims=True)
+
+
+def attention(tokens, heads=4, d_model=64, d_head=16, causal=False, seed=0):
+    """Attention weights, shape (heads, T, T): row i is how query token i
+    spreads its attention over the keys; every row sums to 1."""
+    x = embed(tokens, d_model)
+    rng = np.random.default_rng(seed)
+    w_q, w_k = rng.standard_normal((2, heads, d_model, d_head)) / np.sqrt(d_model)
+    q = np.einsum("td,hde->hte", x, w_q)
+    k = np.einsum("td,hde->hte", x, w_k)
+    scores = q @ k.transpose(0, 2, 1) / np.sqrt(d_head)
+    if causal:
+        scores = np.where(np.tri(len(tokens), dtype=bool), scores, -np.inf)
+    return softmax(scores)
+
+
+# ── Heatmap ──────────────────────────────────────────────────────────────────
+class AttentionMap(Group):
+    """Heatmap of *weights* (heads, T, T) with the query tokens down the
+    left, the key tokens along the bottom and a "head k / H" title.
+
+    show() writes one head (optionally with one query row spotlit and the
+    rest dimmed) into the single image; the cells are never mobjects.
+    """
+    def __init__(self, tokens, weights, height=5.0, font_size=None, **kwargs):
+        self.tokens, self.weights, self.head = list(tokens), np.asarray(weights), 0
+        t = len(self.tokens)
+        self.vmax = float(np.quantile(self.weights, 0.99))    # a few peaks should not wash out the rest
+        self.grid = PixelGrid(self.weights[0], height=height, vmax=self.vmax, fg=YELL)
+        size = font_size or max(9, min(20, int(240 * height / 5 / t)))
+        rows = [Text(tok, font_size=size, color=WHITE) for tok in self.tokens]
+        cols = [Text(tok, font_size=size, color=WHITE).rotate(PI / 2) for tok in self.tokens]
+        for i, lbl in enumerate(rows):
+            lbl.next_to(self.grid.cell_center(i, 0), LEFT, buff=self.grid.cell_size() / 2 + 0.1)
+        for j, lbl in enumerate(cols):
+            lbl.next_to(self.grid.cell_center(t - 1, j), DOWN, buff=self.grid.cell_size() / 2 + 0.1)
+        self.row_labels, self.col_labels = Group(*rows), Group(*cols)
+        self.title = Text(self._title(0), font_size=22, color=WHITE).next_to(self.grid, UP, buff=0.15)
+        self.spot = Rectangle(width=self.grid.width, height=self.grid.cell_size(), color=WHITE,
+                              stroke_width=2).set_opacity(0)
+        super().__init__(self.grid, self.row_labels, self.col_labels, self.title, self.spot, **kwargs)
+
+    def _title(self, head):
+        return f"head {head + 1} / {len(self.weights)}"
+
+    def show(self, weights, query=None, dim=0.25):
+        """Draw a (T, T) *weights* matrix; with *query*, other rows at *dim*."""
+        if query is not None:
+            q = float(np.clip(query, 0, len(self.tokens) - 1))
+            rows = np.arange(len(self.tokens))[:, None]
+            weights = weights * np.clip(1 - np.abs(rows - q), dim, 1)     # a fractional query blends two rows
+            self.spot.set_stroke(opacity=1).move_to(self.grid.cell_center(q, (len(self.tokens) - 1) / 2))
+            for i, lbl in enumerate(self.row_labels):
+                lbl.set_opacity(1 if abs(i - q) < 0.5 else 0.4)
+        self.grid.set_array(weights)
+        return self
+
+    def clear_focus(self):
+        self.spot.set_stroke(opacity=0)
+        self.row_labels.set_opacity(1)
+        return self.show(self.weights[self.head])
+
+
+class SweepQueries(Animation):
+    """Spotlight the query rows *start* … *end* (default: all) in turn,
+    with the rest of the matrix dimmed."""
+    def __init__(self, amap, start=0, end=None, rate_func=linear, **kwargs):
+        self.start, self.end = start, len(amap.tokens) - 1 if end is None else end
+        super().__init__(amap, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        amap = self.mobject
+        amap.show(amap.weights[amap.head], query=self.start + (self.end - self.start) * self.rate_func(alpha))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.mobject.clear_focus()
+
+
+class SwitchHead(Animation):
+    """Cross-fade the heatmap to head *head*: one blended array per frame."""
+    def __init__(self, amap, head, **kwargs):
+        self.head = head
+        super().__init__(amap, **kwargs)
+
+    def begin(self):
+        amap = self.mobject
+        self.src, self.dst = amap.weights[amap.head], amap.weights[self.head]
+        amap.head = self.head
+        amap.title.become(Text(amap._title(self.head), font_size=22, color=WHITE).move_to(amap.title))
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.grid.set_array((1 - t) * self.src + t * self.dst)
@@ -4,7 +4,7 @@ Feynman – Chain Rule (Gold Standard)
 Uses Text/Cairo only — no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, plot_curve, tracked_dot, tracked_tangent, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 CURVE_COLOR = BLUE
@@ -13,37 +13,12 @@ AX_COLOR    = "#888888"
 
 
 def _mk_axes():
-    return Axes(
-        x_range=[-3.5, 3.5, 1], y_range=[-1.5, 10.5, 2],
-        x_length=8.5, y_length=5.0,
-        axis_config={"color": AX_COLOR, "stroke_width": 2,
-                     "include_tip": True, "tip_width": 0.15,
-                     "tip_height": 0.2, "include_ticks": True},
-    ).shift(LEFT * 0.5 + DOWN * 0.4)
-
-
-class ChainRuleScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=0.5)
-        self.wait(0.3)
+    return make_axes([-3.5, 3.5, 1], [-1.5, 10.5, 2], 8.5, 5.0, tip_size=(0.15, 0.2)).shift(LEFT * 0.5 + DOWN * 0.4)
 
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
 
-    def _rp(self, mob, y=0.0, x=4.2):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
+class ChainRuleScene(SixSectionScene):
+    FADE_TIME = 0.5
+    RP_X = 4.2
 
     def s1_hook(self):
         t1 = Text("The Chain Rule", font_size=52, color=WHITE)
@@ -93,8 +68,8 @@ class ChainRuleScene(Scene):
         g = lambda x: x ** 2          # inner function
         f_of_g = lambda x: np.sin(x ** 2)  # outer composed
 
-        curve_g = axes.plot(g, x_range=[-3.0, 3.0], color=INNER_COLOR, stroke_width=3.5)
-        curve_fg = axes.plot(f_of_g, x_range=[-3.0, 3.0], color=CURVE_COLOR, stroke_width=3.5)
+        curve_g = plot_curve(axes, g, x_range=[-3.0, 3.0], color=INNER_COLOR, stroke_width=3.5)
+        curve_fg = plot_curve(axes, f_of_g, x_range=[-3.0, 3.0], color=CURVE_COLOR, stroke_width=3.5)
 
         self.play(Create(axes), run_time=1.2); self.wait(0.3)
 
@@ -111,27 +86,11 @@ class ChainRuleScene(Scene):
 
         x_t = ValueTracker(-2.5)
 
-        def tan_fg():
-            xv = x_t.get_value()
-            dg = 2 * xv                              # g'(x)
-            df = np.cos(xv ** 2)                     # f'(g(x))
-            m  = df * dg                             # chain rule slope
-            yv = np.sin(xv ** 2)
-            norm = np.linalg.norm([1, m])
-            if norm < 0.05:
-                return VMobject()
-            return Line(
-                axes.c2p(xv - 0.8, yv + m * (-0.8)),
-                axes.c2p(xv + 0.8, yv + m * 0.8),
-                color=YELL, stroke_width=3.5,
-            )
-
-        def tan_dot():
-            xv = x_t.get_value()
-            return Dot(axes.c2p(xv, np.sin(xv ** 2)), color=YELL, radius=0.1)
-
-        sw_t = always_redraw(tan_fg)
-        sw_d = always_redraw(tan_dot)
+        fg  = lambda x: np.sin(x ** 2)
+        dfg = lambda x: np.cos(x ** 2) * 2 * x      # f'(g(x)) · g'(x): chain rule slope
+
+        sw_t = tracked_tangent(axes, x_t, fg, dfg, half_width=0.8)
+        sw_d = tracked_dot(axes, x_t, fg)
         self.play(Create(sw_t), Create(sw_d))
 
         r_sweep = Text("Chain rule slope:\nf'(g(x)) * g'(x)", font_size=22, color=YELL)
@@ -288,24 +247,13 @@ class ChainRuleScene(Scene):
 
         axes = _mk_axes()
         f_of_g = lambda x: np.sin(x ** 2)
-        curve_fg = axes.plot(f_of_g, x_range=[-3.0, 3.0], color=CURVE_COLOR, stroke_width=3.5)
+        curve_fg = plot_curve(axes, f_of_g, x_range=[-3.0, 3.0], color=CURVE_COLOR, stroke_width=3.5)
         x_t = ValueTracker(-2.5)
 
-        def tan_line():
-            xv = x_t.get_value()
-            m  = np.cos(xv ** 2) * 2 * xv
-            yv = np.sin(xv ** 2)
-            norm = abs(m)
-            if norm > 20:
-                return VMobject()
-            return Line(
-                axes.c2p(xv - 0.7, yv + m * (-0.7)),
-                axes.c2p(xv + 0.7, yv + m * 0.7),
-                color=YELL, stroke_width=3.5,
-            )
-
-        sw = always_redraw(tan_line)
-        sd = always_redraw(lambda: Dot(axes.c2p(x_t.get_value(), f_of_g(x_t.get_value())), color=YELL, radius=0.1))
+        slope = lambda x: np.cos(x ** 2) * 2 * x
+
+        sw = tracked_tangent(axes, x_t, f_of_g, slope, half_width=0.7, max_slope=20)
+        sd = tracked_dot(axes, x_t, f_of_g)
         self.play(Create(axes), Create(curve_fg), Create(sw), Create(sd), run_time=1.5)
 
         sm = Text(
@@ -0,0 +1,137 @@
+"""Real convolutions drawn as pixel arrays for the CNN scenes.
+
+conv2d() runs the actual operation (every output pixel in one einsum over
+a sliding-window view), and PixelGrid shows any 2D array as ONE
+ImageMobject with nearest-neighbour scaling, so a 64×64 image or a bank
+of feature maps is a handful of mobjects instead of thousands of Squares.
+SlideKernel sweeps the kernel window across the input and reveals the
+feature map as it goes, writing one pixel array per frame: the cost per
+frame does not grow with the image.
+
+Usage:
+    img = sample_image(64)
+    feature = conv2d(img, KERNELS["vertical edge"])
+    src, out = PixelGrid(img, height=3), PixelGrid(feature, height=3, signed=True)
+    self.play(SlideKernel(src, out, feature, 3), run_time=6)
+"""
+from manim import *
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from la_utils import BG, BLUE, YELL, RED, WHITE
+
+
+# ── Convolution ──────────────────────────────────────────────────────────────
+KERNELS = {
+    "vertical edge":   np.array([[1, 0, -1], [2, 0, -2], [1, 0, -1]], dtype=float),
+    "horizontal edge": np.array([[1, 2, 1], [0, 0, 0], [-1, -2, -1]], dtype=float),
+    "blur":            np.full((3, 3), 1 / 9),
+    "sharpen":         np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=float),
+}
+
+
+def conv2d(image, kernel, stride=1):
+    """'Valid' cross-correlation of a 2D *image* with *kernel* (as CNN layers compute it)."""
+    k = np.asarray(kernel, dtype=float)
+    windows = sliding_window_view(np.asarray(image, dtype=float), k.shape)[::stride, ::stride]
+    return np.einsum("ijkl,kl->ij", windows, k)
+
+
+def relu(x):
+    return np.maximum(x, 0)
+
+
+def max_pool(x, size=2):
+    """Non-overlapping *size* × *size* max pooling (edges that do not fill a window are dropped)."""
+    h, w = (d // size * size for d in x.shape)
+    return x[:h, :w].reshape(h // size, size, w // size, size).max(axis=(1, 3))
+
+
+def sample_image(size=64):
+    """A *size* × *size* greyscale test picture in [0, 1]: a disc, a bar, a
+    tilted square and a soft gradient, so edges run in every direction."""
+    y, x = (np.mgrid[0:size, 0:size] + 0.5) / size
+    soft = lambda d: np.clip(0.5 - d * size / 1.5, 0, 1)     # antialiased inside-test for signed distance d
+    img = 0.25 * x
+    img = np.maximum(img, soft(np.hypot(x - 0.3, y - 0.32) - 0.18))
+    img = np.maximum(img, 0.8 * soft(np.abs(x - 0.72) - 0.07) * soft(np.abs(y - 0.45) - 0.35))
+    u, v = (x - 0.32) + (y - 0.74), (x - 0.32) - (y - 0.74)
+    img = np.maximum(img, 0.6 * soft(np.maximum(np.abs(u), np.abs(v)) / np.sqrt(2) - 0.12))
+    return img
+
+
+# ── Pixel arrays ─────────────────────────────────────────────────────────────
+def _rgb(c):
+    return np.array(ManimColor(c).to_rgb()) * 255
+
+
+class PixelGrid(ImageMobject):
+    """A 2D array as one image *height* units tall, one cell per entry.
+
+    Unsigned arrays run *bg* → *fg* over [0, vmax]; signed=True maps
+    −vmax…vmax to *neg* … *bg* … *pos*.  vmax defaults to the array's own
+    largest magnitude.  set_array() swaps the data (same shape) in place.
+    """
+    def __init__(self, array, height=3.0, signed=False, vmax=None, fg=WHITE, neg=BLUE, pos=YELL, bg=BG,
+                 **kwargs):
+        self.signed = signed
+        self.vmax = vmax if vmax is not None else float(np.abs(array).max()) or 1.0
+        self.cols = [_rgb(c) for c in (neg, bg, pos if signed else fg)]
+        super().__init__(self._pixels(array), resampling_algorithm=RESAMPLING_ALGORITHMS["nearest"], **kwargs)
+        self.height = height
+        self.grid_shape = np.shape(array)
+
+    def _pixels(self, array, mask=None):
+        neg, bg, pos = self.cols
+        v = np.asarray(array, dtype=float) / self.vmax
+        v = np.clip(v, -1, 1) if self.signed else np.clip(v, 0, 1)
+        v = v[..., None]
+        rgb = bg + np.where(v < 0, -v * (neg - bg), v * (pos - bg))
+        if mask is not None:
+            rgb = np.where(mask[..., None], rgb, bg)
+        return np.dstack([rgb, np.full(v.shape[:2], 255.0)]).astype(np.uint8)
+
+    def set_array(self, array, mask=None):
+        """Show *array*; entries where *mask* is False are left blank."""
+        self.pixel_array = self._pixels(array, mask)
+        return self
+
+    def cell_center(self, i, j):
+        """Scene point at the middle of cell (row *i*, column *j*); fractional indices allowed."""
+        h, w = self.grid_shape
+        corner = self.get_corner(UL)
+        return corner + RIGHT * (j + 0.5) * self.width / w + DOWN * (i + 0.5) * self.height / h
+
+    def cell_size(self):
+        return self.height / self.grid_shape[0]
+
+
+class SlideKernel(Animation):
+    """Sweep a *k* × *k* window over *source* in raster order while *target*
+    fills in with *feature* (the conv2d result) up to the window's position.
+
+    Each frame moves two outline squares and writes one pixel array;
+    *feature* is computed up front, so nothing is convolved per frame.
+    """
+    def __init__(self, source, target, feature, k, stride=1, color=RED, rate_func=linear, **kwargs):
+        self.source, self.target, self.feature = source, target, np.asarray(feature)
+        self.k, self.stride = k, stride
+        s, t = source.cell_size(), target.cell_size()
+        self.window = Square(k * s, color=color, stroke_width=3)
+        self.cell = Square(t, color=color, stroke_width=3)
+        self.order = np.arange(self.feature.size).reshape(self.feature.shape)    # raster index per cell
+        # the outlines are part of the animated family, so the renderer redraws them every frame
+        super().__init__(Group(target, self.window, self.cell), rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        h, w = self.feature.shape
+        n = min(int(self.rate_func(alpha) * h * w), h * w - 1)
+        i, j = divmod(n, w)
+        self.target.set_array(self.feature, self.order <= n)
+        off = (self.k - 1) / 2
+        self.window.move_to(self.source.cell_center(i * self.stride + off, j * self.stride + off))
+        self.cell.move_to(self.target.cell_center(i, j))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        scene.remove(self.window, self.cell)
@@ -4,7 +4,7 @@ Feynman – Derivative (Gold Standard)
 Uses Text/Cairo only — no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, plot_curve, tracked_dot, tracked_line, tracked_tangent, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 CURVE_COLOR = BLUE
@@ -14,37 +14,12 @@ AX_COLOR    = "#888888"
 
 
 def _mk_axes():
-    return Axes(
-        x_range=[-3.5, 3.5, 1], y_range=[-0.3, 11, 2],
-        x_length=8.5, y_length=5.2,
-        axis_config={"color": AX_COLOR, "stroke_width": 2,
-                     "include_tip": True, "tip_width": 0.15,
-                     "tip_height": 0.2, "include_ticks": True},
-    ).shift(LEFT * 0.5 + DOWN * 0.6)
-
-
-class DerivativeScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=0.5)
-        self.wait(0.3)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.2):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
+    return make_axes([-3.5, 3.5, 1], [-0.3, 11, 2], 8.5, 5.2, tip_size=(0.15, 0.2)).shift(LEFT * 0.5 + DOWN * 0.6)
+
+
+class DerivativeScene(SixSectionScene):
+    FADE_TIME = 0.5
+    RP_X = 4.2
 
     # ── S1 — Hook ────────────────────────────────────────────────────────────
     def s1_hook(self):
@@ -81,7 +56,7 @@ class DerivativeScene(Scene):
         axes = _mk_axes()
         f  = lambda x: x ** 2
         df = lambda x: 2 * x
-        curve = axes.plot(f, x_range=[-3.2, 3.2], color=CURVE_COLOR, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-3.2, 3.2], color=CURVE_COLOR, stroke_width=3.5)
         self.play(Create(axes), run_time=1.5); self.wait(0.3)
         self.play(Create(curve), run_time=2); self.wait(0.5)
 
@@ -89,25 +64,20 @@ class DerivativeScene(Scene):
         x0 = 1.0
         h_tracker = ValueTracker(2.0)
 
-        def secant():
-            h = h_tracker.get_value()
+        def secant(h):
             x1, y1 = x0, f(x0)
             x2, y2 = x0 + h, f(x0 + h)
             if abs(h) < 0.01:
-                return VMobject()
+                return None
             slope = (y2 - y1) / h
             # extend line ±1.5 in x
             ext = 1.5
             p1 = axes.c2p(x0 - ext, y1 + slope * (-ext))
             p2 = axes.c2p(x0 + ext + h, y1 + slope * (ext + h))
-            return Line(p1, p2, color=SEC_COLOR, stroke_width=3)
-
-        def sec_dot():
-            h = h_tracker.get_value()
-            return Dot(axes.c2p(x0 + h, f(x0 + h)), color=SEC_COLOR, radius=0.1)
+            return p1, p2
 
-        sec_line = always_redraw(secant)
-        sec_dt   = always_redraw(sec_dot)
+        sec_line = tracked_line(h_tracker, secant, color=SEC_COLOR, stroke_width=3)
+        sec_dt   = tracked_dot(axes, h_tracker, f, offset=x0, color=SEC_COLOR)
         fixed_dot = Dot(axes.c2p(x0, f(x0)), color=TAN_COLOR, radius=0.12)
 
         r1 = Text("Secant line between two points.", font_size=24, color=SEC_COLOR)
@@ -140,21 +110,8 @@ class DerivativeScene(Scene):
         self.play(FadeOut(b2), FadeOut(r2), run_time=0.3)
         x_track = ValueTracker(-2.5)
 
-        def sweep_tangent():
-            xv = x_track.get_value()
-            mv = df(xv); yv = f(xv)
-            return Line(
-                axes.c2p(xv - 1.0, yv + mv * (-1.0)),
-                axes.c2p(xv + 1.0, yv + mv * 1.0),
-                color=TAN_COLOR, stroke_width=3.5,
-            )
-
-        def sweep_dot():
-            xv = x_track.get_value()
-            return Dot(axes.c2p(xv, f(xv)), color=TAN_COLOR, radius=0.1)
-
-        sw_tan = always_redraw(sweep_tangent)
-        sw_dot = always_redraw(sweep_dot)
+        sw_tan = tracked_tangent(axes, x_track, f, df, color=TAN_COLOR)
+        sw_dot = tracked_dot(axes, x_track, f, color=TAN_COLOR)
         self.play(FadeOut(tan_line), FadeOut(fixed_dot))
         self.play(Create(sw_tan), Create(sw_dot))
 
@@ -211,7 +168,7 @@ class DerivativeScene(Scene):
         axes = _mk_axes()
         f  = lambda x: x ** 3 - 3 * x
         df = lambda x: 3 * x ** 2 - 3
-        curve = axes.plot(f, x_range=[-2.4, 2.4], color=CURVE_COLOR, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-2.4, 2.4], color=CURVE_COLOR, stroke_width=3.5)
         self.play(Create(axes), Create(curve), run_time=2); self.wait(0.5)
 
         # derivative step-by-step on the right
@@ -294,21 +251,11 @@ class DerivativeScene(Scene):
         axes = _mk_axes()
         f  = lambda x: x ** 2
         df = lambda x: 2 * x
-        curve = axes.plot(f, x_range=[-3.1, 3.1], color=CURVE_COLOR, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-3.1, 3.1], color=CURVE_COLOR, stroke_width=3.5)
         x_t = ValueTracker(-2.0)
 
-        def tan():
-            xv = x_t.get_value(); mv = df(xv); yv = f(xv)
-            return Line(
-                axes.c2p(xv - 1.0, yv + mv * (-1.0)),
-                axes.c2p(xv + 1.0, yv + mv * 1.0),
-                color=TAN_COLOR, stroke_width=3.5,
-            )
-
-        def dt():
-            return Dot(axes.c2p(x_t.get_value(), f(x_t.get_value())), color=TAN_COLOR, radius=0.1)
-
-        sw = always_redraw(tan); sd = always_redraw(dt)
+        sw = tracked_tangent(axes, x_t, f, df, color=TAN_COLOR)
+        sd = tracked_dot(axes, x_t, f, color=TAN_COLOR)
         self.play(Create(axes), Create(curve), Create(sw), Create(sd), run_time=1.5)
 
         sm = Text(
@@ -10,8 +10,8 @@ class SupplyDemandScene(Scene):
         sec_label(self, "Supply and Demand")
         axes = Axes(x_range=[0, 4, 1], y_range=[0, 4, 1], x_length=5, y_length=4,
                     axis_config={"color": "#555", "include_numbers": False})
-        dd = axes.plot(lambda x: 3.5 - 0.7*x, x_range=[0.2, 4], color=RED)
-        ss = axes.plot(lambda x: 0.5 + 0.5*x, x_range=[0.2, 4], color=BLUE)
+        dd = plot_curve(axes, lambda x: 3.5 - 0.7*x, x_range=[0.2, 4], color=RED)
+        ss = plot_curve(axes, lambda x: 0.5 + 0.5*x, x_range=[0.2, 4], color=BLUE)
         self.play(Create(axes), Create(dd), Create(ss)); self.wait(0.5)
         txt = Text("Intersection = equilibrium.", font_size=28, color=WHITE)
         txt.move_to(RIGHT * 3)
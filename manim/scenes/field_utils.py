@@ -0,0 +1,221 @@
+"""Vectorised electric / magnetic fields for the phys_* scenes.
+
+Sources are arrays of rows (x, y, strength) in scene coordinates:
+
+  charges   point charges q            E = Σ q (r − rᵢ) / |r − rᵢ|³
+  wires     currents I out of the page B = Σ I ẑ × (r − rᵢ) / |r − rᵢ|²
+
+(unit constants).  field() evaluates every source at every point in one
+broadcast NumPy pass.  FieldView draws the result as an arrow grid (one
+filled VMobject) and as field lines (one stroked VMobject, all lines
+integrated together, one field evaluation per step for every line at
+once); both are cached per source configuration.  MoveSources moves the
+sources and redraws from the arrays each frame, with no per-arrow Python.
+
+Usage:
+    view = FieldView(charges=[(-1.5, 0, 1), (1.5, 0, -1)])
+    self.play(FadeIn(view))
+    self.play(MoveSources(view, charges=[(-1, 1, 1), (1, -1, -1)]), run_time=3)
+"""
+from manim import *
+import numpy as np
+
+from la_utils import BLUE, YELL, RED, WHITE, _arrow_field_points
+
+
+# ── Field evaluation ─────────────────────────────────────────────────────────
+def _sources(rows):
+    return np.asarray(rows, dtype=float).reshape(-1, 3)
+
+
+def field(points, charges=(), wires=()):
+    """(P, 2) field at the (P, 2+) *points*: every charge and wire at once."""
+    p = np.asarray(points, dtype=float)[:, :2]
+    out = np.zeros((len(p), 2))
+    for src, power in ((_sources(charges), 3), (_sources(wires), 2)):
+        if not len(src):
+            continue
+        d = p[:, None] - src[None, :, :2]                        # (P, N, 2)
+        r = np.maximum(np.linalg.norm(d, axis=2), 1e-6)
+        f = d * (src[None, :, 2] / r ** power)[..., None]
+        if power == 2:
+            f = np.stack([-f[..., 1], f[..., 0]], axis=2)          # ẑ × (r − rᵢ)
+        out += f.sum(axis=1)
+    return out
+
+
+def _direction(points, charges, wires):
+    f = field(points, charges, wires)
+    m = np.linalg.norm(f, axis=1, keepdims=True)
+    return np.divide(f, m, out=np.zeros_like(f), where=m > 0)
+
+
+def _config_key(charges, wires, *params):
+    return (np.round(_sources(charges), 6).tobytes(), np.round(_sources(wires), 6).tobytes(), params)
+
+
+# ── Arrow grid ───────────────────────────────────────────────────────────────
+def grid(x_range, y_range, step):
+    """(P, 2) grid points covering the ranges, centred in them."""
+    xs = [np.arange(lo, hi + 1e-9, step) for lo, hi in (x_range, y_range)]
+    xs = [x + ((hi - lo) - (x[-1] - x[0])) / 2 for x, (lo, hi) in zip(xs, (x_range, y_range))]
+    gx, gy = np.meshgrid(*xs)
+    return np.column_stack([gx.ravel(), gy.ravel()])
+
+
+def arrow_tips(points, charges, wires, max_length, scale, clearance):
+    """Tips for arrows at *points*: along the field, length max_length ·
+    (1 − e^(−|F|/scale)) so strong and weak regions both read.  Points
+    within *clearance* of a source get zero length."""
+    f = field(points, charges, wires)
+    m = np.linalg.norm(f, axis=1, keepdims=True)
+    length = max_length * (1 - np.exp(-m / scale))
+    src = np.concatenate([_sources(charges), _sources(wires)])[:, :2]
+    if len(src):
+        near = np.linalg.norm(points[:, None] - src[None], axis=2).min(axis=1) < clearance
+        length[near] = 0
+    return points + np.divide(f, m, out=np.zeros_like(f), where=m > 0) * length
+
+
+# ── Field lines ──────────────────────────────────────────────────────────────
+def line_seeds(charges=(), wires=(), per_charge=8, radius=0.2, rings=3):
+    """[(seed points, backward?)]: a circle of per_charge·|q| seeds round
+    each positive charge (or round the negative ones, traced backward, if
+    there are no positive ones), and *rings* seeds out from each wire."""
+    charges, wires = _sources(charges), _sources(wires)
+    groups = []
+    pos, neg = charges[charges[:, 2] > 0], charges[charges[:, 2] < 0]
+    src, backward = (pos, False) if len(pos) else (neg, True)
+    for x, y, q in src:
+        k = max(1, round(per_charge * abs(q)))
+        a = 2 * np.pi * (np.arange(k) + 0.5) / k
+        groups.append((np.column_stack([x + radius * np.cos(a), y + radius * np.sin(a)]), backward))
+    for x, y, _ in wires:
+        r = radius * 2 * (1 + np.arange(rings)) ** 1.4
+        groups.append((np.column_stack([x + r, np.full(rings, y)]), False))
+    return groups
+
+
+def trace_lines(seeds, charges=(), wires=(), backward=False, ds=0.06, max_steps=None,
+                bounds=((-7.2, 7.2), (-4.1, 4.1)), stop_radius=0.12):
+    """Integrate from every seed at once (midpoint rule on the unit field
+    direction).  A line stops when it leaves *bounds*, reaches a charge, or
+    closes on its seed (wire loops; the seed is appended, so the loop has
+    no gap).  *max_steps* defaults to the perimeter of *bounds* in steps,
+    enough for a loop round both wires of a pair.  Returns a list of (k, 2)
+    polylines."""
+    (x0, x1), (y0, y1) = bounds
+    if max_steps is None:
+        max_steps = int(2 * ((x1 - x0) + (y1 - y0)) / ds)
+    p = np.asarray(seeds, dtype=float).reshape(-1, 2).copy()
+    h = -ds if backward else ds
+    src = _sources(charges)[:, :2]
+    paths, alive = [p.copy()], np.ones(len(p), bool)
+    ends, closed = np.full(len(p), max_steps), np.zeros(len(p), bool)
+    for step in range(1, max_steps + 1):
+        mid = p + h / 2 * _direction(p, charges, wires)
+        p = np.where(alive[:, None], p + h * _direction(mid, charges, wires), p)
+        paths.append(p.copy())
+        stop = (p[:, 0] < x0) | (p[:, 0] > x1) | (p[:, 1] < y0) | (p[:, 1] > y1)
+        if len(src):
+            stop |= np.linalg.norm(p[:, None] - src[None], axis=2).min(axis=1) < stop_radius
+        if step > 10:
+            back = np.linalg.norm(p - paths[0], axis=1) < ds
+            closed |= alive & back
+            stop |= back
+        ends[alive & stop] = step
+        alive &= ~stop
+        if not alive.any():
+            break
+    paths = np.stack(paths, axis=1)                              # (S, steps+1, 2)
+    return [np.vstack([paths[i, :ends[i] + 1], paths[i, :1]]) if closed[i] else paths[i, :ends[i] + 1]
+            for i in range(len(p)) if ends[i] > 0]
+
+
+def _polyline_points(lines):
+    """Bezier points (straight segments) for the polylines, one subpath each."""
+    segs = [np.stack([l[:-1], l[1:]], axis=1) for l in lines if len(l) > 1]
+    if not segs:
+        return np.zeros((0, 3))
+    s = np.concatenate(segs)                                    # (M, 2, 2)
+    t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    pts = s[:, :1] + t * (s[:, 1:] - s[:, :1])
+    return np.concatenate([pts, np.zeros(pts.shape[:2] + (1,))], axis=2).reshape(-1, 3)
+
+
+# ── Mobjects ─────────────────────────────────────────────────────────────────
+_ARROWS = {}    # (sources, grid params) → arrow tips
+_LINES = {}     # (sources, line params) → polyline Bezier points
+
+class FieldView(VGroup):
+    """Arrow grid, field lines and source markers for *charges* / *wires*,
+    over *x_range* × *y_range* (scene units).
+
+    set_sources() redraws everything for new source positions/strengths;
+    a configuration already drawn is served from the cache (MoveSources
+    frames skip it, since each is drawn once).
+    """
+    def __init__(self, charges=(), wires=(), x_range=(-6.8, 6.8), y_range=(-3.8, 3.8), step=0.5,
+                 arrows=True, lines=True, arrow_color=BLUE, line_color=WHITE, per_charge=8, **kwargs):
+        self.x_range, self.y_range, self.step, self.per_charge = x_range, y_range, step, per_charge
+        self.points_grid = grid(x_range, y_range, step)
+        self.arrows = VMobject(fill_color=arrow_color, fill_opacity=0.85, stroke_width=0)
+        self.lines = VMobject(stroke_color=line_color, stroke_width=1.5, stroke_opacity=0.6, fill_opacity=0)
+        self.markers = VGroup()
+        self.show_arrows, self.show_lines = arrows, lines
+        super().__init__(self.lines, self.arrows, self.markers, **kwargs)
+        self.scale_ref = None
+        self.set_sources(charges, wires)
+
+    def set_sources(self, charges=(), wires=(), cache=True):
+        charges, wires = _sources(charges), _sources(wires)
+        if self.scale_ref is None:      # arrow length scale fixed by the first configuration
+            m = np.linalg.norm(field(self.points_grid, charges, wires), axis=1)
+            self.scale_ref = float(np.median(m)) or 1.0
+        self.charges, self.wires = charges, wires
+        if self.show_arrows:
+            key = _config_key(charges, wires, self.x_range, self.y_range, self.step, self.scale_ref)
+            tips = _ARROWS.get(key)
+            if tips is None:
+                tips = arrow_tips(self.points_grid, charges, wires, self.step * 0.8, self.scale_ref, self.step * 0.6)
+                if cache:
+                    _ARROWS[key] = tips
+            flat = lambda xy: np.column_stack([xy, np.zeros(len(xy))])
+            self.arrows.points = _arrow_field_points(flat(self.points_grid), flat(tips), 0.025, 0.12, 0.4)
+        if self.show_lines:
+            key = _config_key(charges, wires, self.x_range, self.y_range, self.per_charge)
+            pts = _LINES.get(key)
+            if pts is None:
+                bounds = ((self.x_range[0] - 0.3, self.x_range[1] + 0.3), (self.y_range[0] - 0.3, self.y_range[1] + 0.3))
+                lines = []
+                for seeds, backward in line_seeds(charges, wires, self.per_charge):
+                    lines += trace_lines(seeds, charges, wires, backward, bounds=bounds)
+                pts = _polyline_points(lines)
+                if cache:
+                    _LINES[key] = pts
+            self.lines.points = pts.copy()
+        self._place_markers()
+        return self
+
+    def _place_markers(self):
+        rows = [(x, y, RED if q > 0 else BLUE, 0.16) for x, y, q in self.charges]
+        rows += [(x, y, YELL, 0.12) for x, y, _ in self.wires]
+        if len(self.markers) != len(rows):
+            self.markers.submobjects = [Dot(radius=r, color=c) for _, _, c, r in rows]
+        for dot, (x, y, c, _) in zip(self.markers, rows):
+            dot.move_to([x, y, 0]).set_color(c)
+
+
+class MoveSources(Animation):
+    """Move/scale the sources of a FieldView to *charges* / *wires* (same
+    row counts), redrawing arrows and lines from the arrays every frame."""
+    def __init__(self, view, charges=None, wires=None, **kwargs):
+        self.start = (view.charges.copy(), view.wires.copy())
+        self.end = (view.charges if charges is None else _sources(charges),
+                    view.wires if wires is None else _sources(wires))
+        super().__init__(view, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        c, w = (a + (b - a) * t for a, b in zip(self.start, self.end))
+        self.mobject.set_sources(c, w, cache=alpha in (0, 1))
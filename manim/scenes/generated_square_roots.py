@@ -1,5 +1,5 @@
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, plot_curve, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 CURVE_COLOR = BLUE
@@ -8,36 +8,11 @@ SEC_COLOR   = RED
 AX_COLOR    = "#888888"
 
 def _mk_axes():
-    return Axes(
-        x_range=[-3.5, 3.5, 1], y_range=[-0.3, 11, 2],
-        x_length=8.5, y_length=5.2,
-        axis_config={"color": AX_COLOR, "stroke_width": 2,
-                     "include_tip": True, "tip_width": 0.15,
-                     "tip_height": 0.2, "include_ticks": True},
-    ).shift(LEFT * 0.5 + DOWN * 0.6)
-
-class GeneratedScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=0.5)
-        self.wait(0.3)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.2):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
+    return make_axes([-3.5, 3.5, 1], [-0.3, 11, 2], 8.5, 5.2, tip_size=(0.15, 0.2)).shift(LEFT * 0.5 + DOWN * 0.6)
+
+class GeneratedScene(SixSectionScene):
+    FADE_TIME = 0.5
+    RP_X = 4.2
 
     # ── S1 — Hook ────────────────────────────────────────────────────────────
     def s1_hook(self):
@@ -67,7 +42,7 @@ class GeneratedScene(Scene):
 
         axes = _mk_axes()
         f  = lambda x: x ** 2
-        curve = axes.plot(f, x_range=[-3.2, 3.2], color=CURVE_COLOR, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-3.2, 3.2], color=CURVE_COLOR, stroke_width=3.5)
         self.play(Create(axes), run_time=1.5); self.wait(0.3)
         self.play(Create(curve), run_time=2); self.wait(0.5)
 
@@ -177,7 +152,7 @@ class GeneratedScene(Scene):
 
         axes = _mk_axes()
         f  = lambda x: x ** 2
-        curve = axes.plot(f, x_range=[-3.1, 3.1], color=CURVE_COLOR, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-3.1, 3.1], color=CURVE_COLOR, stroke_width=3.5)
         self.play(Create(axes), Create(curve), run_time=1.5)
 
         sm = Text(
@@ -3,39 +3,14 @@ Feynman – The Integral (Gold Standard)
 6-section narrative, 3-5 minutes. Text/Cairo only, no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, plot_curve, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 AX_COLOR = "#888888"
 
-class IntegralScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.3)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
-
+class IntegralScene(SixSectionScene):
     def _mk_axes(self, xr=(-0.5, 4.5, 1), yr=(-0.5, 4.5, 1)):
-        return Axes(
-            x_range=[*xr], y_range=[*yr],
-            x_length=7.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2,
-                         "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        return make_axes(xr, yr).shift(LEFT * 1.5 + DOWN * 0.5)
 
     def s1_hook(self):
         t1 = Text("The Integral", font_size=52, color=WHITE)
@@ -63,11 +38,9 @@ class IntegralScene(Scene):
 
     def s2_geometry(self):
         sec_label(self, "Riemann Sums to Exact Area")
-        axes = Axes(x_range=[-0.3,4,1], y_range=[-0.2,6.5,1], x_length=8.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 0.5 + DOWN * 0.5)
+        axes = make_axes([-0.3,4,1], [-0.2,6.5,1], 8.0, 5.0).shift(LEFT * 0.5 + DOWN * 0.5)
         f = lambda x: 0.4*x**2 + 0.5
-        curve = axes.plot(f, x_range=[0.0,3.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[0.0,3.8], color=BLUE, stroke_width=3.5)
         self.play(Create(axes), run_time=2.0); self.wait(0.3)
         self.play(Create(curve), run_time=2.0); self.wait(0.5)
         a, b = 0.3, 3.5
@@ -140,11 +113,9 @@ class IntegralScene(Scene):
 
     def s4_example(self):
         sec_label(self, "Worked Example: integral(0 to 2) x^2 dx")
-        axes = Axes(x_range=[-0.3,4,1], y_range=[-0.2,6.5,1], x_length=8.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 0.5 + DOWN * 0.5)
+        axes = make_axes([-0.3,4,1], [-0.2,6.5,1], 8.0, 5.0).shift(LEFT * 0.5 + DOWN * 0.5)
         f = lambda x: x**2
-        curve = axes.plot(f, x_range=[0.0,3.5], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[0.0,3.5], color=BLUE, stroke_width=3.5)
         region = axes.get_area(curve, x_range=[0,2], color=BLUE, opacity=0.4)
         self.play(Create(axes), Create(curve), run_time=2.0)
         self.play(FadeIn(region)); self.wait(0.5)
@@ -194,11 +165,9 @@ class IntegralScene(Scene):
 
     def s6_summary(self):
         sec_label(self, "Summary")
-        axes = Axes(x_range=[-0.3,4,1], y_range=[-0.2,6.5,1], x_length=8.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 0.5 + DOWN * 0.5)
+        axes = make_axes([-0.3,4,1], [-0.2,6.5,1], 8.0, 5.0).shift(LEFT * 0.5 + DOWN * 0.5)
         f = lambda x: 0.4*x**2 + 0.5
-        curve = axes.plot(f, x_range=[0.0,3.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[0.0,3.8], color=BLUE, stroke_width=3.5)
         region = axes.get_area(curve, x_range=[0.3,3.5], color=BLUE, opacity=0.45)
         self.play(Create(axes), Create(curve), FadeIn(region), run_time=2.0); self.wait(0.5)
         sm = Text(
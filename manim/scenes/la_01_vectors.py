@@ -3,39 +3,14 @@ Feynman – Vectors (Gold Standard)
 6-section narrative, 3-5 minutes. Text/Cairo only, no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 AX_COLOR = "#888888"
 
-class VectorsScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.3)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
-
+class VectorsScene(SixSectionScene):
     def _mk_axes(self, xr=(-0.5, 4.5, 1), yr=(-0.5, 4.5, 1)):
-        return Axes(
-            x_range=[*xr], y_range=[*yr],
-            x_length=7.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2,
-                         "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        return make_axes(xr, yr).shift(LEFT * 1.5 + DOWN * 0.5)
 
     def s1_hook(self):
         t1 = Text("Vectors", font_size=52, color=WHITE)
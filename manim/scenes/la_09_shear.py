@@ -1,30 +1,14 @@
 """Feynman – Shear Transformation (Gold Standard) – 6-section, 3-5 min, Text/Cairo only."""
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, vec
+from la_utils import text_box, sec_label, SixSectionScene, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, make_axes, vec
 import numpy as np
 AX_COLOR = "#888888"
 
-class ShearScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.6)
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
+class ShearScene(SixSectionScene):
+    GAP = 0.6
+
     def _axes(self, xr=(-0.3,4.5,1), yr=(-0.3,4.5,1)):
-        return Axes(x_range=[*xr], y_range=[*yr], x_length=7.2, y_length=5.0,
-            axis_config={"color": AX_COLOR,"stroke_width":2,"include_tip":True,"include_ticks":True}
-        ).shift(LEFT*1.5+DOWN*0.5)
+        return make_axes(xr, yr, 7.2, 5.0).shift(LEFT*1.5+DOWN*0.5)
 
     def s1_hook(self):
         t = Text("Shear Transformations", font_size=44, color=WHITE).move_to(UP*0.5)
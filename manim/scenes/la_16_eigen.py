@@ -29,43 +29,16 @@ def _arr(plane, start, end, color=BLUE, sw=3, tr=0.18):
 
 # ── Scene ─────────────────────────────────────────────────────────────────────
 
-class EigenScene(Scene):
-    M = np.array([[3, 1], [0, 2]], dtype=float)
+class EigenScene(SixSectionScene):
+    FADE_TIME = 0.5
+    RP_X = 4.1
 
-    # ── Lifecycle ────────────────────────────────────────────────────────
-    def construct(self):
-        self.camera.background_color = BG
-
-        self.s1_hook()
-        self._fade_all()
-        self.s2_geometry()
-        self._fade_all()
-        self.s3_notation()
-        self._fade_all()
-        self.s4_example()
-        self._fade_all()
-        self.s5_insight()
-        self._fade_all()
-        self.s6_summary()
+    M = np.array([[3, 1], [0, 2]], dtype=float)
 
     # ── Utility ──────────────────────────────────────────────────────────
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=0.5)
-        self.wait(0.3)
-
     def _sec(self, title):
         sec_label(self, title)
 
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.1):
-        """Position mob in the right text panel."""
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
-
     # ── Section 1 — Hook (~38 s) ─────────────────────────────────────────
     def s1_hook(self):
         # Title card
@@ -152,14 +125,13 @@ class EigenScene(Scene):
         plane = _mk_plane()
         self.play(Create(plane), run_time=1.5); self.wait(0.5)
 
-        # 8 unit vectors
+        # 8 unit vectors, one mobject
         n = 8
-        tips = [(np.cos(2 * PI * i / n), np.sin(2 * PI * i / n)) for i in range(n)]
-        arrows = [a for a in [_arr(plane, (0, 0), t, BLUE, sw=2) for t in tips]
-                  if isinstance(a, Arrow)]
+        angles = 2 * PI * np.arange(n) / n
+        tips = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        ring = ArrowField(plane, np.zeros_like(tips), tips, color=BLUE, stroke_width=2, tip_ratio=0.18)
 
-        self.play(AnimationGroup(*[GrowArrow(a) for a in arrows], lag_ratio=0.1),
-                  run_time=1.5); self.wait(0.5)
+        self.play(GrowFromPoint(ring, plane.c2p(0, 0)), run_time=1.5); self.wait(0.5)
 
         r1 = Text("Many vectors.\nMany directions.", font_size=26, color=BLUE)
         self._rp(r1, y=1.5)
@@ -174,20 +146,14 @@ class EigenScene(Scene):
         self.play(FadeIn(b2), Write(r2)); self.wait(0.8)
         self.play(FadeOut(b2), FadeOut(r2), run_time=0.3); self.wait(0.2)
 
-        trans_tips = [(self.M @ np.array(t)).tolist() for t in tips]
-        arrows_t = [_arr(plane, (0, 0), tuple(tt), RED, sw=2)
-                    for tt in trans_tips]
-        pairs = [(arrows[i], arrows_t[i])
-                 for i in range(min(len(arrows), len(arrows_t)))
-                 if isinstance(arrows_t[i], Arrow)]
-        self.play(*[Transform(a, b) for a, b in pairs], run_time=4)
+        self.play(Transform(ring, ring.transformed(self.M, color=RED)), run_time=4)
         self.wait(1.5)
 
         r3 = Text("Every vector changed direction.\nThey all rotated.", font_size=26, color=RED)
         self._rp(r3, y=1.5)
         b3 = self._box(r3, border=RED)
         self.play(FadeIn(b3), Write(r3)); self.wait(2.5)
-        self.play(*[FadeOut(a) for a in arrows], FadeOut(b3), FadeOut(r3),
+        self.play(FadeOut(ring), FadeOut(b3), FadeOut(r3),
                   run_time=0.5); self.wait(0.4)
 
         # The question
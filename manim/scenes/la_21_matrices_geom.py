@@ -21,37 +21,13 @@ def _arr(plane, start, end, color=BLUE, sw=3, tr=0.18):
                  stroke_width=sw, max_tip_length_to_length_ratio=tr)
 
 
-class MatricesGeomScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook()
-        self._fade_all()
-        self.s2_geometry()
-        self._fade_all()
-        self.s3_notation()
-        self._fade_all()
-        self.s4_example()
-        self._fade_all()
-        self.s5_insight()
-        self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=0.5)
-        self.wait(0.3)
+class MatricesGeomScene(SixSectionScene):
+    FADE_TIME = 0.5
+    RP_X = 4.1
 
     def _sec(self, title):
         sec_label(self, title)
 
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.1):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
-
     # ── Section 1 — Hook ─────────────────────────────────────────────────
     def s1_hook(self):
         t1 = Text("What Do Matrices Actually Do?", font_size=44, color=WHITE)
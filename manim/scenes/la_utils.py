@@ -1,9 +1,14 @@
 """Shared utilities for linear-algebra Manim scenes.
 
-Colour palette, plane factory, arrow helper, text-box helpers.
-All scenes import * from here.
+Colour palette, plane/axes factories, adaptive function plots, arrow
+helpers (one-off and batched), point clouds, network edge bundles,
+tracker-bound primitives, text-box helpers and the
+SixSectionScene base.  All scenes import * from here.
+
+Importing this module does not import manim.  The palette and array-only
+geometry live here; everything built on manim mobjects lives in
+manim_utils.py and is loaded, with manim, on first use of one of its names.
 """
-from manim import *
 import numpy as np
 
 # ── Colour palette (spec-exact) ──────────────────────────────────────────────
@@ -18,52 +23,82 @@ WHITE = "#FFFFFE"   # near-white text
 # Aliases
 CORAL = RED
 AXIS_C = "#555555"
+AX_COLOR = "#888888"   # function-plot axes (make_axes)
+
+# ── Array-only geometry ──────────────────────────────────────────────────────
+def _arrow_field_points(s, e, shaft_width, tip_length, tip_ratio, min_length=0.08):
+    """Bezier points for N arrows (tails *s*, tips *e*, both (N,3)): a quad
+    shaft and a triangle tip each, 7 straight edges of 4 points per arrow."""
+    d = e - s
+    length = np.linalg.norm(d, axis=1, keepdims=True)
+    u = np.divide(d, length, out=np.zeros_like(d), where=length > 0)
+    n = np.stack([-u[:, 1], u[:, 0], np.zeros(len(u))], axis=1)
+    tl = np.minimum(tip_length, tip_ratio * length)
+    b = e - u * tl
+    w, tw = n * (np.reshape(shaft_width, (-1, 1)) / 2), n * (tl / 2)
+    corners = [s + w, b + w, b - w, s - w, s + w, b + tw, e, b - tw, b + tw]
+    starts = np.stack(corners[0:4] + corners[5:8], axis=1)
+    ends = np.stack(corners[1:5] + corners[6:9], axis=1)
+    t = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+    pts = starts[:, :, None] + t * (ends - starts)[:, :, None]
+    pts[length[:, 0] < min_length] = s[length[:, 0] < min_length][:, None, None]  # too short: collapse
+    return pts.reshape(-1, 3)
+
+def _adaptive_samples(f, a, b, sx=1.0, sy=1.0, tol=0.01, step=None, max_depth=8):
+    """Polyline (x, f(x)) on [a, b], dense only where the curve bends.
+
+    Starts from the uniform *step* grid axes.plot() would use (default 64
+    pieces), so no bend or period narrower than the stock sampling is
+    missed.  Each interval is halved until its midpoint lies within *tol*
+    scene units of the chord (*sx*, *sy*: scene units per x / y unit), then
+    points on straight runs are dropped again, so a line ends up as its two
+    endpoints.  The result is meant to be drawn as corners: the points kept
+    at a kink are the kink itself.
+    """
+    def off_chord(p0, p1, p):
+        cx, cy = sx * (p1[0] - p0[0]), sy * (p1[1] - p0[1])
+        px, py = sx * (p[0] - p0[0]), sy * (p[1] - p0[1])
+        return abs(cx * py - cy * px) / max(np.hypot(cx, cy), 1e-12)
 
-# ── NumberPlane factory ──────────────────────────────────────────────────────
-def make_plane(x_range=(-5, 5, 1), y_range=(-4, 4, 1)):
-    """Dark-themed NumberPlane — no axis numbers, #333333 grid."""
-    return NumberPlane(
-        x_range=x_range,
-        y_range=y_range,
-        background_line_style={"stroke_color": GREY, "stroke_width": 1},
-        axis_config={
-            "stroke_color": AXIS_C,
-            "stroke_width": 1.5,
-            "include_numbers": False,
-            "include_tip": False,
-        },
-    )
+    def split(p0, p1, depth):
+        xm = (p0[0] + p1[0]) / 2
+        pm = (xm, float(f(xm)))
+        if depth >= max_depth or off_chord(p0, p1, pm) <= tol:
+            return []
+        return split(p0, pm, depth + 1) + [pm] + split(pm, p1, depth + 1)
 
-# ── Arrow helper ─────────────────────────────────────────────────────────────
-def vec(plane, tip, color=BLUE, base=(0, 0), stroke_width=3, tip_ratio=0.18):
-    """Arrow from plane-coords *base* to *tip*; returns VMobject() if zero-length."""
-    s = plane.c2p(*base)
-    e = plane.c2p(*tip)
-    if np.linalg.norm(e - s) < 0.08:
-        return VMobject()
-    return Arrow(s, e, buff=0, color=color,
-                 stroke_width=stroke_width,
-                 max_tip_length_to_length_ratio=tip_ratio)
+    pieces = 64 if not step else max(1, int(np.ceil((b - a) / step - 1e-9)))
+    xs = np.linspace(a, b, pieces + 1)
+    pts = [(xs[0], float(f(xs[0])))]
+    for x in xs[1:]:
+        p1 = (x, float(f(x)))
+        pts += split(pts[-1], p1, 0) + [p1]
 
-# ── Text helpers ─────────────────────────────────────────────────────────────
-def header(text, size=44, color=WHITE):
-    return Text(text, font_size=size, color=color).to_edge(UP, buff=0.35)
+    keep, run = [pts[0]], []
+    for p, nxt in zip(pts[1:-1], pts[2:]):
+        run.append(p)
+        if any(off_chord(keep[-1], nxt, q) > tol / 4 for q in run):
+            keep.append(p)
+            run = []
+    keep.append(pts[-1])
+    return np.array(keep)
 
-def label(text, point, direction=UP, color=BLUE, size=28):
-    return Text(text, font_size=size, color=color).next_to(point, direction, buff=0.15)
+# ── manim-backed helpers (manim_utils.py, loaded on first use) ───────────────
+_LAZY = (
+    "make_plane", "make_axes", "plot_curve", "vec", "ArrowField", "Scatter",
+    "EdgeBundle", "EdgePulse",
+    "tracked_dot", "tracked_line", "tracked_tangent",
+    "header", "label", "text_box", "sec_label", "SixSectionScene",
+)
 
-def text_box(mob, bg=BG, border=WHITE, buff=0.28):
-    """Wrap *mob* in a filled SurroundingRectangle (clean text box)."""
-    return SurroundingRectangle(
-        mob, color=border, buff=buff,
-        fill_color=bg, fill_opacity=0.92,
-        corner_radius=0.06,
-    )
+__all__ = [
+    "np", "BG", "BLUE", "YELL", "RED", "GREEN", "GREY", "WHITE", "CORAL", "AXIS_C", "AX_COLOR",
+    *_LAZY,
+]
 
-def sec_label(scene, title, color=BLUE, size=38):
-    """Flash a section title on screen, then fade it away."""
-    lbl = Text(title, font_size=size, color=color)
-    scene.play(FadeIn(lbl), run_time=0.6)
-    scene.wait(1.2)
-    scene.play(FadeOut(lbl), run_time=0.4)
-    scene.wait(0.3)
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import manim_utils
+    globals().update({n: getattr(manim_utils, n) for n in _LAZY})
+    return globals()[name]
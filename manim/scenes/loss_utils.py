@@ -0,0 +1,224 @@
+"""Loss surfaces, contours and real optimiser runs for the descent scenes.
+
+A surface is evaluated on a grid once (loss_grid) and its contour lines
+come from one vectorised marching-squares pass over every cell (contour
+segments), both cached.  descend() runs plain gradient descent, momentum
+or Adam for a whole batch of starts / learning rates at once and returns
+the trajectories, so a scene only replays stored points:
+
+  ContourMap    every level of a surface, one stroked VMobject per level
+  DescentPaths  one trail + dot per run, drawn up to a (fractional) step
+  RaceDescent   advances all runs together; the surface is never
+                re-evaluated per frame
+
+Usage:
+    axes = make_axes((-2, 2, 1), (-1, 3, 1))
+    paths = descend(rosenbrock_grad, [(-1.5, 2)] * 3, method=["gd", "momentum", "adam"], lr=[0.01, 0.004, 0.1])
+    self.add(ContourMap(axes, rosenbrock, (-2, 2), (-1, 3)))
+    race = DescentPaths(axes, paths, colors=[BLUE, GREEN, RED])
+    self.play(RaceDescent(race), run_time=6)
+"""
+from manim import *
+import numpy as np
+
+from la_utils import BLUE, YELL
+from manim_utils import _function_key, _plane_frame
+
+
+# ── Surfaces ─────────────────────────────────────────────────────────────────
+def rosenbrock(x, y, b=10.0):
+    """Banana valley, minimum 0 at (1, 1).  b=10 keeps it drawable (the classic is 100)."""
+    return (1 - x) ** 2 + b * (y - x ** 2) ** 2
+
+
+def rosenbrock_grad(p, b=10.0):
+    x, y = p[..., 0], p[..., 1]
+    return np.stack([-2 * (1 - x) - 4 * b * x * (y - x ** 2), 2 * b * (y - x ** 2)], axis=-1)
+
+
+def bowl(x, y, a=1.0, c=8.0):
+    """Elongated quadratic a·x² + c·y², minimum 0 at the origin."""
+    return a * x ** 2 + c * y ** 2
+
+
+def bowl_grad(p, a=1.0, c=8.0):
+    return np.stack([2 * a * p[..., 0], 2 * c * p[..., 1]], axis=-1)
+
+
+_GRIDS = {}     # (function, ranges, n) → (xs, ys, z)
+_CONTOURS = {}  # (function, ranges, n, level) → (M, 2, 2) segments
+
+def loss_grid(f, x_range, y_range, n=160):
+    """(xs, ys, z) with z[i, j] = f(xs[j], ys[i]): the only place *f* is evaluated."""
+    fkey = _function_key(f)            # None: f reads something mutable, never cached
+    key = (fkey, tuple(x_range[:2]), tuple(y_range[:2]), n)
+    grid = _GRIDS.get(key) if fkey is not None else None
+    if grid is None:
+        xs, ys = np.linspace(*x_range[:2], n), np.linspace(*y_range[:2], n)
+        grid = (xs, ys, f(*np.meshgrid(xs, ys)))
+        if fkey is not None:
+            _GRIDS[key] = grid
+    return grid
+
+
+# ── Marching squares ─────────────────────────────────────────────────────────
+# Cell corners a (bottom-left), b (bottom-right), c (top-right), d (top-left)
+# give case a + 2b + 4c + 8d (corner above the level); edges are numbered
+# 0 bottom, 1 right, 2 top, 3 left.  Each case crosses at most two segments.
+_SEGMENTS = np.array([
+    [[-1, -1], [-1, -1]], [[0, 3], [-1, -1]], [[0, 1], [-1, -1]], [[1, 3], [-1, -1]],
+    [[1, 2], [-1, -1]],   [[0, 3], [1, 2]],   [[0, 2], [-1, -1]], [[2, 3], [-1, -1]],
+    [[2, 3], [-1, -1]],   [[0, 2], [-1, -1]], [[0, 1], [2, 3]],   [[1, 2], [-1, -1]],
+    [[1, 3], [-1, -1]],   [[0, 1], [-1, -1]], [[0, 3], [-1, -1]], [[-1, -1], [-1, -1]],
+])
+
+def contour_segments(xs, ys, z, level):
+    """(M, 2, 2) line segments of z = *level*, from every grid cell at once."""
+    a, b, c, d = z[:-1, :-1], z[:-1, 1:], z[1:, 1:], z[1:, :-1]
+    case = (a > level) + 2 * (b > level) + 4 * (c > level) + 8 * (d > level)
+    seg = _SEGMENTS[case]                                            # (ny-1, nx-1, 2, 2)
+    # saddles: when the cell centre is above the level, its high corners join up
+    centre_high = (a + b + c + d) / 4 > level
+    seg[(case == 5) & centre_high] = [[0, 1], [2, 3]]
+    seg[(case == 10) & centre_high] = [[0, 3], [1, 2]]
+
+    def cross(p, q):
+        return np.clip(np.divide(level - p, q - p, out=np.full(p.shape, 0.5), where=q != p), 0, 1)
+
+    x0, x1 = xs[None, :-1], xs[None, 1:]
+    y0, y1 = ys[:-1, None], ys[1:, None]
+    x0, x1, y0, y1 = (np.broadcast_to(v, a.shape) for v in (x0, x1, y0, y1))
+    edges = np.stack([
+        np.stack([x0 + cross(a, b) * (x1 - x0), y0], axis=-1),         # bottom
+        np.stack([x1, y0 + cross(b, c) * (y1 - y0)], axis=-1),         # right
+        np.stack([x0 + cross(d, c) * (x1 - x0), y1], axis=-1),         # top
+        np.stack([x0, y0 + cross(a, d) * (y1 - y0)], axis=-1),         # left
+    ], axis=2)                                                       # (ny-1, nx-1, 4, 2)
+    seg, edges = seg.reshape(-1, 2, 2), edges.reshape(-1, 4, 2)
+    out = []
+    for slot in range(2):
+        e = seg[:, slot]
+        keep = e[:, 0] >= 0
+        cells = np.flatnonzero(keep)
+        out.append(np.stack([edges[cells, e[keep, 0]], edges[cells, e[keep, 1]]], axis=1))
+    return np.concatenate(out)
+
+
+def contours(f, x_range, y_range, levels, n=160):
+    """{level: segments} for each of *levels*, evaluated and traced once per surface."""
+    xs, ys, z = loss_grid(f, x_range, y_range, n)
+    fkey = _function_key(f)
+    key = (fkey, tuple(x_range[:2]), tuple(y_range[:2]), n)
+    out = {}
+    for level in levels:
+        segs = _CONTOURS.get(key + (float(level),)) if fkey is not None else None
+        if segs is None:
+            segs = contour_segments(xs, ys, z, level)
+            if fkey is not None:
+                _CONTOURS[key + (float(level),)] = segs
+        out[float(level)] = segs
+    return out
+
+
+def log_levels(f, x_range, y_range, count=12, n=160):
+    """*count* levels spaced evenly in log between the grid's min and max."""
+    z = loss_grid(f, x_range, y_range, n)[2]
+    lo = max(float(z.min()), float(z.max()) * 1e-4)
+    return np.geomspace(lo * 1.5, float(z.max()) * 0.6, count)
+
+
+# ── Optimisers ───────────────────────────────────────────────────────────────
+def descend(grad, starts, method="gd", lr=0.01, steps=100, beta=0.9, beta1=0.9, beta2=0.999, eps=1e-8,
+            bound=1e3):
+    """Trajectories (runs, steps+1, dims) for every start at once.
+
+    *method* ("gd", "momentum" or "adam") and *lr* may be one value or one
+    per run, so a learning-rate sweep or an optimiser race is one call.
+    A run that diverges (|p| reaches *bound*) stops where it is.
+    """
+    p = np.array(starts, dtype=float)
+    p = p.reshape(len(p), -1)
+    runs = len(p)
+    lr = np.broadcast_to(np.asarray(lr, dtype=float), (runs,))[:, None]
+    method = np.broadcast_to(np.asarray(method), (runs,))[:, None]
+    v, m, s = np.zeros_like(p), np.zeros_like(p), np.zeros_like(p)
+    alive = np.ones(runs, bool)
+    out = [p.copy()]
+    for t in range(1, steps + 1):
+        g = grad(p)
+        v = beta * v + g
+        m = beta1 * m + (1 - beta1) * g
+        s = beta2 * s + (1 - beta2) * g * g
+        adam = (m / (1 - beta1 ** t)) / (np.sqrt(s / (1 - beta2 ** t)) + eps)
+        step = lr * np.where(method == "momentum", v, np.where(method == "adam", adam, g))
+        p = np.where(alive[:, None], p - step, p)
+        alive &= np.all(np.isfinite(p) & (np.abs(p) < bound), axis=1)
+        out.append(p.copy())
+    return np.stack(out, axis=1)
+
+
+# ── Mobjects ─────────────────────────────────────────────────────────────────
+def _segment_points(o, ex, ey, segs):
+    """Bezier points for (M, 2, 2) segments in axes coordinates, one subpath each."""
+    t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+    xy = segs[:, :1] + t * (segs[:, 1:] - segs[:, :1])               # (M, 4, 2)
+    return (o + xy[..., :1] * ex + xy[..., 1:] * ey).reshape(-1, 3)
+
+
+class ContourMap(VGroup):
+    """Contours of *f* over the axes' *x_range* × *y_range*: one stroked
+    VMobject per level, shaded from *low* (bottom of the valley) to *high*."""
+    def __init__(self, axes, f, x_range, y_range, levels=None, n=160, low=YELL, high=BLUE,
+                 stroke_width=1.5, **kwargs):
+        levels = log_levels(f, x_range, y_range, n=n) if levels is None else levels
+        o, ex, ey = _plane_frame(axes)
+        parts = []
+        for i, (level, segs) in enumerate(contours(f, x_range, y_range, levels, n).items()):
+            part = VMobject(stroke_color=interpolate_color(ManimColor(low), ManimColor(high), i / max(len(levels) - 1, 1)),
+                            stroke_width=stroke_width, fill_opacity=0)
+            part.points = _segment_points(o, ex, ey, segs)
+            parts.append(part)
+        super().__init__(*parts, **kwargs)
+
+
+class DescentPaths(VGroup):
+    """Trails and dots for (runs, steps+1, 2) *paths* on *axes*, shown up to
+    step show(s); points outside *clip* (axes ranges) are pinned to its edge."""
+    def __init__(self, axes, paths, colors=(BLUE,), clip=None, dot_radius=0.09, stroke_width=3, **kwargs):
+        o, ex, ey = _plane_frame(axes)
+        p = np.asarray(paths, dtype=float)
+        if clip is None:
+            clip = (axes.x_range[:2], axes.y_range[:2])
+        p = np.stack([np.clip(p[..., 0], *clip[0]), np.clip(p[..., 1], *clip[1])], axis=-1)
+        self.scene_paths = o + p[..., :1] * ex + p[..., 1:] * ey      # (runs, steps+1, 3)
+        colors = [colors[i % len(colors)] for i in range(len(p))]
+        self.trails = VGroup(*[VMobject(stroke_color=c, stroke_width=stroke_width, fill_opacity=0) for c in colors])
+        self.dots = VGroup(*[Dot(radius=dot_radius, color=c) for c in colors])
+        super().__init__(self.trails, self.dots, **kwargs)
+        self.show(0)
+
+    @property
+    def steps(self):
+        return self.scene_paths.shape[1] - 1
+
+    def show(self, s):
+        """Draw every run up to step *s* (fractional: part way along the next step)."""
+        s = min(max(s, 0.0), self.steps)
+        k = int(s)
+        a = s - k
+        for trail, dot, path in zip(self.trails, self.dots, self.scene_paths):
+            head = path[k] if k == self.steps else path[k] + a * (path[k + 1] - path[k])
+            trail.set_points_as_corners(np.vstack([path[:k + 1], head[None]]))
+            dot.move_to(head)
+        return self
+
+
+class RaceDescent(Animation):
+    """Advance DescentPaths from step *start* to *end* (default: the last),
+    at one step per equal slice of the run time."""
+    def __init__(self, paths, start=0, end=None, rate_func=linear, **kwargs):
+        self.start, self.end = start, paths.steps if end is None else end
+        super().__init__(paths, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.show(self.start + (self.end - self.start) * self.rate_func(alpha))
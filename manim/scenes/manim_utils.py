@@ -0,0 +1,433 @@
+"""The manim-backed half of la_utils: plane/axes factories, function plots,
+arrow helpers, point clouds, edge bundles, tracker-bound primitives, text
+helpers, SixSectionScene.
+
+Scenes import these names from la_utils, which loads this module the first
+time one of them is used.
+"""
+import types
+
+from manim import *
+import numpy as np
+
+from la_utils import BG, BLUE, YELL, RED, GREEN, GREY, WHITE, AXIS_C, AX_COLOR, _adaptive_samples, _arrow_field_points
+
+# ── Prototype cache ──────────────────────────────────────────────────────────
+_PROTOTYPES = {}
+
+def _from_prototype(key, build):
+    """Copy of the mobject *build()* returns, built only once per *key*.
+
+    Copying a finished plane is several times cheaper than rebuilding every
+    grid line, tick and tip.  The render tools re-import this module for
+    each render, so prototypes never outlive a config change.
+    """
+    proto = _PROTOTYPES.get(key)
+    if proto is None:
+        proto = _PROTOTYPES[key] = build()
+    return proto.copy()
+
+# ── NumberPlane / Axes factories ─────────────────────────────────────────────
+def make_plane(x_range=(-5, 5, 1), y_range=(-4, 4, 1)):
+    """Dark-themed NumberPlane — no axis numbers, #333333 grid."""
+    return _from_prototype(("plane", tuple(x_range), tuple(y_range)), lambda: NumberPlane(
+        x_range=x_range,
+        y_range=y_range,
+        background_line_style={"stroke_color": GREY, "stroke_width": 1},
+        axis_config={
+            "stroke_color": AXIS_C,
+            "stroke_width": 1.5,
+            "include_numbers": False,
+            "include_tip": False,
+        },
+    ))
+
+def make_axes(x_range=(-0.5, 4.5, 1), y_range=(-0.5, 4.5, 1), x_length=7.0, y_length=5.0,
+              tip_size=None, color=AX_COLOR):
+    """Ticked Axes with tips and no numbers; *tip_size* is (width, height).
+
+    Centred at the origin — shift the result into place.
+    """
+    axis_config = {"color": color, "stroke_width": 2, "include_tip": True, "include_ticks": True}
+    if tip_size:
+        axis_config.update(tip_width=tip_size[0], tip_height=tip_size[1])
+    key = ("axes", tuple(x_range), tuple(y_range), x_length, y_length, tip_size, color)
+    return _from_prototype(key, lambda: Axes(
+        x_range=[*x_range], y_range=[*y_range],
+        x_length=x_length, y_length=y_length,
+        axis_config=axis_config,
+    ))
+
+# ── Function plots ───────────────────────────────────────────────────────────
+_SAMPLES = {}   # (function, range, scale, step, tol) → curve points in axes units
+
+def _value_key(v, seen):
+    """*v* as a hashable value for _function_key; TypeError if it could
+    change without its identity changing (lists, arrays, objects)."""
+    if v is None or isinstance(v, (bool, int, float, complex, str, bytes, np.generic, type, types.ModuleType)):
+        return (type(v), v)
+    if isinstance(v, tuple):
+        return tuple(_value_key(x, seen) for x in v)
+    if isinstance(v, types.FunctionType):
+        return _code_key(v, seen)
+    if isinstance(v, (types.BuiltinFunctionType, np.ufunc)):
+        return v
+    raise TypeError(type(v).__name__)
+
+def _global_names(code):
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _global_names(c)
+    return names
+
+def _code_key(f, seen):
+    if f in seen:                       # recursion: the code is enough
+        return f.__code__
+    seen = seen + (f,)
+    reads = sorted(n for n in _global_names(f.__code__) if n in f.__globals__)
+    return (f.__code__, _value_key(f.__defaults__, seen),
+            tuple((n, _value_key(f.__globals__[n], seen)) for n in reads),
+            tuple(_value_key(c.cell_contents, seen) for c in f.__closure__ or ()))
+
+def _function_key(f):
+    """*f*'s identity for the sample caches: its code and defaults plus the
+    values of the globals and closure cells it reads, so the same lambda
+    built again by a later call hits, and one whose globals have changed
+    misses.  None (do not cache) when it reads something mutable."""
+    if isinstance(f, (types.BuiltinFunctionType, np.ufunc)):
+        return f
+    if not isinstance(f, types.FunctionType):
+        return None
+    try:
+        key = _code_key(f, ())
+        hash(key)
+        return key
+    except (TypeError, ValueError):
+        return None
+
+class AdaptiveGraph(ParametricFunction):
+    """axes.plot() graph sampled by curvature instead of on a fixed step.
+
+    Behaves like the ParametricFunction axes.plot() returns (get_area,
+    input_to_graph_point, Create …); the sampled points are cached, so
+    plotting the same function over the same range again is a copy.
+    """
+    def __init__(self, axes, f, x_range, tol=0.01, **kwargs):
+        self.frame = _plane_frame(axes)
+        self.underlying_function, self.tol = f, tol
+        self.step = axes.x_range[2] / 10       # axes.plot()'s num_sampled_graph_points_per_tick
+        super().__init__(lambda t: axes.c2p(t, f(t)), t_range=(x_range[0], x_range[1]), **kwargs)
+
+    def generate_points(self):
+        o, ex, ey = self.frame
+        sx, sy = np.linalg.norm(ex), np.linalg.norm(ey)
+        fkey = _function_key(self.underlying_function)
+        key = (fkey, self.t_min, self.t_max, sx, sy, self.step, self.tol)
+        pts = _SAMPLES.get(key) if fkey is not None else None
+        if pts is None:
+            xy = _adaptive_samples(self.underlying_function, self.t_min, self.t_max, sx, sy, self.tol, self.step)
+            # corners, not a spline: smoothing across a pruned straight run overshoots at kinks
+            self.set_points_as_corners(np.column_stack([xy, np.zeros(len(xy))]))
+            pts = self.points.copy()
+            if fkey is not None:
+                _SAMPLES[key] = pts
+        self.points = o + pts[:, :1] * ex + pts[:, 1:2] * ey
+        return self
+
+    init_points = generate_points
+
+def plot_curve(axes, f, x_range, tol=0.01, **kwargs):
+    """Drop-in for axes.plot(f, x_range=…, …): few points on straight
+    stretches, more where it bends (*tol*: max deviation, scene units)."""
+    return AdaptiveGraph(axes, f, x_range, tol=tol, **kwargs)
+
+# ── Arrow helper ─────────────────────────────────────────────────────────────
+def vec(plane, tip, color=BLUE, base=(0, 0), stroke_width=3, tip_ratio=0.18):
+    """Arrow from plane-coords *base* to *tip*; returns VMobject() if zero-length."""
+    s = plane.c2p(*base)
+    e = plane.c2p(*tip)
+    if np.linalg.norm(e - s) < 0.08:
+        return VMobject()
+    return Arrow(s, e, buff=0, color=color,
+                 stroke_width=stroke_width,
+                 max_tip_length_to_length_ratio=tip_ratio)
+
+# ── Batch arrows ─────────────────────────────────────────────────────────────
+def _plane_frame(plane):
+    """(origin, x-unit, y-unit) of *plane* in scene coordinates."""
+    o = plane.c2p(0, 0)
+    return o, plane.c2p(1, 0) - o, plane.c2p(0, 1) - o
+
+class ArrowField(VMobject):
+    """Many arrows as ONE filled VMobject, built with array math.
+
+    *tails* and *tips* are (N, 2) plane coordinates.  One mobject to grow,
+    Transform or fade however many arrows it holds; arrows shorter than
+    0.08 collapse to a point (like vec()'s zero-length guard).
+    """
+    def __init__(self, plane, tails, tips, color=BLUE, stroke_width=3, tip_length=0.35,
+                 tip_ratio=0.25, **kwargs):
+        self.frame = _plane_frame(plane)
+        self.tails = np.asarray(tails, dtype=float).reshape(-1, 2)
+        self.tips = np.asarray(tips, dtype=float).reshape(-1, 2)
+        self.shaft_width = stroke_width * 0.01   # Cairo draws stroke_width 1 as 0.01 units
+        self.tip_length, self.tip_ratio = tip_length, tip_ratio
+        super().__init__(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+
+    def generate_points(self):
+        o, ex, ey = self.frame
+        to_scene = lambda xy: o + xy[:, :1] * ex + xy[:, 1:] * ey
+        self.points = _arrow_field_points(to_scene(self.tails), to_scene(self.tips),
+                                          self.shaft_width, self.tip_length, self.tip_ratio)
+
+    def transformed(self, matrix, color=None):
+        """Copy with every tail and tip mapped through the 2×2 *matrix* —
+        a Transform target with the same point layout."""
+        m = np.asarray(matrix, dtype=float).T
+        field = self.copy()
+        field.tails, field.tips = self.tails @ m, self.tips @ m
+        field.generate_points()
+        return field.set_fill(color) if color is not None else field
+
+# ── Point clouds ─────────────────────────────────────────────────────────────
+def _rgbas(colors, n):
+    """(n, 4) RGBA rows for one colour, a list of n colours, or an (n, 4) array."""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        return colors.astype(float)
+    if isinstance(colors, (str, ManimColor)):
+        return np.repeat([color_to_rgba(colors)], n, axis=0)
+    lut = {c: color_to_rgba(c) for c in set(map(str, colors))}
+    return np.array([lut[str(c)] for c in colors])
+
+class Scatter(PMobject):
+    """Many dots as ONE point cloud: *xy* (N, 2) plane coordinates and a
+    colour per point (or one for all).
+
+    The camera writes point clouds straight into the pixel array, so a
+    frame with thousands of points costs about what one with a few does.
+    Points are *size*-pixel squares at 720p (scaled with the render height).
+    Transform to moved() moves every point at once; FadeIn / FadeOut blend
+    the colours with BG, since a point cloud has no opacity of its own.
+    """
+    def __init__(self, plane, xy, colors=BLUE, size=6, **kwargs):
+        super().__init__(stroke_width=max(1, round(size * config.pixel_height / 720)), **kwargs)
+        self.frame = _plane_frame(plane)
+        self.set_xy(xy, colors)
+
+    def set_xy(self, xy, colors=None):
+        """Put the points at *xy* (recoloured with *colors*, if given) in place."""
+        o, ex, ey = self.frame
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        self.points = o + xy[:, :1] * ex + xy[:, 1:] * ey
+        if colors is not None:
+            self.rgbas = _rgbas(colors, len(xy))
+        return self
+
+    def moved(self, xy, colors=None):
+        """Copy with the points at *xy* — a Transform target (drift, clustering)."""
+        return self.copy().set_xy(xy, colors)
+
+    def fade(self, darkness=0.5, family=True):
+        return self.fade_to(BG, darkness, family)
+
+# ── Network diagrams ─────────────────────────────────────────────────────────
+class EdgeBundle(VGroup):
+    """Every edge from the nodes *frm* to the nodes *to* (lists of points),
+    drawn as arrows in one VMobject per colour instead of one Arrow each.
+
+    *colors* / *weights* optionally give one value per edge, in order
+    (frm[0]→to[0], frm[0]→to[1], …); |weight| scales the shaft width.
+    Edges are trimmed by *buff* at both ends; ones shorter than 0.05 are
+    dropped, as _arr() did.
+    """
+    def __init__(self, frm, to, color=BLUE, stroke_width=1.5, colors=None, weights=None,
+                 buff=0.05, tip_length=0.35, tip_ratio=0.15, **kwargs):
+        frm, to = np.asarray(frm, dtype=float).reshape(-1, 3), np.asarray(to, dtype=float).reshape(-1, 3)
+        s, e = np.repeat(frm, len(to), axis=0), np.tile(to, (len(frm), 1))
+        d = e - s
+        length = np.linalg.norm(d, axis=1, keepdims=True)
+        u = np.divide(d, length, out=np.zeros_like(d), where=length > 0)
+        keep = length[:, 0] >= 0.05
+        tails, heads = (s + u * buff)[keep], (e - u * buff)[keep]
+        widths = stroke_width * 0.01 * (np.ones(len(s)) if weights is None else np.abs(weights))[keep]
+        colors = np.array([str(c) for c in (colors if colors is not None else [color] * len(s))])[keep]
+        parts = []
+        for c in dict.fromkeys(colors):
+            idx = colors == c
+            part = VMobject(fill_color=c, fill_opacity=1, stroke_width=0)
+            part.points = _arrow_field_points(tails[idx], heads[idx], widths[idx],
+                                              tip_length, tip_ratio, min_length=0)
+            parts.append(part)
+        super().__init__(*parts, **kwargs)
+
+    def endpoints(self):
+        """(tails, heads) of every edge where it is drawn now, read back from
+        the arrow points (28 per arrow: shaft corners 0 and 12, tip 20), so a
+        bundle moved or scaled since it was built is still hit exactly."""
+        pts = np.concatenate([np.zeros((0, 3))] + [p.points for p in self.submobjects]).reshape(-1, 28, 3)
+        return (pts[:, 0] + pts[:, 12]) / 2, pts[:, 20]
+
+class EdgePulse(Animation):
+    """A bright dash running along every edge of an EdgeBundle at once:
+    tail→head, or head→tail with backward=True (backprop).  One mobject,
+    recomputed with array math each frame from the bundle's current
+    points (so it follows a bundle that moves), removed when done."""
+    def __init__(self, bundle, color=WHITE, backward=False, dash=0.25, stroke_width=4, **kwargs):
+        self.bundle, self.backward = bundle, backward
+        self.dash, self.width = dash, stroke_width * 0.01
+        pulse = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+        super().__init__(pulse, introducer=True, remover=True, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        head = self.rate_func(alpha) * (1 + self.dash)
+        a, b = np.clip([head - self.dash, head], 0, 1)
+        starts, ends = self.bundle.endpoints()
+        if self.backward:
+            starts, ends = ends, starts
+        d = ends - starts
+        self.mobject.points = _arrow_field_points(starts + a * d, starts + b * d, self.width,
+                                                  0.0, 0.0, min_length=0)
+
+# ── Tracker-bound primitives ─────────────────────────────────────────────────
+# always_redraw() builds a brand-new mobject every frame.  These are built
+# once and moved in place by an updater reading a ValueTracker, so a sweep
+# allocates nothing per frame.
+def _set_visible(mob, visible):
+    """Hide/show *mob* via opacity (in place of always_redraw's VMobject())."""
+    saved = getattr(mob, "_saved_opacity", None)
+    if not visible and saved is None:
+        # per family member: a parent's opacity says nothing about its submobjects'
+        mob._saved_opacity = [(m, m.get_stroke_opacity(), m.get_fill_opacity()) for m in mob.get_family()]
+        mob.set_stroke(opacity=0).set_fill(opacity=0)
+    elif visible and saved is not None:
+        for m, stroke, fill in saved:
+            m.set_stroke(opacity=stroke, family=False).set_fill(opacity=fill, family=False)
+        mob._saved_opacity = None
+
+def tracked_dot(axes, tracker, f, offset=0.0, color=YELL, radius=0.1):
+    """Dot riding y = f(x) at x = offset + tracker."""
+    def place(dot):
+        x = offset + tracker.get_value()
+        dot.move_to(axes.c2p(x, f(x)))
+    dot = Dot(color=color, radius=radius)
+    place(dot)
+    return dot.add_updater(place)
+
+def tracked_line(tracker, ends, color=YELL, stroke_width=3.5):
+    """Line between the scene points *ends(value)* returns — (start, end),
+    or None to hide it; its points are rewritten in place."""
+    def place(line):
+        se = ends(tracker.get_value())
+        visible = se is not None and np.linalg.norm(np.subtract(se[1], se[0])) > 1e-3
+        if visible:
+            line.points[:] = np.linspace(se[0], se[1], len(line.points))
+        _set_visible(line, visible)
+    line = Line(LEFT, RIGHT, color=color, stroke_width=stroke_width)
+    place(line)
+    return line.add_updater(place)
+
+def tracked_tangent(axes, tracker, f, df, half_width=1.0, max_slope=None, color=YELL, stroke_width=3.5):
+    """Tangent to y = f(x) at x = tracker, *half_width* either side in x;
+    hidden while |df(x)| > *max_slope*."""
+    def ends(x):
+        m, y = df(x), f(x)
+        if max_slope is not None and abs(m) > max_slope:
+            return None
+        return axes.c2p(x - half_width, y - m * half_width), axes.c2p(x + half_width, y + m * half_width)
+    return tracked_line(tracker, ends, color=color, stroke_width=stroke_width)
+
+# ── Text helpers ─────────────────────────────────────────────────────────────
+def header(text, size=44, color=WHITE):
+    return Text(text, font_size=size, color=color).to_edge(UP, buff=0.35)
+
+def label(text, point, direction=UP, color=BLUE, size=28):
+    return Text(text, font_size=size, color=color).next_to(point, direction, buff=0.15)
+
+def text_box(mob, bg=BG, border=WHITE, buff=0.28):
+    """Wrap *mob* in a filled SurroundingRectangle (clean text box)."""
+    return SurroundingRectangle(
+        mob, color=border, buff=buff,
+        fill_color=bg, fill_opacity=0.92,
+        corner_radius=0.06,
+    )
+
+def sec_label(scene, title, color=BLUE, size=38):
+    """Flash a section title on screen, then fade it away.
+
+    Renderers that record a timeline (manim/manifest.py) get a mark for it.
+    """
+    first = scene.renderer.num_plays
+    lbl = Text(title, font_size=size, color=color)
+    scene.play(FadeIn(lbl), run_time=0.6)
+    scene.wait(1.2)
+    scene.play(FadeOut(lbl), run_time=0.4)
+    scene.wait(0.3)
+    marks = getattr(scene.renderer, "marks", None)
+    if marks is not None:
+        marks.append({"label": title, "section": getattr(scene.renderer, "section", None),
+                      "first": first, "last": scene.renderer.num_plays - 1})
+
+# ── Six-section scenes ───────────────────────────────────────────────────────
+def _is_visible(mob):
+    """True if any part of *mob* would put a pixel on screen."""
+    for m in mob.get_family():
+        if not m.has_points():
+            continue
+        if not isinstance(m, VMobject):
+            return True   # images, point clouds
+        if np.any(m.get_fill_opacities() > 0):
+            return True
+        if m.get_stroke_width() > 0 and np.any(m.get_stroke_opacities() > 0):
+            return True
+    return False
+
+class SixSectionScene(Scene):
+    """Base for the gold-standard scenes: s1_hook … s6_summary, played in
+    order on the BG background with the screen cleared between them.
+
+    Subclasses only write the section methods; FADE_TIME, GAP and RP_X
+    tune the transitions and _rp().  section_started / section_finished
+    run around every section (section_render.py and the timeline tools
+    drive the same run_section()).
+    """
+    SECTIONS = ("s1_hook", "s2_geometry", "s3_notation", "s4_example", "s5_insight", "s6_summary")
+    FADE_TIME = 0.6   # section-end fade
+    GAP = 0.3         # pause after it
+    RP_X = 4.3        # default column for _rp()
+
+    def construct(self):
+        self.camera.background_color = BG
+        for i, name in enumerate(self.SECTIONS):
+            self.run_section(name, last=i == len(self.SECTIONS) - 1)
+
+    def run_section(self, name, last=False):
+        """Play section *name*, then clear the screen unless it is the *last*."""
+        self.section_started(name)
+        getattr(self, name)()
+        self.section_finished(name)
+        if not last:
+            self._fade_all()
+
+    def section_started(self, name):
+        """Hook: called before section *name* plays."""
+
+    def section_finished(self, name):
+        """Hook: called after section *name*, before its closing fade."""
+
+    def _fade_all(self):
+        """Clear the screen: one FadeOut for everything on it, or a cut
+        if none of it is visible."""
+        mobs = list(self.mobjects)
+        if any(_is_visible(m) for m in mobs):
+            self.play(FadeOut(Group(*mobs)), run_time=self.FADE_TIME)
+        else:
+            self.remove(*mobs)
+        self.wait(self.GAP)
+
+    def _box(self, mob, border=WHITE, buff=0.28):
+        return text_box(mob, border=border, buff=buff)
+
+    def _rp(self, mob, y=0.0, x=None):
+        mob.move_to(RIGHT * (self.RP_X if x is None else x) + UP * y)
+        return mob
@@ -3,57 +3,19 @@ Target: 3+ minutes total animation time.
 Uses Text/Cairo only — no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, EdgeBundle, EdgePulse, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 CORAL = RED
 
 
-def _arr(start, end, color=BLUE, sw=2.0):
-    s = np.array(start)
-    e = np.array(end)
-    if np.linalg.norm(e - s) < 0.05:
-        return VMobject()
-    return Arrow(s, e, buff=0.05, color=color, stroke_width=sw,
-                 max_tip_length_to_length_ratio=0.15)
-
-
-class NeuralNetworksScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook()
-        self._fade_all()
-        self.s2_geometry()
-        self._fade_all()
-        self.s3_notation()
-        self._fade_all()
-        self.s4_example()
-        self._fade_all()
-        self.s5_insight()
-        self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=1)
-        self.wait(0.5)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=3.8):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
+class NeuralNetworksScene(SixSectionScene):
+    FADE_TIME = 1
+    GAP = 0.5
+    RP_X = 3.8
 
     def _make_arrows(self, frm, to, color=BLUE):
-        arrows = VGroup()
-        for pf in frm:
-            for pt in to:
-                a = _arr(pf, pt, color=color, sw=1.5)
-                if isinstance(a, Arrow):
-                    arrows.add(a)
-        return arrows
+        return EdgeBundle(frm, to, color=color, stroke_width=1.5)
 
     # =========================================================================
     # SECTION 1 — HOOK (target: 40 seconds)
@@ -155,12 +117,12 @@ class NeuralNetworksScene(Scene):
 
         # STEP 4: Show information flowing (flash arrows)
         self.play(
-            arrows_ih.animate.set_color(WHITE),
+            EdgePulse(arrows_ih), arrows_ih.animate.set_color(WHITE),
             run_time=2,
         )
         self.wait(2)
         self.play(
-            arrows_ho.animate.set_color(WHITE),
+            EdgePulse(arrows_ho), arrows_ho.animate.set_color(WHITE),
             run_time=2,
         )
         self.wait(2)
@@ -3,39 +3,15 @@ Feynman – Gradient Descent (Gold Standard)
 6-section narrative, 3-5 minutes. Text/Cairo only, no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, make_axes, plot_curve, tracked_dot, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
+from loss_utils import ContourMap, DescentPaths, RaceDescent, descend, rosenbrock, rosenbrock_grad
 
 AX_COLOR = "#888888"
 
-class GradientDescentScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.3)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
-
+class GradientDescentScene(SixSectionScene):
     def _mk_axes(self, xr=(-0.5, 4.5, 1), yr=(-0.5, 4.5, 1)):
-        return Axes(
-            x_range=[*xr], y_range=[*yr],
-            x_length=7.0, y_length=5.0,
-            axis_config={"color": AX_COLOR, "stroke_width": 2,
-                         "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        return make_axes(xr, yr).shift(LEFT * 1.5 + DOWN * 0.5)
 
     def s1_hook(self):
         t1 = Text("Gradient Descent", font_size=48, color=WHITE)
@@ -66,11 +42,9 @@ class GradientDescentScene(Scene):
 
     def s2_geometry(self):
         sec_label(self, "Visualizing the Loss Landscape")
-        axes = Axes(x_range=[-3,3,1], y_range=[-0.5,9,2], x_length=7.5, y_length=5.2,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        axes = make_axes([-3,3,1], [-0.5,9,2], 7.5, 5.2).shift(LEFT * 1.5 + DOWN * 0.5)
         f = lambda x: x**2
-        curve = axes.plot(f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
         self.play(Create(axes), run_time=2.0); self.wait(0.3)
         self.play(Create(curve), run_time=2.0); self.wait(0.5)
 
@@ -79,7 +53,7 @@ class GradientDescentScene(Scene):
         self.play(FadeIn(b1), Write(r1), run_time=2.0); self.wait(1.5)
 
         x_t = ValueTracker(2.5)
-        dot_mob = always_redraw(lambda: Dot(axes.c2p(x_t.get_value(), f(x_t.get_value())), color=YELL, radius=0.15))
+        dot_mob = tracked_dot(axes, x_t, f, radius=0.15)
         self.play(Create(dot_mob)); self.wait(0.5)
         self.play(FadeOut(b1), FadeOut(r1), run_time=0.4)
 
@@ -87,7 +61,8 @@ class GradientDescentScene(Scene):
         self._rp(r2, y=2.5); b2 = self._box(r2, border=YELL)
         self.play(FadeIn(b2), Write(r2), run_time=1.5); self.wait(1.0)
 
-        for wn in [1.8, 1.2, 0.65, 0.28, 0.08]:
+        # the real iterates of w := w - 0.25 * 2w
+        for wn in descend(lambda w: 2 * w, [2.5], lr=0.25, steps=5)[0, 1:, 0]:
             self.play(x_t.animate.set_value(wn), run_time=1.5, rate_func=smooth); self.wait(0.4)
 
         self.play(FadeOut(b2), FadeOut(r2), run_time=0.4)
@@ -130,14 +105,26 @@ class GradientDescentScene(Scene):
         variants.move_to(ORIGIN)
         vb = self._box(variants, border=BLUE, buff=0.38)
         self.play(FadeIn(vb), Write(variants), run_time=2.5); self.wait(3.5)
+        self.play(FadeOut(vb), FadeOut(variants), run_time=0.5)
+
+        # three optimisers, same start, on a banana-shaped valley (minimum at (1, 1))
+        axes = make_axes((-2, 2, 1), (-1, 3, 1), 5.4, 5.4).shift(LEFT * 2.4 + DOWN * 0.3)
+        surface = ContourMap(axes, rosenbrock, (-2, 2), (-1, 3))
+        runs = [("GD  lr=0.01", "gd", 0.01, BLUE), ("Momentum  lr=0.004", "momentum", 0.004, GREEN),
+                ("Adam  lr=0.1", "adam", 0.1, RED)]
+        race = DescentPaths(axes, descend(rosenbrock_grad, [(-1.5, 2.0)] * len(runs), method=[r[1] for r in runs],
+                                          lr=[r[2] for r in runs], steps=150), colors=[r[3] for r in runs])
+        legend = VGroup(*[Text(r[0], font_size=22, color=r[3]) for r in runs]).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+        self._rp(legend, y=0.3); lb = self._box(legend)
+        self.play(Create(axes), FadeIn(surface), FadeIn(lb), FadeIn(legend), run_time=1.5)
+        self.add(race)
+        self.play(RaceDescent(race), run_time=6); self.wait(2.5)
 
     def s4_example(self):
         sec_label(self, "Worked Example: L(w)=w^2, lr=0.3")
-        axes = Axes(x_range=[-3,3,1], y_range=[-0.5,9,2], x_length=7.5, y_length=5.2,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        axes = make_axes([-3,3,1], [-0.5,9,2], 7.5, 5.2).shift(LEFT * 1.5 + DOWN * 0.5)
         f = lambda x: x**2
-        curve = axes.plot(f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
         self.play(Create(axes), Create(curve), run_time=2.5); self.wait(0.5)
 
         steps = [
@@ -191,11 +178,9 @@ class GradientDescentScene(Scene):
 
     def s6_summary(self):
         sec_label(self, "Summary")
-        axes = Axes(x_range=[-3,3,1], y_range=[-0.5,9,2], x_length=7.5, y_length=5.2,
-            axis_config={"color": AX_COLOR, "stroke_width": 2, "include_tip": True, "include_ticks": True},
-        ).shift(LEFT * 1.5 + DOWN * 0.5)
+        axes = make_axes([-3,3,1], [-0.5,9,2], 7.5, 5.2).shift(LEFT * 1.5 + DOWN * 0.5)
         f = lambda x: x**2
-        curve = axes.plot(f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
+        curve = plot_curve(axes, f, x_range=[-2.8,2.8], color=BLUE, stroke_width=3.5)
         min_dot = Dot(axes.c2p(0,0), color=GREEN, radius=0.18)
         self.play(Create(axes), Create(curve), run_time=2.0)
         self.play(Create(min_dot), run_time=1.0); self.wait(0.5)
@@ -3,48 +3,16 @@ Target: 3+ minutes total animation time.
 Uses Text/Cairo only — no LaTeX.
 """
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE
+from la_utils import text_box, sec_label, SixSectionScene, EdgeBundle, EdgePulse, BG, BLUE, YELL, RED, GREEN, WHITE
 import numpy as np
 
 CORAL = RED
 
 
-def _arr(start, end, color=BLUE, sw=2.5):
-    s = np.array(start)
-    e = np.array(end)
-    if np.linalg.norm(e - s) < 0.05:
-        return VMobject()
-    return Arrow(s, e, buff=0.05, color=color, stroke_width=sw,
-                 max_tip_length_to_length_ratio=0.15)
-
-
-class BackpropagationScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook()
-        self._fade_all()
-        self.s2_geometry()
-        self._fade_all()
-        self.s3_notation()
-        self._fade_all()
-        self.s4_example()
-        self._fade_all()
-        self.s5_insight()
-        self._fade_all()
-        self.s6_summary()
-
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs:
-            self.play(*[FadeOut(m) for m in mobs], run_time=1)
-        self.wait(0.5)
-
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-
-    def _rp(self, mob, y=0.0, x=3.8):
-        mob.move_to(RIGHT * x + UP * y)
-        return mob
+class BackpropagationScene(SixSectionScene):
+    FADE_TIME = 1
+    GAP = 0.5
+    RP_X = 3.8
 
     def _lp(self, mob, y=0.0, x=-3.8):
         mob.move_to(LEFT * abs(x) + UP * y)
@@ -59,22 +27,10 @@ class BackpropagationScene(Scene):
         return dots_in, dots_h, dots_o
 
     def _fwd_arrows(self, frm, to, color=BLUE):
-        arrows = VGroup()
-        for pf in frm:
-            for pt in to:
-                a = _arr(pf, pt, color=color, sw=1.5)
-                if isinstance(a, Arrow):
-                    arrows.add(a)
-        return arrows
+        return EdgeBundle(frm, to, color=color, stroke_width=1.5)
 
     def _back_arrows(self, frm, to, color=CORAL):
-        arrows = VGroup()
-        for pf in frm:
-            for pt in to:
-                a = _arr(pf, pt, color=color, sw=1.5)
-                if isinstance(a, Arrow):
-                    arrows.add(a)
-        return arrows
+        return EdgeBundle(frm, to, color=color, stroke_width=1.5)
 
     # =========================================================================
     # SECTION 1 — HOOK (target: 40 seconds)
@@ -180,12 +136,12 @@ class BackpropagationScene(Scene):
 
         # Backward arrows output→hidden
         back_oh = self._back_arrows(out, hid, color=CORAL)
-        self.play(GrowFromCenter(back_oh), run_time=2)
+        self.play(GrowFromCenter(back_oh), EdgePulse(arrows_ho, color=CORAL, backward=True), run_time=2)
         self.wait(2)
 
         # STEP 6: Backward arrows hidden→input
         back_hi = self._back_arrows(hid, inp, color=CORAL)
-        self.play(GrowFromCenter(back_hi), run_time=2)
+        self.play(GrowFromCenter(back_hi), EdgePulse(arrows_ih, color=CORAL, backward=True), run_time=2)
         self.wait(3)
 
         # Key insight highlight
@@ -10,9 +10,12 @@ class OverfittingScene(Scene):
         sec_label(self, "Overfitting and Underfitting")
         axes = Axes(x_range=[0, 4, 1], y_range=[0, 4, 1], x_length=6, y_length=4,
                     axis_config={"color": "#555", "include_numbers": False}).shift(LEFT * 1.5 + DOWN * 0.5)
-        pts = [axes.c2p(0.5, 1.2), axes.c2p(1.2, 1.8), axes.c2p(2, 2.2), axes.c2p(2.8, 2)]
-        dots = VGroup(*[Dot(p, color=YELL, radius=0.08) for p in pts])
-        curve_simple = axes.plot(lambda x: 1.5 + 0.3*x, x_range=[0.2, 3.5], color=BLUE)
+        rng = np.random.default_rng(5)
+        x = rng.uniform(0.3, 3.6, 120)
+        y = 0.8 + 1.1*x - 0.25*x**2 + rng.normal(0, 0.15, len(x))
+        dots = Scatter(axes, np.column_stack([x, y]), YELL, size=8)
+        slope, icept = np.polyfit(x, y, 1)      # least-squares line: the underfit model
+        curve_simple = plot_curve(axes, lambda t: icept + slope*t, x_range=[0.2, 3.5], color=BLUE)
         self.play(Create(axes), FadeIn(dots)); self.wait(0.5)
         self.play(Create(curve_simple)); self.wait(0.5)
         txt = Text("Too simple = underfitting.\nToo complex = overfitting.\nSweet spot in between.", font_size=26, color=WHITE)
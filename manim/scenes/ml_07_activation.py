@@ -10,7 +10,7 @@ class ActivationScene(Scene):
         sec_label(self, "Activation Functions")
         axes = Axes(x_range=[-2, 2, 1], y_range=[-0.5, 1.5, 0.5], x_length=6, y_length=3,
                     axis_config={"color": "#555", "include_numbers": False}).shift(DOWN * 0.5)
-        relu = axes.plot(lambda x: max(0, x), x_range=[-2, 2], color=BLUE)
+        relu = plot_curve(axes, lambda x: max(0, x), x_range=[-2, 2], color=BLUE)
         self.play(Create(axes), Create(relu)); self.wait(0.5)
         txt = Text("ReLU, Sigmoid, Tanh.\nEach adds nonlinearity.", font_size=28, color=WHITE)
         txt.move_to(UP * 2)
@@ -2,6 +2,7 @@
 from manim import *
 from la_utils import *
 import numpy as np
+from loss_utils import ContourMap, DescentPaths, RaceDescent, bowl, bowl_grad, descend
 
 
 class LearningRateScene(Scene):
@@ -10,9 +11,21 @@ class LearningRateScene(Scene):
         sec_label(self, "Learning Rate")
         axes = Axes(x_range=[0, 4, 1], y_range=[0, 5, 1], x_length=6, y_length=4,
                     axis_config={"color": "#555", "include_numbers": False}).shift(LEFT * 1 + DOWN * 0.5)
-        curve = axes.plot(lambda x: 2 + 2/(x+0.5), x_range=[0.1, 4], color=BLUE)
+        curve = plot_curve(axes, lambda x: 2 + 2/(x+0.5), x_range=[0.1, 4], color=BLUE)
         self.play(Create(axes), Create(curve)); self.wait(0.5)
         txt = Text("Too large \u03b1: overshoot.\nToo small: slow.\nJust right: smooth descent.", font_size=28, color=WHITE)
         txt.move_to(RIGHT * 3)
         bl = text_box(txt, border=YELL)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt)); self.wait(2)
+
+        # the same start on a stretched bowl at three step sizes, 40 real GD steps each
+        self.play(FadeOut(axes), FadeOut(curve), run_time=0.5)
+        plane = make_axes((-3, 3, 1), (-2, 2, 1), 6.0, 4.0).shift(LEFT * 2.7 + DOWN * 0.5)
+        rates = [(0.02, BLUE), (0.11, GREEN), (0.13, RED)]
+        race = DescentPaths(plane, descend(bowl_grad, [(-2.5, 1.5)] * len(rates), lr=[r for r, _ in rates], steps=40),
+                            colors=[c for _, c in rates])
+        keys = VGroup(*[Text(f"\u03b1 = {r}", font_size=22, color=c) for r, c in rates]).arrange(DOWN, buff=0.25)
+        keys.move_to(RIGHT * 3 + DOWN * 2.2)
+        self.play(Create(plane), FadeIn(ContourMap(plane, bowl, (-3, 3), (-2, 2))), FadeIn(keys), run_time=1.5)
+        self.add(race)
+        self.play(RaceDescent(race), run_time=6); self.wait(2)
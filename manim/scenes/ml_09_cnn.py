@@ -1,18 +1,41 @@
 """ml_09_cnn.py — Convolutional Neural Networks"""
 from manim import *
 from la_utils import *
+from cnn_utils import KERNELS, PixelGrid, SlideKernel, conv2d, max_pool, relu, sample_image
 
 
 class ConvolutionalScene(Scene):
     def construct(self):
         self.camera.background_color = BG
         sec_label(self, "Convolutional Neural Networks")
-        grid = VGroup(*[
-            Square(side_length=0.5, color=GREY, stroke_width=1).shift(LEFT*2 + UP*1 + RIGHT*(i%4)*0.55 + DOWN*(i//4)*0.55)
-            for i in range(16)
-        ])
-        self.play(Create(grid)); self.wait(0.5)
+        img = sample_image(64)
+        src = PixelGrid(img, height=3.2).move_to(LEFT * 4.3 + DOWN * 0.7)
+        self.play(FadeIn(src)); self.wait(0.5)
         txt = Text("Filter slides over image.\nDetects edges and patterns.", font_size=28, color=WHITE)
-        txt.move_to(RIGHT * 2.5)
+        txt.move_to(UP * 2.8)
         bl = text_box(txt, border=BLUE)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt)); self.wait(1)
+
+        # one real 3×3 filter, swept across all 62×62 positions
+        kernel = KERNELS["vertical edge"]
+        feature = conv2d(img, kernel)
+        ker = PixelGrid(kernel, height=1.2, signed=True).move_to(LEFT * 1.2 + DOWN * 0.7)
+        ker_lbl = Text("vertical edge", font_size=20, color=WHITE).next_to(ker, DOWN, buff=0.25)
+        out = PixelGrid(feature, height=3.2, signed=True).move_to(RIGHT * 2.0 + DOWN * 0.7)
+        out.set_array(feature, np.zeros(feature.shape, bool))
+        self.play(FadeIn(ker), FadeIn(ker_lbl), FadeIn(out), run_time=0.8)
+        self.play(SlideKernel(src, out, feature, kernel.shape[0]), run_time=6)
+        self.wait(1)
+
+        # a layer is a bank of filters: ReLU, then 2×2 max-pool, each map one image
+        self.play(FadeOut(ker), FadeOut(ker_lbl), FadeOut(out), run_time=0.5)
+        maps = Group()
+        for name, k in KERNELS.items():
+            fm = max_pool(relu(conv2d(img, k)))
+            cell = Group(PixelGrid(fm, height=1.5, fg=GREEN),
+                         Text(name, font_size=18, color=WHITE))
+            cell[1].next_to(cell[0], DOWN, buff=0.12)
+            maps.add(cell)
+        maps.arrange_in_grid(rows=2, cols=2, buff=(0.5, 0.3)).move_to(RIGHT * 1.6 + DOWN * 0.8)
+        self.play(LaggedStart(*[FadeIn(m) for m in maps], lag_ratio=0.3), run_time=2)
+        self.wait(3)
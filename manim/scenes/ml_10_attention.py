@@ -1,6 +1,10 @@
 """ml_10_attention.py — Attention Mechanism"""
 from manim import *
 from la_utils import *
+from attn_utils import AttentionMap, SweepQueries, SwitchHead, attention
+
+SENTENCE = ("the animal did not cross the street because it was too tired and the road was long "
+            "so it sat down under a tree near the old house to rest for a while")
 
 
 class AttentionScene(Scene):
@@ -12,8 +16,18 @@ class AttentionScene(Scene):
             "Transformers compute attention scores.\n"
             "Each word attends to relevant others.\n"
             "Enables understanding context.",
-            font_size=26, color=WHITE,
+            font_size=22, color=WHITE,
         )
-        txt.move_to(ORIGIN)
+        txt.move_to(LEFT * 4.1 + UP * 1.2)
         bl = text_box(txt, border=YELL)
-        self.play(FadeIn(bl), Write(txt)); self.wait(4)
+        self.play(FadeIn(bl), Write(txt))
+
+        # softmax(QK^T / sqrt(d)) for 33 tokens and 4 heads, one image per frame
+        tokens = SENTENCE.split()
+        amap = AttentionMap(tokens, attention(tokens, heads=4), height=5.2).move_to(RIGHT * 2.4 + DOWN * 0.1)
+        cap = Text("rows: queries   columns: keys", font_size=20, color=WHITE).move_to(LEFT * 4.1 + DOWN * 1.6)
+        self.play(FadeIn(amap), FadeIn(cap), run_time=1.0); self.wait(1)
+        self.play(SweepQueries(amap), run_time=6)
+        for head in range(1, 4):
+            self.play(SwitchHead(amap, head), run_time=0.8); self.wait(1.2)
+        self.wait(2)
@@ -10,9 +10,15 @@ class EmbeddingsScene(Scene):
         sec_label(self, "Embeddings")
         plane = make_plane().scale(0.6).shift(LEFT * 2)
         self.play(Create(plane)); self.wait(0.5)
-        cluster1 = VGroup(*[Dot(plane.c2p(0.5 + i*0.1, 1 + j*0.1), color=BLUE, radius=0.06) for i in range(3) for j in range(2)])
-        cluster2 = VGroup(*[Dot(plane.c2p(-1 + i*0.1, -0.5 + j*0.1), color=YELL, radius=0.06) for i in range(3) for j in range(2)])
-        self.play(FadeIn(cluster1), FadeIn(cluster2)); self.wait(0.5)
+        # 1500 "words" start scattered, then drift into their meaning clusters
+        rng = np.random.default_rng(11)
+        centers = np.array([[1.8, 1.6], [-2.2, -0.8], [2.0, -2.2]])
+        topic = rng.integers(0, len(centers), 1500)
+        scattered = rng.uniform((-4.5, -3.5), (4.5, 3.5), (len(topic), 2))
+        clustered = centers[topic] + rng.normal(0, 0.5, (len(topic), 2))
+        cloud = Scatter(plane, scattered, [(BLUE, YELL, RED)[k] for k in topic], size=4)
+        self.play(FadeIn(cloud)); self.wait(0.5)
+        self.play(Transform(cloud, cloud.moved(clustered)), run_time=3); self.wait(0.5)
         txt = Text("Words as vectors.\nSimilar words cluster.", font_size=26, color=WHITE)
         txt.move_to(RIGHT * 2.5)
         bl = text_box(txt, border=BLUE)
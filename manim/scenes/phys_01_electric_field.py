@@ -1,21 +1,22 @@
 """phys_01_electric_field.py — Electric Fields"""
 from manim import *
 from la_utils import *
-import numpy as np
+from field_utils import FieldView, MoveSources
 
 
 class ElectricFieldScene(Scene):
     def construct(self):
         self.camera.background_color = BG
         sec_label(self, "Electric Fields")
-        dot = Dot(color=YELL, radius=0.2)
-        arrows = VGroup(*[
-            Arrow(ORIGIN, 0.7 * np.array(d), color=BLUE, buff=0)
-            for d in [(1,0), (-1,0), (0,1), (0,-1), (0.7,0.7), (-0.7,0.7), (0.7,-0.7), (-0.7,-0.7)]
-        ])
-        arrows.move_to(ORIGIN)
-        self.play(FadeIn(dot), Create(arrows)); self.wait(0.5)
+        view = FieldView(charges=[(0, -0.9, 1)], y_range=(-3.8, 2.1))
+        self.play(FadeIn(view)); self.wait(0.5)
         txt = Text("Charge creates field.\nForce on other charges.", font_size=28, color=WHITE)
-        txt.move_to(RIGHT * 3)
+        txt.move_to(UP * 3.0)
         bl = text_box(txt, border=YELL)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt)); self.wait(1.5)
+        # bring in a negative partner: the fields superpose into a dipole
+        dipole = FieldView(charges=[(-2.0, -0.9, 1), (2.0, -0.9, -1)], y_range=(-3.8, 2.1))
+        self.play(FadeOut(view), FadeIn(dipole), run_time=1.0); self.wait(1.0)
+        self.play(MoveSources(dipole, charges=[(-1.0, 0.2, 1), (1.0, -2.0, -1)]), run_time=3.0)
+        self.play(MoveSources(dipole, charges=[(-2.5, -0.9, 1), (2.5, -0.9, -1)]), run_time=3.0)
+        self.wait(2)
@@ -1,19 +1,21 @@
 """phys_02_magnetic_field.py — Magnetic Fields"""
 from manim import *
 from la_utils import *
+from field_utils import FieldView, MoveSources
 
 
 class MagneticFieldScene(Scene):
     def construct(self):
         self.camera.background_color = BG
         sec_label(self, "Magnetic Fields")
-        bar = Rectangle(width=1.2, height=0.3, color=GREY)
-        circles = VGroup(*[
-            Circle(radius=0.4 + i * 0.15, color=BLUE, stroke_width=2).move_to(bar.get_center() + UP * (0.5 + i * 0.4))
-            for i in range(3)
-        ])
-        self.play(Create(bar), Create(circles)); self.wait(0.5)
+        # two wires seen end-on, currents in opposite directions (out of / into the page)
+        view = FieldView(wires=[(-1.5, -0.9, 1), (1.5, -0.9, -1)], y_range=(-3.8, 2.1))
+        self.play(FadeIn(view)); self.wait(0.5)
         txt = Text("Current produces B.\nRight-hand rule.", font_size=28, color=WHITE)
-        txt.move_to(RIGHT * 3)
+        txt.move_to(UP * 3.0)
         bl = text_box(txt, border=BLUE)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt)); self.wait(1.5)
+        # reverse the right-hand current: the loops between the wires open out around both
+        self.play(MoveSources(view, wires=[(-1.5, -0.9, 1), (1.5, -0.9, 1)]), run_time=3.0)
+        self.play(MoveSources(view, wires=[(-0.6, -0.9, 1), (0.6, -0.9, 1)]), run_time=2.0)
+        self.wait(2)
@@ -1,30 +1,14 @@
 """Feynman – Electromagnetic Induction (Gold Standard) – 6-section, 3-5 min, Text/Cairo only."""
 from manim import *
-from la_utils import text_box, sec_label, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, vec
+from la_utils import text_box, sec_label, SixSectionScene, BG, BLUE, YELL, RED, GREEN, WHITE, make_plane, make_axes, plot_curve, vec
 import numpy as np
 AX_COLOR = "#888888"
 
-class InductionScene(Scene):
-    def construct(self):
-        self.camera.background_color = BG
-        self.s1_hook();     self._fade_all()
-        self.s2_geometry(); self._fade_all()
-        self.s3_notation(); self._fade_all()
-        self.s4_example();  self._fade_all()
-        self.s5_insight();  self._fade_all()
-        self.s6_summary()
-    def _fade_all(self):
-        mobs = list(self.mobjects)
-        if mobs: self.play(*[FadeOut(m) for m in mobs], run_time=0.6)
-        self.wait(0.6)
-    def _box(self, mob, border=WHITE, buff=0.28):
-        return text_box(mob, border=border, buff=buff)
-    def _rp(self, mob, y=0.0, x=4.3):
-        mob.move_to(RIGHT * x + UP * y); return mob
+class InductionScene(SixSectionScene):
+    GAP = 0.6
+
     def _axes(self, xr=(-0.3,4.5,1), yr=(-0.3,4.5,1)):
-        return Axes(x_range=[*xr], y_range=[*yr], x_length=7.2, y_length=5.0,
-            axis_config={"color": AX_COLOR,"stroke_width":2,"include_tip":True,"include_ticks":True}
-        ).shift(LEFT*1.5+DOWN*0.5)
+        return make_axes(xr, yr, 7.2, 5.0).shift(LEFT*1.5+DOWN*0.5)
 
     def s1_hook(self):
         t = Text("Electromagnetic Induction", font_size=40, color=WHITE).move_to(UP*0.5)
@@ -44,14 +28,14 @@ class InductionScene(Scene):
         sec_label(self, "Magnetic Flux and Induction")
         ax = self._axes(xr=(-0.3,6,1), yr=(-0.3,4,1))
         t = ValueTracker(0)
-        B_curve = ax.plot(lambda x: 2*np.sin(x), x_range=[0,5.5], color=BLUE, stroke_width=3)
+        B_curve = plot_curve(ax, lambda x: 2*np.sin(x), x_range=[0,5.5], color=BLUE, stroke_width=3)
         self.play(Create(ax), run_time=1.5)
         self.play(Create(B_curve), run_time=2.0); self.wait(0.8)
         r1 = Text("B(t) = B0 sin(t)  (alternating B field)", font_size=22, color=BLUE)
         self._rp(r1, y=2.5); b1 = self._box(r1, border=BLUE)
         self.play(FadeIn(b1), Write(r1), run_time=1.5); self.wait(2.3)
         self.play(FadeOut(b1), FadeOut(r1), run_time=0.3)
-        emf_curve = ax.plot(lambda x: -2*np.cos(x), x_range=[0,5.5], color=YELL, stroke_width=3)
+        emf_curve = plot_curve(ax, lambda x: -2*np.cos(x), x_range=[0,5.5], color=YELL, stroke_width=3)
         self.play(Create(emf_curve), run_time=2.0); self.wait(0.8)
         r2 = Text("EMF = -dB/dt = -B0 cos(t)\n90 degree phase shift!", font_size=22, color=YELL)
         self._rp(r2, y=2.5); b2 = self._box(r2, border=YELL)
@@ -1,6 +1,7 @@
 """phys_05_wave_propagation.py — Wave Propagation"""
 from manim import *
 from la_utils import *
+from wave_utils import simulate_1d, simulate_em, simulate_2d, WaveCurve, WaveImage, PlayWave
 import numpy as np
 
 
@@ -9,10 +10,34 @@ class WavePropagationScene(Scene):
         self.camera.background_color = BG
         sec_label(self, "Wave Propagation")
         axes = Axes(x_range=[0, 6, 1], y_range=[-1.5, 1.5, 0.5], x_length=7, y_length=3,
-                    axis_config={"color": "#555", "include_numbers": False})
-        wave = axes.plot(lambda x: np.sin(x), x_range=[0, 6], color=BLUE)
-        self.play(Create(axes), Create(wave)); self.wait(0.5)
+                    axis_config={"color": "#555", "include_numbers": False}).shift(DOWN * 0.6)
+        self.play(Create(axes)); self.wait(0.5)
         txt = Text("E and B oscillate.\nWave travels at c.", font_size=28, color=WHITE)
-        txt.move_to(UP * 2)
+        txt.move_to(UP * 2.6)
         bl = text_box(txt, border=YELL)
-        self.play(FadeIn(bl), Write(txt)); self.wait(3)
+        self.play(FadeIn(bl), Write(txt))
+
+        # E in the page, B drawn along an oblique axis out of it; both from one Yee run
+        em = simulate_em(length=6, duration=9, sources=[(0.0, 0.5, 1.0)])
+        e = WaveCurve(axes, em, channel=0, color=BLUE)
+        b = WaveCurve(axes, em, channel=1, direction=LEFT * 0.35 + DOWN * 0.45, color=RED)
+        keys = VGroup(Text("E", font_size=24, color=BLUE), Text("B", font_size=24, color=RED))
+        keys.arrange(DOWN, buff=0.2).next_to(axes, LEFT, buff=0.3)
+        self.add(b, e); self.play(FadeIn(keys), run_time=0.5)
+        self.play(PlayWave(VGroup(e, b), 0, 9), run_time=9)
+        self.play(FadeOut(e), FadeOut(b), FadeOut(keys), run_time=0.5)
+
+        # a pulse on a string with a fixed far end comes back upside down
+        string = WaveCurve(axes, simulate_1d(duration=8, pulses=[(1.0, 0.3, 1.0, 1)], boundary="fixed"), color=YELL)
+        cap = Text("Fixed end: the pulse reflects inverted.", font_size=24, color=WHITE).move_to(DOWN * 3.2)
+        self.play(Create(string), FadeIn(cap), run_time=1.0)
+        self.play(PlayWave(string, 0, 8), run_time=8)
+        self.play(FadeOut(string), FadeOut(cap), FadeOut(axes), run_time=0.5)
+
+        # two in-phase sources: crests add along some directions, cancel along others
+        pond = WaveImage(simulate_2d(duration=8, sources=[(-1.0, -2.2, 1.0, 1.0), (1.0, -2.2, 1.0, 1.0)]),
+                         height=4.6, vmax=0.3).move_to(DOWN * 1.0)
+        cap = Text("Two sources: interference.", font_size=24, color=WHITE).move_to(DOWN * 3.6)
+        self.play(FadeIn(pond), FadeIn(cap), run_time=0.5)
+        self.play(PlayWave(pond, 0, 8), run_time=8)
+        self.wait(2)
@@ -0,0 +1,190 @@
+"""Trace-driven sorting animations for the algo_* scenes.
+
+The tracers run the real algorithm on a copy of the input and yield its
+events instead of sorting silently:
+
+  ("compare", i, j)   slots i and j compared
+  ("swap", i, j)      slots i and j exchanged
+  ("merge", lo, src)  slots lo… refilled from the old slots in *src*, in order
+  ("pivot", k)        slot k holds the partition pivot
+  ("done", lo, hi)    slots lo…hi-1 are in their final place
+
+SortBars draws every bar in a handful of VMobjects (one per highlight
+colour), and play_sort() applies the events in batches: each batch is ONE
+animation that slides every bar from where it was to where it ends up, so
+a bar pushed along a whole pass moves once.  The number of plays is set by
+*max_plays*, not by the number of events, so 64+ bars cost about the same
+as 8.
+
+Usage:
+    bars = SortBars(values)
+    self.play(FadeIn(bars))
+    play_sort(self, bars, bubble_sort_trace(values))
+"""
+import math
+
+from manim import *
+import numpy as np
+
+from la_utils import BLUE, YELL, RED, GREEN
+
+
+# ── Tracers ──────────────────────────────────────────────────────────────────
+def bubble_sort_trace(values):
+    a = list(values)
+    for end in range(len(a) - 1, 0, -1):
+        swapped = False
+        for i in range(end):
+            yield ("compare", i, i + 1)
+            if a[i] > a[i + 1]:
+                a[i], a[i + 1] = a[i + 1], a[i]
+                swapped = True
+                yield ("swap", i, i + 1)
+        yield ("done", end, end + 1)
+        if not swapped:
+            break
+    yield ("done", 0, len(a))
+
+
+def quicksort_trace(values):
+    """Lomuto partition, last element as pivot."""
+    a = list(values)
+
+    def sort(lo, hi):
+        if hi - lo < 2:
+            if hi - lo == 1:
+                yield ("done", lo, hi)
+            return
+        p = hi - 1
+        yield ("pivot", p)
+        i = lo
+        for j in range(lo, p):
+            yield ("compare", j, p)
+            if a[j] < a[p]:
+                if i != j:
+                    a[i], a[j] = a[j], a[i]
+                    yield ("swap", i, j)
+                i += 1
+        if i != p:
+            a[i], a[p] = a[p], a[i]
+            yield ("swap", i, p)
+        yield ("done", i, i + 1)
+        yield from sort(lo, i)
+        yield from sort(i + 1, hi)
+
+    yield from sort(0, len(a))
+
+
+def merge_sort_trace(values):
+    """Top-down merge sort; each merge is one ("merge", …) event."""
+    a = list(values)
+
+    def sort(lo, hi):
+        if hi - lo < 2:
+            return
+        mid = (lo + hi) // 2
+        yield from sort(lo, mid)
+        yield from sort(mid, hi)
+        i, j, src = lo, mid, []
+        while i < mid or j < hi:
+            if i < mid and j < hi:
+                yield ("compare", i, j)
+            if j >= hi or (i < mid and a[i] <= a[j]):
+                src.append(i)
+                i += 1
+            else:
+                src.append(j)
+                j += 1
+        a[lo:hi] = [a[k] for k in src]
+        yield ("merge", lo, src)
+
+    yield from sort(0, len(a))
+    yield ("done", 0, len(a))
+
+
+# ── Bars ─────────────────────────────────────────────────────────────────────
+BASE, COMPARED, PIVOT, DONE = range(4)   # highlight states, drawn in this order
+
+def _rect_points(x, y0, w, h):
+    """Bezier points for N axis-aligned rectangles (centre x, bottom y0)."""
+    l, r, top = x - w / 2, x + w / 2, y0 + h
+    b = np.full_like(x, y0)
+    corners = np.stack([np.stack([l, b], 1), np.stack([r, b], 1), np.stack([r, top], 1),
+                        np.stack([l, top], 1), np.stack([l, b], 1)], axis=1)   # (N, 5, 2)
+    corners = np.concatenate([corners, np.zeros(corners.shape[:2] + (1,))], axis=2)
+    t = np.array([0, 1 / 3, 2 / 3, 1])[None, None, :, None]
+    pts = corners[:, :-1, None] + t * (corners[:, 1:] - corners[:, :-1])[:, :, None]
+    return pts.reshape(-1, 3)
+
+
+class SortBars(VGroup):
+    """Bars for *values* (heights ∝ value, the largest |value| *height* tall;
+    negative values hang below *bottom*) across *width*, bottoms at *bottom*.
+
+    Tracks which slot each bar is in and its highlight state; all bars of
+    one state share a VMobject, so a frame is four fills however many bars.
+    """
+    def __init__(self, values, width=10.0, height=4.0, bottom=-3.0,
+                 colors=(BLUE, YELL, RED, GREEN), **kwargs):
+        self.values = np.asarray(values, dtype=float)
+        n = len(self.values)
+        self.pitch = width / n
+        self.x0 = -width / 2 + self.pitch / 2
+        self.bottom = bottom
+        self.heights = height * self.values / max(np.abs(self.values).max(), 1e-9)   # all-zero/negative safe
+        self.slot = np.arange(n)                  # bar → slot
+        self.state = np.full(n, BASE)
+        parts = [VMobject(fill_color=c, fill_opacity=1, stroke_width=0) for c in colors]
+        super().__init__(*parts, **kwargs)
+        self.draw(self.slot, self.state)
+
+    def draw(self, slots, state):
+        """Redraw with bar k centred on (fractional) slot slots[k]."""
+        x = self.x0 + np.asarray(slots, dtype=float) * self.pitch
+        for s, part in enumerate(self.submobjects):
+            k = state == s
+            part.points = _rect_points(x[k], self.bottom, self.pitch * 0.8, self.heights[k])
+        return self
+
+    def apply(self, event, marks):
+        """Apply one trace event to the slots; highlights go into *marks*."""
+        bar_at = np.argsort(self.slot)            # slot → bar
+        kind = event[0]
+        if kind == "compare":
+            marks[bar_at[[event[1], event[2]]]] = COMPARED
+        elif kind == "swap":
+            i, j = event[1], event[2]
+            self.slot[bar_at[i]], self.slot[bar_at[j]] = j, i
+        elif kind == "merge":
+            lo, src = event[1], event[2]
+            self.slot[bar_at[src]] = lo + np.arange(len(src))
+        elif kind == "pivot":
+            marks[bar_at[event[1]]] = PIVOT
+        elif kind == "done":
+            self.state[bar_at[event[1]:event[2]]] = DONE
+
+
+class SortStep(Animation):
+    """Every bar slides from slot *src* to slot *dst* at once, coloured by *state*."""
+    def __init__(self, bars, src, dst, state, **kwargs):
+        self.src, self.dst, self.marks = src.astype(float), dst.astype(float), state
+        super().__init__(bars, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.draw(self.src + (self.dst - self.src) * t, self.marks)
+
+
+def play_sort(scene, bars, events, max_plays=40, step_time=0.3):
+    """Play *events* on *bars* as at most *max_plays* batched steps (plus a
+    final all-sorted one).  Returns the number of events."""
+    events = list(events)
+    per = max(1, math.ceil(len(events) / max_plays))
+    for start in range(0, len(events), per):
+        src, marks = bars.slot.copy(), np.full(len(bars.slot), BASE)
+        for event in events[start:start + per]:
+            bars.apply(event, marks)
+        state = np.where(bars.state == DONE, DONE, marks)
+        scene.play(SortStep(bars, src, bars.slot, state), run_time=step_time)
+    scene.play(SortStep(bars, bars.slot, bars.slot, bars.state), run_time=step_time)
+    return len(events)
@@ -0,0 +1,275 @@
+"""Precomputed wave solutions for the phys_* wave scenes.
+
+The solvers step a finite-difference scheme over the whole grid at once
+and store the run as a float32 array of frames (*rate* per second of
+simulated time).  Each run is saved under output/cache/waves/, keyed on
+its parameters only, and memory-mapped back, so a scene animates by
+indexing frames: nothing is re-evaluated per frame, and every quality,
+fps and section render reuses the same file.
+
+  simulate_1d   scalar wave on a string: pulses, driven ends, fixed / free
+                / open boundaries (reflection, superposition)
+  simulate_em   coupled E and B of a plane wave (1D Yee scheme)
+  simulate_2d   scalar wave on a membrane: point sources, open or fixed
+                edges (interference, diffraction)
+
+WaveCurve (1D) and WaveImage (2D) draw a series at a time t; PlayWave
+runs them from t0 to t1.
+
+Usage:
+    em = simulate_em(length=6, duration=8, sources=[(0.0, 1.0, 1.0)])
+    e = WaveCurve(axes, em, channel=0, color=BLUE)
+    self.play(PlayWave(e, 0, 8), run_time=8)
+"""
+import hashlib
+import json
+import os
+
+from manim import *
+import numpy as np
+
+from la_utils import BG, BLUE, RED
+from manim_utils import _plane_frame
+
+WAVE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "output", "cache", "waves")
+SOLVER_VERSION = 1      # bump when a scheme changes, so stale runs are not reused
+
+
+# ── Series ───────────────────────────────────────────────────────────────────
+class WaveSeries:
+    """Frames of a run: data[k] is the field at time k / rate; x (and y for
+    2D) are the grid coordinates."""
+    def __init__(self, data, rate, x, y=None):
+        self.data, self.rate, self.x, self.y = data, rate, x, y
+
+    @property
+    def duration(self):
+        return (len(self.data) - 1) / self.rate
+
+    def at(self, t):
+        """Field at time *t*, linearly interpolated between stored frames."""
+        s = min(max(t * self.rate, 0.0), len(self.data) - 1.0)
+        k = min(int(s), len(self.data) - 2)
+        a = s - k
+        return (1 - a) * self.data[k] + a * self.data[k + 1]
+
+
+_SERIES = {}    # cache path → memory-mapped data
+
+def _cached(kind, params, solve):
+    """Frames of *solve()*, computed once per *params* and kept on disk."""
+    digest = hashlib.sha256(json.dumps([kind, SOLVER_VERSION, params], sort_keys=True).encode()).hexdigest()
+    path = os.path.join(WAVE_CACHE_DIR, f"{kind}-{digest[:20]}.npy")
+    data = _SERIES.get(path)
+    if data is None:
+        if not os.path.exists(path):
+            os.makedirs(WAVE_CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp.npy"
+            np.save(tmp, np.asarray(solve(), dtype=np.float32))
+            os.replace(tmp, path)
+        data = _SERIES[path] = np.load(path, mmap_mode="r")
+    return data
+
+
+# ── Solvers ──────────────────────────────────────────────────────────────────
+def _record(steps_per_frame, frames, step, state):
+    """Run *step* (state → state, field) and keep every steps_per_frame-th field."""
+    out = []
+    for k in range(frames * steps_per_frame + 1):
+        if k % steps_per_frame == 0:
+            out.append(np.array(state[0], dtype=np.float32))
+        state = step(state, k)
+    return np.stack(out)
+
+
+def simulate_1d(length=6.0, n=600, c=1.0, duration=8.0, rate=30, pulses=(), sources=(),
+                boundary="fixed", courant=0.9):
+    """Leapfrog u_tt = c² u_xx on [0, length].
+
+    pulses:   (x0, width, amplitude, direction) Gaussians; direction +1
+              travels right, −1 left, 0 splits both ways
+    sources:  (x, frequency, amplitude) points driven as A·sin(2πft)
+    boundary: "fixed" (inverting reflection), "free" (upright reflection)
+              or "open" (absorbing, first-order Mur)
+    """
+    params = dict(length=length, n=n, c=c, duration=duration, rate=rate, pulses=list(map(list, pulses)),
+                  sources=list(map(list, sources)), boundary=boundary, courant=courant)
+    x = np.linspace(0, length, n)
+
+    def solve():
+        dx = x[1] - x[0]
+        per = max(1, int(np.ceil(c / (courant * dx * rate))))    # steps per stored frame
+        dt = 1 / (rate * per)
+        s2, mur = (c * dt / dx) ** 2, (c * dt - dx) / (c * dt + dx)
+        u = np.zeros(n)
+        prev = np.zeros(n)
+        for x0, w, a, d in pulses:
+            u += a * np.exp(-((x - x0) / w) ** 2)
+            prev += a * np.exp(-((x + d * c * dt - x0) / w) ** 2)
+        idx = [(int(round(xs / dx)), f, a) for xs, f, a in sources]
+
+        def step(state, k):
+            u, prev = state
+            nxt = np.empty_like(u)
+            nxt[1:-1] = 2 * u[1:-1] - prev[1:-1] + s2 * (u[2:] - 2 * u[1:-1] + u[:-2])
+            if boundary == "fixed":
+                nxt[0] = nxt[-1] = 0
+            elif boundary == "free":
+                nxt[0], nxt[-1] = nxt[1], nxt[-2]
+            else:
+                nxt[0] = u[1] + mur * (nxt[1] - u[0])
+                nxt[-1] = u[-2] + mur * (nxt[-2] - u[-1])
+            for i, f, a in idx:
+                nxt[i] = a * np.sin(2 * np.pi * f * (k + 1) * dt)
+            return nxt, u
+
+        return _record(per, int(round(duration * rate)), step, (u, prev))
+
+    return WaveSeries(_cached("wave1d", params, solve), rate, x)
+
+
+def simulate_em(length=6.0, n=600, duration=8.0, rate=30, sources=(), pulses=(), c=1.0):
+    """Plane wave along x (E along y, B along z) by the 1D Yee scheme.
+
+    E sits on the grid nodes and B half a cell over.  The cell is sized so
+    that c·dt = dx (about *n* nodes): at that Courant number the scheme is
+    exact, so pulses keep their shape and the ends absorb perfectly.
+    sources are (x, frequency, amplitude) driven E; pulses are
+    right-moving Gaussians (x0, width, amplitude).  Frames are (2, nodes):
+    E, and B (×c, interpolated to the nodes).
+    """
+    params = dict(length=length, n=n, duration=duration, rate=rate, sources=list(map(list, sources)),
+                  pulses=list(map(list, pulses)), c=c)
+    per = max(1, int(np.ceil(c * (n - 1) / (length * rate))))      # steps per stored frame
+    dt = 1 / (rate * per)
+    dx = c * dt
+    x = np.arange(int(round(length / dx)) + 1) * dx
+
+    def solve():
+        n, k = len(x), 1.0
+        e, b = np.zeros(n), np.zeros(n - 1)
+        xb = (x[1:] + x[:-1]) / 2
+        for x0, w, a in pulses:
+            e += a * np.exp(-((x - x0) / w) ** 2)
+            b += a * np.exp(-((xb + c * dt / 2 - x0) / w) ** 2)     # half a step behind E
+        idx = [(int(round(xs / dx)), f, a) for xs, f, a in sources]
+
+        def fields(e, b):
+            bn = np.concatenate([b[:1], (b[1:] + b[:-1]) / 2, b[-1:]])
+            return np.stack([e, bn])
+
+        def step(state, t):
+            _, e, b = state
+            e_old = e.copy()
+            b = b - k * (e[1:] - e[:-1])
+            e = e.copy()
+            e[1:-1] -= k * (b[1:] - b[:-1])
+            e[0], e[-1] = e_old[1], e_old[-2]                          # Mur at k = 1
+            for i, f, a in idx:
+                e[i] = a * np.sin(2 * np.pi * f * (t + 1) * dt)
+            return fields(e, b), e, b
+
+        return _record(per, int(round(duration * rate)), step, (fields(e, b), e, b))
+
+    return WaveSeries(_cached("em1d", params, solve), rate, x)
+
+
+def simulate_2d(size=(12.0, 7.0), cells=(240, 140), c=1.0, duration=8.0, rate=30, sources=(), pulses=(),
+                boundary="open", sponge=16, courant=0.5):
+    """Leapfrog u_tt = c² ∇²u on a size[0] × size[1] membrane (origin at its centre).
+
+    sources:  (x, y, frequency, amplitude) points driven as A·sin(2πft)
+    pulses:   (x, y, width, amplitude) Gaussian bumps at rest
+    boundary: "open" (a *sponge*-cell damping layer) or "fixed"
+    Frames are (rows, cols) with row 0 at the bottom.
+    """
+    params = dict(size=list(size), cells=list(cells), c=c, duration=duration, rate=rate,
+                  sources=list(map(list, sources)), pulses=list(map(list, pulses)),
+                  boundary=boundary, sponge=sponge, courant=courant)
+    x = np.linspace(-size[0] / 2, size[0] / 2, cells[0])
+    y = np.linspace(-size[1] / 2, size[1] / 2, cells[1])
+
+    def solve():
+        dx = x[1] - x[0]
+        per = max(1, int(np.ceil(c / (courant * dx * rate))))
+        dt = 1 / (rate * per)
+        s2 = (c * dt / dx) ** 2
+        gx, gy = np.meshgrid(x, y)
+        u = np.zeros(gx.shape)
+        for x0, y0, w, a in pulses:
+            u += a * np.exp(-((gx - x0) ** 2 + (gy - y0) ** 2) / w ** 2)
+        damp = np.ones(gx.shape)
+        if boundary == "open" and sponge:
+            i, j = np.indices(gx.shape)
+            edge = np.minimum.reduce([i, j, gx.shape[0] - 1 - i, gx.shape[1] - 1 - j])
+            damp = 1 - 0.08 * np.clip(1 - edge / sponge, 0, 1) ** 2
+        idx = [(int(np.abs(y - ys).argmin()), int(np.abs(x - xs).argmin()), f, a) for xs, ys, f, a in sources]
+
+        def step(state, k):
+            u, prev = state
+            nxt = np.zeros_like(u)
+            nxt[1:-1, 1:-1] = (2 * u[1:-1, 1:-1] - prev[1:-1, 1:-1]
+                               + s2 * (u[2:, 1:-1] + u[:-2, 1:-1] + u[1:-1, 2:] + u[1:-1, :-2] - 4 * u[1:-1, 1:-1]))
+            nxt *= damp
+            for i, j, f, a in idx:
+                nxt[i, j] = a * np.sin(2 * np.pi * f * (k + 1) * dt)
+            return nxt, u
+
+        return _record(per, int(round(duration * rate)), step, (u, u.copy()))
+
+    return WaveSeries(_cached("wave2d", params, solve), rate, x, y)
+
+
+# ── Mobjects ─────────────────────────────────────────────────────────────────
+class WaveCurve(VMobject):
+    """A 1D series drawn on *axes* at time t: height along the axes' y, or
+    along *direction* (scene vector per unit amplitude, e.g. an oblique
+    axis for B).  *channel* picks E (0) or B (1) from simulate_em."""
+    def __init__(self, axes, series, channel=None, direction=None, t=0.0, **kwargs):
+        self.series, self.channel = series, channel
+        o, ex, ey = _plane_frame(axes)
+        self.base = o + series.x[:, None] * ex
+        self.up = ey if direction is None else np.asarray(direction, dtype=float)
+        super().__init__(**kwargs)
+        self.set_time(t)
+
+    def set_time(self, t):
+        u = self.series.at(t)
+        if self.channel is not None:
+            u = u[self.channel]
+        self.set_points_as_corners(self.base + u[:, None] * self.up)
+        return self
+
+
+class WaveImage(ImageMobject):
+    """A 2D series as an image *height* scene units tall at time t: troughs
+    *neg*, crests *pos*, rest *bg*, saturating at ±vmax."""
+    def __init__(self, series, height=4.0, vmax=0.5, neg=BLUE, pos=RED, bg=BG, t=0.0, **kwargs):
+        self.series, self.vmax = series, vmax
+        self.cols = [np.array(ManimColor(c).to_rgb()) * 255 for c in (neg, bg, pos)]
+        super().__init__(self._pixels(t), **kwargs)
+        self.height = height
+
+    def _pixels(self, t):
+        v = np.clip(self.series.at(t)[::-1] / self.vmax, -1, 1)[..., None]    # row 0 at the top
+        neg, bg, pos = self.cols
+        rgb = bg + np.where(v < 0, -v * (neg - bg), v * (pos - bg))
+        return np.dstack([rgb, np.full(v.shape[:2], 255.0)]).astype(np.uint8)
+
+    def set_time(self, t):
+        self.pixel_array = self._pixels(t)
+        return self
+
+
+class PlayWave(Animation):
+    """Run a WaveCurve / WaveImage (or a group of them) from t0 to t1 of
+    simulated time, at constant speed by default."""
+    def __init__(self, mob, t0, t1, rate_func=linear, **kwargs):
+        self.t0, self.t1 = t0, t1
+        super().__init__(mob, rate_func=rate_func, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        t = self.t0 + (self.t1 - self.t0) * self.rate_func(alpha)
+        for m in self.mobject.get_family():
+            if hasattr(m, "set_time"):
+                m.set_time(t)
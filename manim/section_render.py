@@ -0,0 +1,269 @@
+"""
+Section-aware renderer for the six-section scenes (s1_hook … s6_summary).
+
+Every gold-standard scene (la_utils.SixSectionScene) clears the screen
+with `_fade_all()` between sections, so each section can be rendered on
+its own.  This tool renders each `sN_*` method (plus the `_fade_all`
+that follows it) as a separate movie, caches it under a hash of the
+section's source and everything it calls, and stitches the final MP4
+from the cached parts without re-encoding.  Editing one section
+re-renders only that section.
+
+Because the sections are independent, the ones that need rendering can
+also run in separate processes at once (--jobs), so a cold render takes
+about as long as its slowest section instead of the sum of all six.
+
+Run: python section_render.py derivative.py DerivativeScene -qm
+     python section_render.py derivative.py DerivativeScene -qm --jobs 6
+"""
+import argparse
+import ast
+import hashlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+
+import scene_runner
+from scene_runner import OUTPUT_DIR, QUALITY, SCENES_DIR
+
+SECTIONS_DIR = os.path.join(OUTPUT_DIR, "sections")
+SECTION_RE   = re.compile(r"^s(\d+)_\w+$")
+
+
+# ── Section discovery ────────────────────────────────────────────────────────
+def discover_sections(scene_cls):
+    """['s1_hook', 's2_geometry', …] in play order."""
+    names = [n for n in dir(scene_cls) if SECTION_RE.match(n) and callable(getattr(scene_cls, n))]
+    return sorted(names, key=lambda n: int(SECTION_RE.match(n).group(1)))
+
+
+# ── Dependency hashing ───────────────────────────────────────────────────────
+def _is_local(obj):
+    """True for functions/classes defined in manim/scenes (la_utils, the scene)."""
+    try:
+        src = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return bool(src) and os.path.dirname(os.path.abspath(src)) == SCENES_DIR
+
+
+def _referenced_names(func):
+    """Global names and `self.<attr>` names used inside *func*."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    globals_, attrs = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            globals_.add(node.id)
+        elif (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+              and node.value.id == "self"):
+            attrs.add(node.attr)
+    return globals_, attrs
+
+
+def _digest_into(h, func, scene_cls, seen):
+    """Feed *func*'s source and, recursively, its local dependencies into *h*."""
+    key = getattr(func, "__qualname__", repr(func)) + ":" + getattr(func, "__module__", "")
+    if key in seen:
+        return
+    seen.add(key)
+    h.update(inspect.getsource(func).encode())
+
+    globals_, attrs = _referenced_names(func)
+    namespace = getattr(func, "__globals__", {})
+    deps = [(n, namespace[n]) for n in sorted(globals_) if n in namespace]
+    deps += [(f"self.{a}", getattr(scene_cls, a)) for a in sorted(attrs) if hasattr(scene_cls, a)]
+    for name, obj in deps:
+        if inspect.isfunction(obj) or inspect.isclass(obj):
+            if _is_local(obj):
+                _digest_into(h, obj, scene_cls, seen)
+        elif isinstance(obj, (int, float, str, bool, tuple, list, dict)) or type(obj).__module__ == "numpy":
+            # Constants: palette colours, AX_COLOR, class-level matrices, …
+            h.update(f"{name}={obj!r}".encode())
+
+
+def section_hash(scene_cls, name, last, quality, fps, freeze_waits=False):
+    """Hash of one section: its source, everything it calls, render settings
+    (including how waits are encoded: held-frame parts are not interchangeable
+    with frame-by-frame ones)."""
+    h = hashlib.sha256()
+    h.update(f"manim={version('manim')} q={quality} fps={fps} last={last} freeze={int(bool(freeze_waits))}".encode())
+    seen = set()
+    _digest_into(h, getattr(scene_cls, name), scene_cls, seen)
+    if hasattr(scene_cls, "run_section"):
+        # la_utils.SixSectionScene: the hooks and the closing fade
+        _digest_into(h, scene_cls.run_section, scene_cls, seen)
+    elif not last:
+        _digest_into(h, scene_cls._fade_all, scene_cls, seen)
+    bg = _background(scene_cls)
+    h.update(f"bg={bg}".encode())
+    return h.hexdigest()[:16]
+
+
+def _background(scene_cls):
+    return getattr(sys.modules[scene_cls.__module__], "BG", None)
+
+
+# ── Rendering ────────────────────────────────────────────────────────────────
+def section_scene(scene_cls, name, last):
+    """Scene subclass whose construct() plays only section *name*."""
+    bg = _background(scene_cls)
+
+    def construct(self):
+        if bg is not None:
+            self.camera.background_color = bg
+        if hasattr(self, "run_section"):
+            self.run_section(name, last)
+            return
+        getattr(self, name)()
+        if not last:
+            self._fade_all()
+
+    return type(f"{scene_cls.__name__}_{name}", (scene_cls,), {"construct": construct})
+
+
+def render_section(scene_file, cls_name, name, last, quality, fps, dest, freeze_waits=False):
+    """Render one section of *cls_name* into *dest* (plus its timeline
+    manifest). Returns seconds taken."""
+    from manim import config, tempconfig
+    from manifest import write_manifest
+
+    t0 = time.perf_counter()
+    with tempconfig(scene_runner.render_config(scene_file)):
+        config.quality = QUALITY[quality]
+        config.frame_rate = fps
+        scene_cls = section_scene(scene_runner.load_scene_class(scene_file, cls_name), name, last)
+        scene = scene_runner.make_scene(scene_cls, freeze_waits)
+        scene.render()
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        os.replace(str(scene.renderer.file_writer.movie_file_path), dest)
+        write_manifest(scene, dest, scene_file, cls_name)
+    return round(time.perf_counter() - t0, 3)
+
+
+def concat_movies(parts, dest, ffmpeg="ffmpeg"):
+    """Join same-codec MP4s with the concat demuxer (-c copy, no re-encode)."""
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    list_file = dest + ".parts.txt"
+    with open(list_file, "w", encoding="utf-8") as f:
+        for p in parts:
+            f.write(f"file '{p.replace(os.sep, '/')}'\n")
+    cmd = [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+           "-i", list_file, "-c", "copy", dest]
+    try:
+        subprocess.run(cmd, check=True)
+    finally:
+        os.remove(list_file)
+
+
+def merge_manifests(scene_file, cls_name, names, parts, movie):
+    """Write *movie*'s timeline manifest from the per-section ones, shifting
+    each section's events by the length of the sections before it."""
+    from manifest import build_manifest, load_manifest, save_manifest, sidecar_path
+
+    if not all(os.path.exists(sidecar_path(p)) for p in parts):
+        # A section cached before manifests existed: no complete timeline
+        if os.path.exists(sidecar_path(movie)):
+            os.remove(sidecar_path(movie))
+        return None
+    events, marks, offset = [], [], 0.0
+    for name, part in zip(names, parts):
+        m = load_manifest(part)
+        shift = len(events)
+        for e in m["events"]:
+            # the trailing _fade_all() runs outside the section method
+            events.append(dict(e, i=e["i"] + shift, section=e["section"] or name,
+                               start=round(e["start"] + offset, 4)))
+        marks += [dict(k, first=k["first"] + shift, last=k["last"] + shift) for k in m.get("marks", [])]
+        offset += m["duration"]
+    data = build_manifest(scene_file, cls_name, events, m["fps"], m["width"], m["height"],
+                          os.path.dirname(movie), marks)
+    save_manifest(data, movie)
+    return data
+
+
+def render_sections(scene_file, cls_name, quality="m", fps=30, force=False, jobs=1, freeze_waits=False):
+    """Render *cls_name* section by section, re-using cached sections.
+
+    Sections that need rendering run in up to *jobs* processes at once;
+    *freeze_waits* encodes static waits as held frames (freeze_frames.py).
+    Returns {"movie", "path", "timings", "sections": [{"name", "hash", "cached", "seconds"}]}.
+    """
+    from manim import config, tempconfig
+
+    t0 = time.perf_counter()
+    scene_cls = scene_runner.load_scene_class(scene_file, cls_name)
+    names = discover_sections(scene_cls)
+    if not names:
+        raise LookupError(f"{cls_name} has no s1_…s6_ section methods")
+
+    module = os.path.splitext(os.path.basename(scene_file))[0]
+    with tempconfig({}):
+        config.quality = QUALITY[quality]
+        config.frame_rate = fps
+        res_dir = f"{config.pixel_height}p{config.frame_rate}"
+        ffmpeg = str(getattr(config, "ffmpeg_executable", "ffmpeg"))   # gone from config in 0.19
+    cache_dir = os.path.join(SECTIONS_DIR, module, res_dir)
+
+    report, parts, todo = [], [], []
+    for i, name in enumerate(names):
+        last = i == len(names) - 1
+        digest = section_hash(scene_cls, name, last, quality, fps, freeze_waits)
+        part = os.path.join(cache_dir, f"{cls_name}.{name}.{digest}.mp4")
+        cached = os.path.exists(part) and not force
+        report.append({"name": name, "hash": digest, "cached": cached, "seconds": 0.0})
+        parts.append(part)
+        if not cached:
+            todo.append((report[-1], (scene_file, cls_name, name, last, quality, fps, part, freeze_waits)))
+
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            futures = [(entry, pool.submit(render_section, *job)) for entry, job in todo]
+            for entry, fut in futures:
+                entry["seconds"] = fut.result()
+    else:
+        for entry, job in todo:
+            entry["seconds"] = render_section(*job)
+
+    movie = os.path.join(scene_runner.VIDEOS_DIR, module, res_dir, f"{cls_name}.mp4")
+    concat_movies(parts, movie, ffmpeg)
+    merge_manifests(scene_file, cls_name, names, parts, movie)
+    with open(os.path.join(cache_dir, f"{cls_name}.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return {
+        "movie": movie,
+        "path": scene_runner.video_url_path(movie),
+        "timings": {"render": round(time.perf_counter() - t0, 3)},
+        "sections": report,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Render a six-section scene with a per-section cache.")
+    ap.add_argument("file", help="scene file, relative to manim/scenes")
+    ap.add_argument("cls", help="Scene class name")
+    for letter in QUALITY:
+        ap.add_argument(f"-q{letter}", dest="quality", action="store_const", const=letter)
+    ap.add_argument("--fps", type=int, default=30)
+    ap.add_argument("--force", action="store_true", help="ignore cached sections")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="render up to N sections in parallel")
+    ap.add_argument("--freeze-waits", action="store_true", help="encode static waits as one held frame")
+    ap.set_defaults(quality="m")
+    args = ap.parse_args()
+
+    out = render_sections(args.file, args.cls, args.quality, args.fps, args.force, args.jobs,
+                          args.freeze_waits)
+    for s in out["sections"]:
+        state = "cached" if s["cached"] else f"rendered in {s['seconds']:.1f}s"
+        print(f"  {s['name']:<14} {s['hash']}  {state}")
+    print(f"→ {out['movie']}  ({out['timings']['render']:.1f}s wall)")
+
+
+if __name__ == "__main__":
+    main()
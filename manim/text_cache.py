@@ -0,0 +1,256 @@
+"""
+Persistent glyph-geometry cache for manim's Text().
+
+Every Text() runs Pango to lay the string out as an SVG and then parses that
+SVG into one VMobject per glyph.  manim keeps the SVG under media/texts, but
+keyed on the colour, and parses it again in every process — and the scenes
+build the same titles, sec_label headings and summary boxes over and over.
+
+install() patches Text so the parsed glyph outlines are stored under
+output/cache/text/, keyed on everything that shapes them (string, font,
+slant, weight, size, line spacing, per-substring font/slant/weight, canvas
+size, manim and manimpango versions) but not the colour.  A hit skips both
+Pango and the SVG parse: the glyphs are rebuilt from the stored points and
+recoloured.  Entries are written atomically, so every render process and
+section worker shares one cache.
+
+Only plain Text() is cached; MarkupText and Tex are left alone.  Text with
+t2c/t2g/gradient keeps its colours in the key, since its glyphs are not all
+one colour.
+
+Run: python text_cache.py bench limit.py LimitScene   (stock vs cold vs warm construct time)
+     python text_cache.py bench --gen-scenes2          (every scene _gen_scenes2.py writes, as a table)
+     python text_cache.py stats
+     python text_cache.py clear
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import shutil
+from importlib.metadata import version
+
+import numpy as np
+
+from scene_runner import OUTPUT_DIR, SCENES_DIR, scene_classes, scene_path
+
+TEXT_CACHE_DIR = os.path.join(OUTPUT_DIR, "cache", "text")
+
+ENABLED = True      # install() is a no-op when False (bench's stock run)
+
+_memo = {}          # key → entry, so repeated strings in one process skip the disk
+_installed = None   # (Text._text2svg, Text.init_svg_mobject) before patching
+
+
+# ── Keys ─────────────────────────────────────────────────────────────────────
+def glyph_key(text):
+    """Colour-free key for a Text whose layout settings are set (see _text2svg)."""
+    from manim import config
+
+    shape = [
+        text.text, text.font, text.slant, text.weight,
+        sorted(text.t2f.items()), sorted(text.t2s.items()), sorted(text.t2w.items()),
+        text.line_spacing, text._font_size, text.disable_ligatures,
+        config.pixel_width, config.pixel_height, str(config.renderer),
+        version("manim"), version("manimpango"),
+    ]
+    if text.t2c or text.t2g or text.gradient:
+        # per-glyph colours: only valid for this exact colouring
+        shape += [sorted(text.t2c.items()), sorted(text.t2g.items()), text.gradient, text._glyph_color]
+    return hashlib.sha256(json.dumps(shape, default=str).encode()).hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(TEXT_CACHE_DIR, key[:2], key + ".npz")
+
+
+# ── Store ────────────────────────────────────────────────────────────────────
+def save_glyphs(key, glyphs, color):
+    """Write the parsed *glyphs* (VMobjects) of a Text drawn in *color*."""
+    entry = {
+        "points": [np.asarray(g.points, dtype=np.float64) for g in glyphs],
+        "styles": [[g.get_fill_color().to_hex().upper(), float(g.get_fill_opacity()),
+                    g.get_stroke_color().to_hex().upper(), float(g.get_stroke_width()),
+                    float(g.get_stroke_opacity())] for g in glyphs],
+        "color": color,
+    }
+    _memo[key] = entry
+    path = _entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp.npz"
+    offsets = np.cumsum([0] + [len(p) for p in entry["points"]])
+    np.savez(tmp, points=np.concatenate(entry["points"]) if glyphs else np.zeros((0, 3)),
+             offsets=offsets, meta=json.dumps({"styles": entry["styles"], "color": color}))
+    os.replace(tmp, path)
+
+
+def load_glyphs(key):
+    """Stored entry for *key*, or None."""
+    if key in _memo:
+        return _memo[key]
+    try:
+        with np.load(_entry_path(key)) as data:
+            points, offsets, meta = data["points"], data["offsets"], json.loads(str(data["meta"]))
+    except (OSError, ValueError, KeyError):
+        return None
+    entry = {
+        "points": [points[a:b] for a, b in zip(offsets[:-1], offsets[1:])],
+        "styles": meta["styles"],
+        "color": meta["color"],
+    }
+    _memo[key] = entry
+    return entry
+
+
+def build_glyphs(entry, color):
+    """VMobjects for *entry*, with its base colour swapped for *color*."""
+    from manim import VMobject
+
+    glyphs = []
+    for points, (fill, fill_opacity, stroke, stroke_width, stroke_opacity) in zip(entry["points"], entry["styles"]):
+        g = VMobject()
+        g.points = points.copy()
+        g.set_style(
+            fill_color=color if fill == entry["color"] else fill, fill_opacity=fill_opacity,
+            stroke_color=color if stroke == entry["color"] else stroke,
+            stroke_width=stroke_width, stroke_opacity=stroke_opacity,
+        )
+        glyphs.append(g)
+    return glyphs
+
+
+# ── Patch ────────────────────────────────────────────────────────────────────
+def install():
+    """Route Text() through the glyph cache (idempotent)."""
+    global _installed
+    if _installed or not ENABLED:
+        return
+    from manim import Text
+
+    text2svg, init_svg_mobject = Text._text2svg, Text.init_svg_mobject
+
+    def cached_text2svg(self, color):
+        self._glyph_color = str(color).upper()
+        self._glyph_key = glyph_key(self)
+        self._glyph_entry = load_glyphs(self._glyph_key)
+        if self._glyph_entry is None:
+            return text2svg(self, color)
+        # Text.__init__ still post-processes the file it is given; hand it a blank one
+        stub = os.path.join(TEXT_CACHE_DIR, "blank.svg")
+        if not os.path.exists(stub):
+            os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+            tmp = f"{stub}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write('<svg xmlns="http://www.w3.org/2000/svg"/>')
+            os.replace(tmp, stub)
+        return stub
+
+    def cached_init_svg_mobject(self, use_svg_cache):
+        # pop, so Text.copy() never deep-copies the shared entry
+        key, entry, color = (self.__dict__.pop(a, None) for a in ("_glyph_key", "_glyph_entry", "_glyph_color"))
+        if entry is not None:
+            self.add(*build_glyphs(entry, color))
+            return
+        init_svg_mobject(self, use_svg_cache)
+        if key:
+            save_glyphs(key, self.submobjects, color)
+
+    Text._text2svg, Text.init_svg_mobject = cached_text2svg, cached_init_svg_mobject
+    _installed = (text2svg, init_svg_mobject)
+
+
+def uninstall():
+    """Restore stock Text() (used by the benchmark)."""
+    global _installed
+    if _installed:
+        from manim import Text
+        Text._text2svg, Text.init_svg_mobject = _installed
+        _installed = None
+
+
+# ── Benchmark ────────────────────────────────────────────────────────────────
+def bench(scene_file, cls_name, runs=3):
+    """Dry-run construct time for *cls_name*: stock Text, cold cache, warm cache.
+
+    Cold runs against an empty scratch cache; warm runs hit the disk cache
+    with the in-process memo cleared, as a fresh render worker would.
+    """
+    global ENABLED, TEXT_CACHE_DIR
+    from timeline import timeline
+
+    def best(setup):
+        times = []
+        for _ in range(runs):
+            setup()
+            times.append(timeline(scene_file, cls_name)["cpu_ms"])
+        return min(times)
+
+    results, saved_dir = {}, TEXT_CACHE_DIR
+    TEXT_CACHE_DIR = os.path.join(saved_dir, "_bench")
+    try:
+        ENABLED = False
+        uninstall()
+        timeline(scene_file, cls_name)  # warm imports and manim's own media/texts SVGs
+        results["stock"] = best(lambda: None)
+        ENABLED = True
+        install()
+        results["cold"] = best(lambda: (_memo.clear(), shutil.rmtree(TEXT_CACHE_DIR, ignore_errors=True)))
+        results["warm"] = best(_memo.clear)
+    finally:
+        ENABLED = True
+        shutil.rmtree(TEXT_CACHE_DIR, ignore_errors=True)
+        TEXT_CACHE_DIR = saved_dir
+        _memo.clear()
+    return results
+
+
+def gen_scenes2():
+    """[(file, cls)] for the text-heavy gold-standard scenes _gen_scenes2.py
+    writes (the keys of its `scenes` dict, read by AST; nothing is run)."""
+    tree = ast.parse(open(os.path.join(SCENES_DIR, "_gen_scenes2.py"), encoding="utf-8").read())
+    files = next([k.value for k in node.value.keys]
+                 for node in tree.body
+                 if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "scenes")
+    return [(f, cls) for f in files if os.path.exists(scene_path(f)) for cls in scene_classes(f)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Persistent glyph cache for manim Text().")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("bench", help="construct time with stock Text vs cold/warm cache")
+    p.add_argument("file", nargs="?", help="scene file, relative to manim/scenes")
+    p.add_argument("cls", nargs="?", help="Scene class name")
+    p.add_argument("--gen-scenes2", action="store_true", help="bench every scene _gen_scenes2.py writes")
+    p.add_argument("--runs", type=int, default=3)
+    sub.add_parser("stats", help="entry count and size")
+    sub.add_parser("clear", help="delete every entry")
+    args = ap.parse_args()
+
+    if args.cmd == "bench" and args.gen_scenes2:
+        print(f"{'scene':<34} {'stock':>8} {'cold':>8} {'warm':>8}  (ms CPU)")
+        total = dict.fromkeys(("stock", "cold", "warm"), 0.0)
+        for scene_file, cls_name in gen_scenes2():
+            r = bench(scene_file, cls_name, args.runs)
+            total = {k: total[k] + r[k] for k in total}
+            print(f"{scene_file:<34} {r['stock']:8.0f} {r['cold']:8.0f} {r['warm']:8.0f}"
+                  f"  {r['stock'] / max(r['warm'], 1e-9):.1f}×")
+        print(f"{'total':<34} {total['stock']:8.0f} {total['cold']:8.0f} {total['warm']:8.0f}"
+              f"  {total['stock'] / max(total['warm'], 1e-9):.1f}×")
+    elif args.cmd == "bench":
+        if not (args.file and args.cls):
+            ap.error("bench needs FILE CLS or --gen-scenes2")
+        r = bench(args.file, args.cls, args.runs)
+        for name in ("stock", "cold", "warm"):
+            print(f"  {name:<6} {r[name]:8.0f} ms CPU")
+        print(f"→ warm cache {r['stock'] / max(r['warm'], 1e-9):.1f}× faster construct than stock")
+    elif args.cmd == "stats":
+        files = [os.path.join(d, f) for d, _, fs in os.walk(TEXT_CACHE_DIR) for f in fs if f.endswith(".npz")]
+        print(f"{len(files)} entries, {sum(os.path.getsize(f) for f in files) / 1e6:.1f} MB")
+    else:
+        shutil.rmtree(TEXT_CACHE_DIR, ignore_errors=True)
+        print(f"cleared {TEXT_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
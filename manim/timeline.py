@@ -0,0 +1,126 @@
+"""
+Dry-run timeline for a scene: duration and frame count without rendering.
+
+Runs the scene's construct() against a stub renderer that records every
+play()/wait() — start time, run_time, section (s1_hook …), animation types
+and frame count, the same events manifest.py records during a real render —
+but never rasterises or encodes a frame.  Mobjects are still built and
+animations still advanced to their end state, so the timeline is exact,
+and it costs milliseconds of CPU instead of a full render + ffprobe.
+
+Run: python timeline.py derivative.py DerivativeScene
+     python timeline.py derivative.py DerivativeScene --fps 60 -o derivative.timeline.json
+     python timeline.py derivative.py DerivativeScene --summary
+"""
+import argparse
+import json
+import sys
+import time
+
+import scene_runner
+import text_cache
+from manifest import manifest_renderer_class, play_event, resolve_marks, summarize_sections, track_sections
+
+
+# ── Stub renderer ────────────────────────────────────────────────────────────
+def _timeline_renderer_class():
+    """ManifestRenderer that keeps time but draws nothing (manim import deferred)."""
+    ManifestRenderer = manifest_renderer_class()
+
+    class TimelineRenderer(ManifestRenderer):
+        def __init__(self):
+            super().__init__(skip_animations=True)
+
+        def play(self, scene, *args, **kwargs):
+            scene.compile_animation_data(*args, **kwargs)
+            self.events.append(play_event(self.num_plays, self.section, self.time, scene.duration,
+                                          scene, self.camera.frame_rate))
+            self.time += scene.duration
+            scene.begin_animations()
+            scene.play_internal(skip_rendering=True)
+            self.num_plays += 1
+
+        # Nothing is drawn or written
+        def update_frame(self, *args, **kwargs):
+            pass
+
+        def add_frame(self, *args, **kwargs):
+            pass
+
+        def freeze_current_frame(self, duration):
+            pass
+
+        def save_static_frame_data(self, scene, static_mobjects):
+            self.static_image = None
+
+        def scene_finished(self, scene):
+            pass
+
+    return TimelineRenderer
+
+
+# ── Timeline ─────────────────────────────────────────────────────────────────
+def timeline(scene_file, cls_name, fps=30):
+    """Dry-run *cls_name* and return its timeline dict."""
+    scene_runner.check_scene(scene_file, cls_name)  # broken generated code fails before manim loads
+    from manim import config, tempconfig
+
+    text_cache.install()
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    with tempconfig({
+        "input_file": scene_runner.scene_path(scene_file),
+        "dry_run": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }):
+        # Pixel size is irrelevant — nothing is drawn — so keep the camera small
+        config.quality = "low_quality"
+        config.frame_rate = fps
+        scene_cls = scene_runner.load_scene_class(scene_file, cls_name)
+        renderer = _timeline_renderer_class()()
+        scene = scene_cls(renderer=renderer)
+        track_sections(scene, renderer)
+        scene.render()
+    events = renderer.events
+    return {
+        "file": scene_file,
+        "cls": cls_name,
+        "fps": fps,
+        "duration": round(renderer.time, 3),
+        "frames": sum(e["frames"] for e in events),
+        "plays": sum(e["kind"] == "play" for e in events),
+        "waits": sum(e["kind"] == "wait" for e in events),
+        "wait_time": round(sum(e["run_time"] for e in events if e["kind"] == "wait"), 3),
+        "cpu_ms": round((time.process_time() - cpu0) * 1000, 1),
+        "wall_ms": round((time.perf_counter() - wall0) * 1000, 1),
+        "sections": summarize_sections(events),
+        "marks": resolve_marks(events, renderer.marks),
+        "events": events,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Dry-run a scene and print its timeline as JSON.")
+    ap.add_argument("file", help="scene file, relative to manim/scenes")
+    ap.add_argument("cls", help="Scene class name")
+    ap.add_argument("--fps", type=int, default=30)
+    ap.add_argument("-o", "--out", help="write JSON here instead of stdout")
+    ap.add_argument("--summary", action="store_true", help="one line per section instead of JSON")
+    args = ap.parse_args()
+
+    tl = timeline(args.file, args.cls, args.fps)
+    if args.summary:
+        for s in tl["sections"]:
+            print(f"  {s['name']:<14} {s['start']:7.1f}s  +{s['duration']:6.1f}s  {s['plays']:3d} plays")
+        print(f"→ {tl['duration']:.1f}s, {tl['frames']} frames  ({tl['cpu_ms']:.0f} ms CPU)")
+        return
+    text = json.dumps(tl, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
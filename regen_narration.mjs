@@ -22,74 +22,90 @@ const NARR_DIR  = path.join(MANIM_DIR, "output", "narrated");
 
 const groq = new Groq({ apiKey: process.env.GROQ_API_KEY });
 
-// Map: short name → { videoRelPath, topic }
+// Render resolutions to look for, newest pipeline first: generate.js and
+// manim/batch.py render -qm --fps 30; older renders were -ql (480p15).
+const RESOLUTIONS = (process.env.RESOLUTIONS || "720p30,480p15").split(",");
+
+// Map: short name → { video: "<module>/<Class>.mp4", topic }
 const SCENES = {
   eigen: {
-    video: "la_16_eigen/480p15/EigenScene.mp4",
+    video: "la_16_eigen/EigenScene.mp4",
     topic: "Eigenvalues and Eigenvectors",
   },
   derivative: {
-    video: "derivative/480p15/DerivativeScene.mp4",
+    video: "derivative/DerivativeScene.mp4",
     topic: "Derivatives",
   },
   gradient_descent: {
-    video: "ml_02_gradient_descent/480p15/GradientDescentScene.mp4",
+    video: "ml_02_gradient_descent/GradientDescentScene.mp4",
     topic: "Gradient Descent",
   },
   backpropagation: {
-    video: "ml_03_backpropagation/480p15/BackpropagationScene.mp4",
+    video: "ml_03_backpropagation/BackpropagationScene.mp4",
     topic: "Backpropagation",
   },
   neural_networks: {
-    video: "ml_01_neural_networks/480p15/NeuralNetworksScene.mp4",
+    video: "ml_01_neural_networks/NeuralNetworksScene.mp4",
     topic: "Neural Networks",
   },
   integral: {
-    video: "integral/480p15/IntegralScene.mp4",
+    video: "integral/IntegralScene.mp4",
     topic: "Integrals",
   },
   limit: {
-    video: "limit/480p15/LimitScene.mp4",
+    video: "limit/LimitScene.mp4",
     topic: "Limits",
   },
   chain_rule: {
-    video: "chain_rule/480p15/ChainRuleScene.mp4",
+    video: "chain_rule/ChainRuleScene.mp4",
     topic: "Chain Rule",
   },
   determinant: {
-    video: "la_11_determinant/480p15/DeterminantScene.mp4",
+    video: "la_11_determinant/DeterminantScene.mp4",
     topic: "Determinants",
   },
   linear_transform: {
-    video: "la_06_linear_transform/480p15/LinearTransformScene.mp4",
+    video: "la_06_linear_transform/LinearTransformScene.mp4",
     topic: "Linear Transformations",
   },
   vectors: {
-    video: "la_01_vectors/480p15/VectorsScene.mp4",
+    video: "la_01_vectors/VectorsScene.mp4",
     topic: "Vectors",
   },
   matrix_mult: {
-    video: "la_07_matrix_mult/480p15/MatrixMultScene.mp4",
+    video: "la_07_matrix_mult/MatrixMultScene.mp4",
     topic: "Matrix Multiplication",
   },
   quicksort: {
-    video: "algo_02_quicksort/480p15/QuicksortScene.mp4",
+    video: "algo_02_quicksort/QuicksortScene.mp4",
     topic: "Quicksort",
   },
   game_theory: {
-    video: "econ_05_game_theory/480p15/GameTheoryScene.mp4",
+    video: "econ_05_game_theory/GameTheoryScene.mp4",
     topic: "Game Theory",
   },
   induction: {
-    video: "phys_03_induction/480p15/InductionScene.mp4",
+    video: "phys_03_induction/InductionScene.mp4",
     topic: "Electromagnetic Induction",
   },
   maxwell: {
-    video: "phys_04_maxwell/480p15/MaxwellScene.mp4",
+    video: "phys_04_maxwell/MaxwellScene.mp4",
     topic: "Maxwell Equations",
   },
 };
 
+// First rendered copy of <module>/<Class>.mp4 among RESOLUTIONS
+async function findVideo(moduleDir, fileName) {
+  for (const res of RESOLUTIONS) {
+    const candidate = path.join(MANIM_DIR, "output", "videos", moduleDir, res, fileName);
+    try {
+      await access(candidate);
+      return candidate;
+    } catch { /* try the next resolution */ }
+  }
+  return null;
+}
+
 async function deleteExisting(baseName) {
   const narrPath = path.join(NARR_DIR, `${baseName}_narrated.mp4`);
   const audioPath = path.join(NARR_DIR, `${baseName}_audio.mp3`);
@@ -105,20 +121,17 @@ async function processScene(name) {
     return;
   }
 
-  const videoAbsPath = path.join(MANIM_DIR, "output", "videos", ...scene.video.split("/"));
-  const baseName     = path.basename(videoAbsPath, ".mp4");
-
-  // Verify video exists
-  try {
-    await access(videoAbsPath);
-  } catch {
-    console.error(`\n[SKIP] Video not found: ${videoAbsPath}`);
+  const [moduleDir, fileName] = scene.video.split("/");
+  const videoAbsPath = await findVideo(moduleDir, fileName);
+  if (!videoAbsPath) {
+    console.error(`\n[SKIP] Video not found: ${scene.video} (looked in ${RESOLUTIONS.join(", ")})`);
     return;
   }
+  const baseName     = path.basename(videoAbsPath, ".mp4");
 
   console.log(`\n${"=".repeat(60)}`);
   console.log(`Processing: ${scene.topic}`);
-  console.log(`  Video: ${scene.video}`);
+  console.log(`  Video: ${path.relative(path.join(MANIM_DIR, "output", "videos"), videoAbsPath)}`);
   console.log(`  Voice: Adam (auq43ws1oslv0tO4BDa7)`);
   console.log(`${"=".repeat(60)}`);
 